@@ -32,6 +32,19 @@ def redirect_if_authenticated(view):
     return user_check
 
 
+def ensure_session(view):
+
+    @wraps(view)
+    def session_check(request, *args, **kwargs):
+
+        if not request.session.session_key:
+            request.session.create()
+
+        return view(request, *args, **kwargs)
+
+    return session_check
+
+
 def preserve_help_text(func):
 
     @wraps(func)
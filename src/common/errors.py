@@ -4,3 +4,7 @@ from rest_framework.exceptions import APIException as OriginAPIException
 
 class APIException(OriginAPIException):
     status_code = status.HTTP_400_BAD_REQUEST
+
+
+class ConflictAPIException(APIException):
+    status_code = status.HTTP_409_CONFLICT
@@ -0,0 +1,66 @@
+import logging
+from smtplib import SMTPServerDisconnected
+
+from django.core.mail import get_connection
+
+from fs_cabinet.settings import DEFAULT_LOGGER_NAME
+
+logger = logging.getLogger(DEFAULT_LOGGER_NAME)
+
+
+class EmailDelivery:
+
+    def __init__(self, backend=None, **kwargs):
+        self.backend = backend
+        self.kwargs = kwargs
+        self.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        if self.connection is None:
+            self.connection = get_connection(self.backend, fail_silently=False, **self.kwargs)
+
+        self.connection.open()
+
+    def close(self):
+        if self.connection is not None:
+            try:
+                self.connection.close()
+
+            except (SMTPServerDisconnected, OSError):
+                pass
+
+            self.connection = None
+
+    def send_message(self, message):
+        try:
+            self.open()
+            return self.connection.send_messages([message])
+
+        except (SMTPServerDisconnected, ConnectionError) as e:
+            logger.warning(f'Email connection lost, reconnecting: {e}')
+            self.close()
+
+        self.open()
+        return self.connection.send_messages([message])
+
+    def send_messages(self, messages):
+        errors = []
+
+        for message in messages:
+            try:
+                self.send_message(message)
+
+            except Exception as e:
+                self.close()
+                errors.append(e)
+
+            else:
+                errors.append(None)
+
+        return errors
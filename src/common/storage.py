@@ -0,0 +1,65 @@
+import gzip
+
+import brotli
+import rcssmin
+import rjsmin
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+from common.utils import get_static_bundle_path
+
+MINIFIERS = {
+    '.js': rjsmin.jsmin,
+    '.css': rcssmin.cssmin,
+}
+BUNDLE_SEPARATORS = {
+    '.js': ';\n',
+    '.css': '\n',
+}
+COMPRESSIBLE_EXTENSIONS = ('.js', '.css', '.svg', '.ttf', '.ico', '.json', '.txt', '.map')
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            return
+
+        for bundle_path in self.build_bundles():
+            paths[bundle_path] = (self, bundle_path)
+
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+
+        for hashed_path in set(self.hashed_files.values()):
+            if hashed_path.endswith(COMPRESSIBLE_EXTENSIONS):
+                self.compress(hashed_path)
+
+    def build_bundles(self):
+        for extension, bundles in settings.STATIC_BUNDLES.items():
+            for name, source_paths in bundles.items():
+                sources = []
+
+                for source_path in source_paths:
+                    with self.open(source_path) as source:
+                        sources.append(MINIFIERS[extension](source.read().decode('utf-8')))
+
+                bundle_path = get_static_bundle_path(name, extension)
+                self.delete(bundle_path)
+                self._save(bundle_path, ContentFile(BUNDLE_SEPARATORS[extension].join(sources).encode('utf-8')))
+
+                yield bundle_path
+
+    def compress(self, path):
+        with self.open(path) as original:
+            content = original.read()
+
+        for compressed_extension, compressed_content in (
+                ('.gz', gzip.compress(content, compresslevel=9, mtime=0)),
+                ('.br', brotli.compress(content)),
+        ):
+            compressed_path = path + compressed_extension
+            self.delete(compressed_path)
+
+            if len(compressed_content) < len(content):
+                self._save(compressed_path, ContentFile(compressed_content))
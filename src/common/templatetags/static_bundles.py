@@ -0,0 +1,17 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html_join
+
+from common.utils import get_static_bundle_paths
+
+register = template.Library()
+
+
+@register.simple_tag
+def bundle_styles(name):
+    return format_html_join('\n', '<link rel="stylesheet" href="{}">', ((static(path),) for path in get_static_bundle_paths(name, '.css')))
+
+
+@register.simple_tag
+def bundle_scripts(name):
+    return format_html_join('\n', '<script src="{}" type="text/javascript"></script>', ((static(path),) for path in get_static_bundle_paths(name, '.js')))
@@ -0,0 +1,96 @@
+import socketserver
+import threading
+
+import pytest
+
+from common.mail import EmailDelivery
+from common.utils import build_email
+
+
+class SMTPRequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        self.server.connections_count += 1
+        self.reply('220 localhost')
+
+        while True:
+            line = self.rfile.readline().decode().strip()
+            command = line.split(' ', 1)[0].upper()
+
+            if not line or command == 'QUIT':
+                self.reply('221 Bye')
+                break
+
+            if command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                self.server.messages.append(self.read_data())
+                self.reply('250 OK')
+
+                if len(self.server.messages) in self.server.disconnect_after:
+                    break
+
+            else:
+                self.reply('250 OK')
+
+    def read_data(self):
+        lines = []
+
+        for line in iter(self.rfile.readline, b''):
+            if line == b'.\r\n':
+                break
+
+            lines.append(line)
+
+        return b''.join(lines).decode()
+
+    def reply(self, message):
+        self.wfile.write(f'{message}\r\n'.encode())
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self, disconnect_after=()):
+        super().__init__(('127.0.0.1', 0), SMTPRequestHandler)
+        self.connections_count = 0
+        self.messages = []
+        self.disconnect_after = disconnect_after
+
+
+@pytest.fixture
+def smtp_server(request):
+    server = LocalSMTPServer(**getattr(request, 'param', {}))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def get_delivery(smtp_server):
+    return EmailDelivery('django.core.mail.backends.smtp.EmailBackend', host='127.0.0.1', port=smtp_server.server_address[1],
+                         username='', password='', use_tls=False, timeout=5)
+
+
+def test_email_delivery_reuses_connection(smtp_server):
+    messages = [build_email(f'Subject {number}', ['admin@example.com'], 'Message', '<p>Message</p>') for number in range(5)]
+
+    with get_delivery(smtp_server) as delivery:
+        assert delivery.send_messages(messages[:3]) == [None] * 3
+        assert delivery.send_messages(messages[3:]) == [None] * 2
+
+    assert smtp_server.connections_count == 1
+    assert len(smtp_server.messages) == 5
+    assert 'Subject: Subject 4' in smtp_server.messages[4]
+
+
+@pytest.mark.parametrize('smtp_server', [{'disconnect_after': (2,)}], indirect=True)
+def test_email_delivery_reconnects_after_disconnect(smtp_server):
+    messages = [build_email(f'Subject {number}', ['admin@example.com'], 'Message') for number in range(4)]
+
+    with get_delivery(smtp_server) as delivery:
+        assert delivery.send_messages(messages) == [None] * 4
+
+    assert smtp_server.connections_count == 2
+    assert len(smtp_server.messages) == 4
@@ -0,0 +1,68 @@
+import datetime as dt
+import gzip
+import json
+
+import brotli
+import pytest
+from django.core.management import call_command
+from django.template import Context, Template
+from django.urls import reverse
+
+
+def test_collectstatic_builds_hashed_compressed_bundles(settings, tmp_path):
+    settings.STATIC_ROOT = tmp_path
+    settings.STATICFILES_STORAGE = 'common.storage.CompressedManifestStaticFilesStorage'
+
+    call_command('collectstatic', interactive=False, verbosity=0)
+
+    manifest = json.loads((tmp_path / 'staticfiles.json').read_text())
+    hashed_path = manifest['paths']['js/cart.bundle.js']
+    content = (tmp_path / hashed_path).read_bytes()
+
+    assert hashed_path != 'js/cart.bundle.js'
+    assert b'IMask' in content
+    assert len(content) < sum((tmp_path / path).stat().st_size for path in settings.STATIC_BUNDLES['.js']['cart'])
+    assert gzip.decompress((tmp_path / f'{hashed_path}.gz').read_bytes()) == content
+    assert brotli.decompress((tmp_path / f'{hashed_path}.br').read_bytes()) == content
+
+    css_content = (tmp_path / manifest['paths']['css/base.bundle.css']).read_text()
+    assert manifest['paths']['fonts/TurismoCF-100.ttf'] in css_content
+
+
+def test_bundle_tags(settings):
+    template = Template("{% load static_bundles %}{% bundle_scripts 'payment' %}{% bundle_styles 'main' %}")
+
+    settings.STATIC_BUNDLES_ENABLED = True
+    assert template.render(Context()) == (
+        '<script src="/static/js/payment.bundle.js" type="text/javascript"></script>'
+        '<link rel="stylesheet" href="/static/css/main.bundle.css">'
+    )
+
+    settings.STATIC_BUNDLES_ENABLED = False
+    assert template.render(Context()) == (
+        '<script src="/static/js/payment.js" type="text/javascript"></script>'
+        '<link rel="stylesheet" href="/static/css/style.css">'
+    )
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_main_page_static_paths_in_manifest(client, settings, tmp_path, create_menu_category, create_menu_item, mocker):
+    settings.STATIC_ROOT = tmp_path
+    settings.STATICFILES_STORAGE = 'common.storage.CompressedManifestStaticFilesStorage'
+    call_command('collectstatic', interactive=False, verbosity=0)
+
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    # a time restricted category renders the clock icon
+    category = create_menu_category(from_time=dt.time(hour=0), to_time=dt.time(hour=23, minute=59))
+    create_menu_item(category=category)
+
+    # every static path used by the template must have a manifest entry, otherwise rendering fails
+    response = client.get(reverse('menu:main'))
+
+    assert response.status_code == 200
+    assert 'img/clock.' in response.content.decode()
@@ -1,11 +1,13 @@
 import base64
 import binascii
 import datetime as dt
+import time
+from importlib import import_module
 
 import pytz
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
-from django.db.models import Count
+from django.db import connections, router, transaction
 from django.template import loader
 
 
@@ -23,15 +25,6 @@ def convert_utc_to_local(time):
     return time.astimezone(pytz.timezone(settings.LOCAL_TIME_ZONE))
 
 
-def get_exact_match(model_class, m2m_field, ids):
-    query = model_class.objects.annotate(count_objects=Count(m2m_field)).filter(count_objects=len(ids))
-
-    for _id in ids:
-        query = query.filter(**{m2m_field: _id})
-
-    return query
-
-
 def decode_base64_string(b64_string):
     try:
         return base64.b64decode(b64_string).decode('utf-8')
@@ -39,10 +32,106 @@ def decode_base64_string(b64_string):
         return None
 
 
-def send_email(subject, emails, message, html_message=None):
+def build_email(subject, emails, message, html_message=None):
     email_message = EmailMultiAlternatives(subject, message, settings.EMAIL_SENDER, emails)
 
     if html_message is not None:
         email_message.attach_alternative(html_message, 'text/html')
 
-    email_message.send()
+    return email_message
+
+
+def send_email(subject, emails, message, html_message=None):
+    build_email(subject, emails, message, html_message).send()
+
+
+def get_static_bundle_path(name, extension):
+    return f'{extension.lstrip(".")}/{name}.bundle{extension}'
+
+
+def get_static_bundle_paths(name, extension):
+    if settings.STATIC_BUNDLES_ENABLED:
+        return [get_static_bundle_path(name, extension)]
+
+    return settings.STATIC_BUNDLES[extension][name]
+
+
+def can_return_rows_from_update(connection):
+    if connection.vendor == 'postgresql':
+        return True
+
+    return connection.vendor == 'sqlite' and connection.Database.sqlite_version_info >= (3, 35)
+
+
+def update_returning(model, pk, increments, values, returning):
+    connection = connections[router.db_for_write(model)]
+    quote_name = connection.ops.quote_name
+    opts = model._meta
+
+    assignments = []
+    params = []
+
+    for field_name, value in increments.items():
+        column = quote_name(opts.get_field(field_name).column)
+        assignments.append(f'{column} = {column} + %s')
+        params.append(opts.get_field(field_name).get_db_prep_value(value, connection))
+
+    for field_name, value in values.items():
+        assignments.append(f'{quote_name(opts.get_field(field_name).column)} = %s')
+        params.append(opts.get_field(field_name).get_db_prep_value(value, connection))
+
+    returning_columns = ', '.join(quote_name(opts.get_field(field_name).column) for field_name in returning)
+    sql = f'UPDATE {quote_name(opts.db_table)} SET {", ".join(assignments)} WHERE {quote_name(opts.pk.column)} = %s RETURNING {returning_columns}'
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params + [pk])
+        row = cursor.fetchone()
+
+    if row is not None:
+        return {field_name: opts.get_field(field_name).to_python(value) for field_name, value in zip(returning, row)}
+
+
+def delete_in_batches(queryset, batch_size, pause=0):
+    deleted_count = 0
+
+    while True:
+        pks = list(queryset.values_list('pk', flat=True)[:batch_size])
+
+        if not pks:
+            break
+
+        with transaction.atomic(using=queryset.db):
+            deleted, _ = queryset.model._base_manager.using(queryset.db).filter(pk__in=pks).delete()
+
+        deleted_count += deleted
+
+        if len(pks) < batch_size:
+            break
+
+        time.sleep(pause)
+
+    return deleted_count
+
+
+def delete_expired_sessions(batch_size, pause=0):
+    session_store = import_module(settings.SESSION_ENGINE).SessionStore
+
+    if not hasattr(session_store, 'get_model_class'):
+        session_store.clear_expired()
+        return 0
+
+    expired_sessions = session_store.get_model_class().objects.filter(expire_date__lt=get_utc_now())
+    return delete_in_batches(expired_sessions, batch_size, pause)
+
+
+def get_database_free_bytes(connection):
+    if connection.vendor != 'sqlite':
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA freelist_count')
+        freelist_count = cursor.fetchone()[0]
+        cursor.execute('PRAGMA page_size')
+        page_size = cursor.fetchone()[0]
+
+    return freelist_count * page_size
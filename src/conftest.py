@@ -1,7 +1,9 @@
 import datetime as dt
+from decimal import Decimal
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.files.base import ContentFile
 
 from common.utils import get_local_now
@@ -13,6 +15,21 @@ from settings.models import Settings
 from settings.repository import get_site_settings
 
 
+@pytest.fixture(autouse=True)
+def use_local_memory_cache(settings):
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def use_plain_static_files_storage(settings):
+    settings.STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+
+
 @pytest.fixture(autouse=True)
 def create_site_settings(db):
     Settings.objects.get_or_create()
@@ -51,7 +68,7 @@ def create_menu_item_addition(db):
     def make_create_addition(title='Test', price=1, show=True):
         addition = Addition.objects.create(
             title=title,
-            price=price,
+            price=Decimal(price),
             show=show
         )
         return addition
@@ -66,7 +83,7 @@ def create_menu_item(db, create_menu_category, create_menu_item_addition):
         category = category or create_menu_category()
         menu_item = MenuItem.objects.create(
             title=title,
-            price=price,
+            price=Decimal(price),
             volume=volume,
             category=category,
             **kwargs
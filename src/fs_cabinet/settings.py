@@ -53,7 +53,6 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
-    'common.middlewares.AnonymousSessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -79,6 +78,9 @@ TEMPLATES = [
                 'settings.context_processors.site_settings',
                 'order.context_processors.constants',
             ],
+            'libraries': {
+                'static_bundles': 'common.templatetags.static_bundles',
+            },
         },
     },
 ]
@@ -98,6 +100,27 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', BASE_DIR / 'cache_root'),
+    }
+}
+
+MENU_CACHE_TIMEOUT = 60 * 60 * 24
+
+SESSION_ENGINE = os.getenv('SESSION_ENGINE', 'django.contrib.sessions.backends.db')
+
+CART_STORAGE = os.getenv('CART_STORAGE', 'order.repository.cart_storage.DatabaseCartStorage')
+
+ABANDONED_CART_MAX_AGE = int(os.getenv('ABANDONED_CART_MAX_AGE', 60 * 60 * 24 * 14))
+
+IDEMPOTENCY_KEY_TIMEOUT = int(os.getenv('IDEMPOTENCY_KEY_TIMEOUT', 60 * 60 * 24))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -147,6 +170,24 @@ STATICFILES_DIRS = [
     BASE_DIR / "static",
 ]
 
+STATICFILES_STORAGE = 'common.storage.CompressedManifestStaticFilesStorage'
+
+STATIC_BUNDLES_ENABLED = not DEBUG
+STATIC_BUNDLES = {
+    '.css': {
+        'base': ['css/glider.css', 'css/base.css', 'css/header.css'],
+        'main': ['css/style.css'],
+        'cart': ['css/checkout.css'],
+        'payment': ['css/payment.css'],
+    },
+    '.js': {
+        'main': ['js/scrollMenu.js', 'js/alert.js', 'js/idempotency.js', 'js/zoom.js', 'js/main.js'],
+        'slider': ['js/glider.js', 'js/slider.js'],
+        'cart': ['js/loading.js', 'js/alert.js', 'js/idempotency.js', 'js/cart.js', 'js/form.js', 'js/imask.js'],
+        'payment': ['js/payment.js'],
+    },
+}
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = 'media_root'
 
@@ -165,6 +206,10 @@ EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD')
 EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS') == 'True'
 
+ORDER_NOTIFICATION_MAX_ATTEMPTS = int(os.getenv('ORDER_NOTIFICATION_MAX_ATTEMPTS', 8))
+ORDER_NOTIFICATION_RETRY_DELAY = int(os.getenv('ORDER_NOTIFICATION_RETRY_DELAY', 30))
+ORDER_NOTIFICATION_CLAIM_LEASE = int(os.getenv('ORDER_NOTIFICATION_CLAIM_LEASE', 300))
+
 REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': 'common.exception_handler.exception_handler',
 }
@@ -8,3 +8,11 @@ class AdditionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Addition
         fields = ('id', 'title', 'price')
+
+
+class MenuItemsAdditionsListRequestSerializer(serializers.Serializer):
+    menu_item_ids = serializers.ListField(
+        allow_empty=True,
+        required=False,
+        child=serializers.IntegerField()
+    )
@@ -1,7 +1,8 @@
 from django.urls import path
 
-from menu.api.views import MenuItemPossibleAdditionsListAPIView
+from menu.api.views import MenuItemPossibleAdditionsListAPIView, MenuItemsAdditionsListAPIView
 
 urlpatterns = [
+    path('menu-items/additions/', MenuItemsAdditionsListAPIView.as_view(), name='menu_items_additions_list'),
     path('menu-items/<int:menu_item_id>/additions/', MenuItemPossibleAdditionsListAPIView.as_view(), name='menu_item_additions_list'),
 ]
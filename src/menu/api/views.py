@@ -4,11 +4,14 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from common.decorators import forbidden_for_authenticated
-from menu.api.serializers import AdditionSerializer
+from menu.api.serializers import AdditionSerializer, MenuItemsAdditionsListRequestSerializer
+from menu.decorators import menu_api_condition
 from menu.repository.menu_item import get_menu_item_by_id, get_menu_item_additions_to_show
+from menu.utils import get_request_menu_snapshot
 
 
 @method_decorator(forbidden_for_authenticated, name='get')
+@method_decorator(menu_api_condition, name='get')
 class MenuItemPossibleAdditionsListAPIView(APIView):
 
     def get(self, request, menu_item_id):
@@ -20,3 +23,21 @@ class MenuItemPossibleAdditionsListAPIView(APIView):
         additions = get_menu_item_additions_to_show(menu_item)
 
         return Response(AdditionSerializer(additions, many=True).data)
+
+
+@method_decorator(forbidden_for_authenticated, name='get')
+@method_decorator(menu_api_condition, name='get')
+class MenuItemsAdditionsListAPIView(APIView):
+
+    def get(self, request):
+        serializer = MenuItemsAdditionsListRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        menu_items_additions = get_request_menu_snapshot(request).menu_items_additions
+        menu_item_ids = serializer.validated_data.get('menu_item_ids') or menu_items_additions.keys()
+
+        return Response({
+            menu_item_id: AdditionSerializer(menu_items_additions[menu_item_id], many=True).data
+            for menu_item_id in menu_item_ids
+            if menu_item_id in menu_items_additions
+        })
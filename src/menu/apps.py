@@ -6,3 +6,7 @@ class MenuConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'menu'
     verbose_name = _('Menu')
+
+    def ready(self):
+        from menu.signals import connect_signals
+        connect_signals()
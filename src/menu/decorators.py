@@ -0,0 +1,18 @@
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from menu.utils import get_menu_page_etag, get_menu_page_last_modified, get_menu_api_etag, \
+    get_menu_api_last_modified
+from order.decorators import refresh_stale_cart_summary
+
+
+def menu_page_condition(view):
+    return cache_control(private=True, no_cache=True)(refresh_stale_cart_summary(
+        condition(etag_func=get_menu_page_etag, last_modified_func=get_menu_page_last_modified)(view)
+    ))
+
+
+def menu_api_condition(view):
+    return cache_control(private=True, no_cache=True)(
+        condition(etag_func=get_menu_api_etag, last_modified_func=get_menu_api_last_modified)(view)
+    )
@@ -0,0 +1,58 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.apps import apps
+from django.db import connections
+
+from fs_cabinet.settings import DEFAULT_LOGGER_NAME
+from menu.images import generate_image_variants
+from menu.repository.image import mark_images_as_processed
+from menu.repository.snapshot import invalidate_menu_snapshot
+
+logger = logging.getLogger(DEFAULT_LOGGER_NAME)
+
+
+def process_instance_images(model_label, instance_id):
+    instance = apps.get_model(model_label).objects.filter(id=instance_id).first()
+
+    if instance is not None:
+        generate_image_variants(instance)
+
+
+def process_images(images, processes=1):
+    processed_count = 0
+
+    for model, instance_id, updated_at, error in run_image_jobs(images, processes):
+        if error is not None:
+            logger.error(f'Unable to process images of {model._meta.label} {instance_id}, error: {error}')
+        elif mark_images_as_processed(model, instance_id, updated_at):
+            processed_count += 1
+
+    if processed_count:
+        invalidate_menu_snapshot()
+
+    return processed_count
+
+
+def run_image_jobs(images, processes):
+    if processes <= 1:
+        for model, instance_id, updated_at in images:
+            try:
+                process_instance_images(model._meta.label, instance_id)
+            except Exception as e:
+                yield model, instance_id, updated_at, e
+            else:
+                yield model, instance_id, updated_at, None
+        return
+
+    connections.close_all()
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=django.setup) as executor:
+        futures = {
+            executor.submit(process_instance_images, model._meta.label, instance_id): (model, instance_id, updated_at)
+            for model, instance_id, updated_at in images
+        }
+
+        for future in as_completed(futures):
+            yield (*futures[future], future.exception())
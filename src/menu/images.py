@@ -0,0 +1,99 @@
+from collections import namedtuple
+
+from PIL import Image
+from imagekit.models import ImageSpecField
+from pilkit.processors import ResizeToFill, ResizeToFit, Anchor
+
+try:
+    import pillow_avif  # noqa: F401 registers the AVIF plugin on Pillow builds without native support
+except ImportError:
+    pillow_avif = None
+
+IMAGE_VARIANT_FORMATS = (
+    ('AVIF', 'image/avif', {'quality': 60}),
+    ('WEBP', 'image/webp', {'quality': 80, 'method': 6}),
+)
+IMAGE_FALLBACK_FORMAT = ('PNG', 'image/png', {'optimize': True})
+
+ImageVariant = namedtuple('ImageVariant', ('attname', 'width'))
+ImageVariantSet = namedtuple('ImageVariantSet', ('mime_type', 'variants'))
+
+
+class BackgroundProcessingStrategy:
+
+    def should_verify_existence(self, file):
+        return False
+
+
+def is_image_format_supported(image_format):
+    Image.init()
+    return image_format in Image.SAVE
+
+
+def get_image_variant_formats():
+    return tuple(
+        (image_format, mime_type, options)
+        for image_format, mime_type, options in IMAGE_VARIANT_FORMATS
+        if is_image_format_supported(image_format)
+    ) + (IMAGE_FALLBACK_FORMAT,)
+
+
+def image_variants(field_name, size, widths):
+    fill_width, fill_height = size
+
+    def decorator(model):
+        variant_sets = []
+
+        for image_format, mime_type, options in get_image_variant_formats():
+            variants = []
+
+            for width in widths:
+                attname = f'{field_name}_{image_format.lower()}_{width}'
+                spec_field = ImageSpecField(source=field_name,
+                                            processors=[
+                                                ResizeToFill(width=fill_width, height=fill_height, upscale=True, anchor=Anchor.CENTER),
+                                                ResizeToFit(width=width, upscale=False),
+                                            ],
+                                            format=image_format,
+                                            options=options,
+                                            cachefile_strategy=BackgroundProcessingStrategy)
+                spec_field.contribute_to_class(model, attname)
+                variants.append(ImageVariant(attname=attname, width=width))
+
+            variant_sets.append(ImageVariantSet(mime_type=mime_type, variants=tuple(variants)))
+
+        model.image_variants = {**getattr(model, 'image_variants', {}), field_name: tuple(variant_sets)}
+        return model
+
+    return decorator
+
+
+def get_image_variant_attnames(instance):
+    return [
+        variant.attname
+        for field_name, variant_sets in instance.image_variants.items() if getattr(instance, field_name)
+        for variant_set in variant_sets
+        for variant in variant_set.variants
+    ]
+
+
+def generate_image_variants(instance):
+    for attname in get_image_variant_attnames(instance):
+        image_variant = getattr(instance, attname)
+        image_variant.storage.delete(image_variant.name)
+        image_variant.generate(force=True)
+
+
+def get_image_sources(image):
+    instance = image.instance
+
+    if not getattr(instance, 'images_processed', False):
+        return [], image.url
+
+    variant_sets = instance.image_variants[image.field.name]
+    sources = [
+        (variant_set.mime_type, ', '.join(f'{getattr(instance, variant.attname).url} {variant.width}w' for variant in variant_set.variants))
+        for variant_set in variant_sets
+    ]
+
+    return sources, getattr(instance, variant_sets[-1].variants[-1].attname).url
@@ -0,0 +1,29 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from menu.image_processing import process_images
+from menu.repository.image import get_unprocessed_images
+
+
+class Command(BaseCommand):
+    help = 'Generates image variants for uploads that have not been processed yet'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=os.cpu_count(), help='Number of worker processes')
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new uploads')
+        parser.add_argument('--interval', type=float, default=5, help='Seconds between polls in loop mode')
+
+    def handle(self, *args, **options):
+        while True:
+            images = get_unprocessed_images()
+
+            if images:
+                processed_count = process_images(images, options['processes'])
+                self.stdout.write(f'Processed images of {processed_count} of {len(images)} objects')
+
+            if not options['loop']:
+                break
+
+            time.sleep(options['interval'])
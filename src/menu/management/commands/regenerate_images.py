@@ -0,0 +1,18 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from menu.image_processing import process_images
+from menu.repository.image import get_all_images
+
+
+class Command(BaseCommand):
+    help = 'Regenerates image variants for the whole catalogue'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=os.cpu_count(), help='Number of worker processes')
+
+    def handle(self, *args, **options):
+        images = get_all_images()
+        processed_count = process_images(images, options['processes'])
+        self.stdout.write(f'Regenerated images of {processed_count} of {len(images)} objects')
@@ -0,0 +1,48 @@
+# Generated by Django 3.2.6 on 2026-10-18 10:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0010_auto_20211022_1508'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='action',
+            name='images_processed',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Images processed'),
+        ),
+        migrations.AddField(
+            model_name='menucategory',
+            name='images_processed',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Images processed'),
+        ),
+        migrations.AddField(
+            model_name='menuitem',
+            name='images_processed',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Images processed'),
+        ),
+        migrations.AlterField(
+            model_name='action',
+            name='image',
+            field=models.ImageField(upload_to='action_images', verbose_name='Image'),
+        ),
+        migrations.AlterField(
+            model_name='menucategory',
+            name='icon',
+            field=models.ImageField(upload_to='menu_category_icons', verbose_name='Icon'),
+        ),
+        migrations.AlterField(
+            model_name='menuitem',
+            name='hq_image',
+            field=models.ImageField(null=True, upload_to='hq_menu_images', verbose_name='High quality image'),
+        ),
+        migrations.AlterField(
+            model_name='menuitem',
+            name='image',
+            field=models.ImageField(upload_to='menu_images', verbose_name='Image'),
+        ),
+    ]
@@ -3,18 +3,15 @@ from decimal import Decimal
 from django.core.validators import MinValueValidator, DecimalValidator
 from django.db import models
 from django.utils.translation import gettext_lazy as _, pgettext_lazy, gettext
-from imagekit.models import ProcessedImageField
-from pilkit.processors import ResizeToFill, Anchor
 
 from common.utils import get_local_now
+from menu.images import image_variants
 
 
+@image_variants('icon', size=(40, 40), widths=(40,))
 class MenuCategory(models.Model):
-    icon = ProcessedImageField(verbose_name=_('Icon'),
-                               upload_to='menu_category_icons',
-                               processors=[ResizeToFill(width=40, height=40, upscale=True, anchor=Anchor.CENTER)],
-                               format='PNG',
-                               options={'quality': 100})
+    icon = models.ImageField(verbose_name=_('Icon'), upload_to='menu_category_icons')
+    images_processed = models.BooleanField(verbose_name=_('Images processed'), default=False, editable=False)
     name = models.CharField(verbose_name=pgettext_lazy('Name', 'Category name'), max_length=100, help_text=_('Shows in miniatures'))
     title = models.CharField(verbose_name=_('Title'), max_length=100, help_text=_('Shows in sections on the page'))
 
@@ -45,21 +42,23 @@ class MenuCategory(models.Model):
             self.to_time
         ])
 
-    def can_order_now(self):
+    def can_order_at(self, time):
         can_order = True
 
-        if self.has_time_restriction():
-            now_time = get_local_now().time()
-            can_order = True
-
-            if self.from_time:
-                can_order = can_order and (self.from_time < now_time)
+        if self.from_time:
+            can_order = can_order and (self.from_time < time)
 
-            if self.to_time:
-                can_order = can_order and (now_time < self.to_time)
+        if self.to_time:
+            can_order = can_order and (time < self.to_time)
 
         return can_order
 
+    def can_order_now(self):
+        if not self.has_time_restriction():
+            return True
+
+        return self.can_order_at(get_local_now().time())
+
 
 class Addition(models.Model):
     title = models.CharField(verbose_name=_('Title'), max_length=100)
@@ -77,18 +76,12 @@ class Addition(models.Model):
         return gettext('Addition "%(title)s"') % {'title': self.title}
 
 
+@image_variants('image', size=(252, 252), widths=(126, 252))
+@image_variants('hq_image', size=(1000, 1000), widths=(500, 1000))
 class MenuItem(models.Model):
-    image = ProcessedImageField(verbose_name=_('Image'),
-                                upload_to='menu_images',
-                                processors=[ResizeToFill(width=252, height=252, upscale=True, anchor=Anchor.CENTER)],
-                                format='PNG',
-                                options={'quality': 100})
-    hq_image = ProcessedImageField(verbose_name=_('High quality image'),
-                                   upload_to='hq_menu_images',
-                                   processors=[ResizeToFill(width=1000, height=1000, upscale=True, anchor=Anchor.CENTER)],
-                                   format='PNG',
-                                   options={'quality': 100},
-                                   null=True)
+    image = models.ImageField(verbose_name=_('Image'), upload_to='menu_images')
+    hq_image = models.ImageField(verbose_name=_('High quality image'), upload_to='hq_menu_images', null=True)
+    images_processed = models.BooleanField(verbose_name=_('Images processed'), default=False, editable=False)
     title = models.CharField(verbose_name=_('Title'), max_length=100)
     price = models.DecimalField(verbose_name=_('Price'), max_digits=6, decimal_places=0, validators=[MinValueValidator(Decimal('0.00')), DecimalValidator(max_digits=6, decimal_places=0)])
     category = models.ForeignKey(MenuCategory, verbose_name=_('Category'), related_name='menu_items', null=True, blank=True, on_delete=models.SET_NULL)
@@ -116,13 +109,11 @@ class MenuItem(models.Model):
         return gettext('Menu item "%(menu_item_title)s"') % {'menu_item_title': self.title}
 
 
+@image_variants('image', size=(530, 340), widths=(265, 530))
 class Action(models.Model):
     name = models.CharField(verbose_name=_('Name'), max_length=100, default='')
-    image = ProcessedImageField(verbose_name=_('Image'),
-                                upload_to='action_images',
-                                processors=[ResizeToFill(width=530, height=340, upscale=True, anchor=Anchor.CENTER)],
-                                format='PNG',
-                                options={'quality': 100})
+    image = models.ImageField(verbose_name=_('Image'), upload_to='action_images')
+    images_processed = models.BooleanField(verbose_name=_('Images processed'), default=False, editable=False)
     show = models.BooleanField(verbose_name=_('Show'), default=True)
 
     order_index = models.PositiveSmallIntegerField(verbose_name=_('Order index'), null=True, blank=True)
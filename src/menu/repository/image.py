@@ -0,0 +1,28 @@
+from menu.models import MenuCategory, MenuItem, Action
+
+MODELS_WITH_IMAGES = (MenuCategory, MenuItem, Action)
+
+
+def get_images_to_process(queryset_filter=None):
+    return [
+        (model, instance_id, updated_at)
+        for model in MODELS_WITH_IMAGES
+        for instance_id, updated_at in model.objects.filter(**(queryset_filter or {})).values_list('id', 'updated_at')
+    ]
+
+
+def get_unprocessed_images():
+    return get_images_to_process({'images_processed': False})
+
+
+def get_all_images():
+    return get_images_to_process()
+
+
+def mark_images_as_unprocessed(instance):
+    type(instance).objects.filter(id=instance.id).update(images_processed=False)
+    instance.images_processed = False
+
+
+def mark_images_as_processed(model, instance_id, updated_at):
+    return model.objects.filter(id=instance_id, updated_at=updated_at).update(images_processed=True)
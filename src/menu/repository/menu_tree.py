@@ -0,0 +1,23 @@
+from collections import namedtuple
+
+from django.db.models import Prefetch
+
+from menu.models import MenuItem, Addition
+from menu.repository.menu_item import get_additions_to_show, get_menu_categories_to_show
+
+MenuTree = namedtuple('MenuTree', ('categories', 'additions'))
+
+
+def get_menu_tree():
+    menu_items_to_show = MenuItem.objects.filter(show=True).prefetch_related(
+        Prefetch('possible_additions', queryset=Addition.objects.filter(show=True), to_attr='additions_to_show')
+    )
+    categories = get_menu_categories_to_show().prefetch_related(
+        Prefetch('menu_items', queryset=menu_items_to_show, to_attr='menu_items_to_show')
+    )
+
+    return MenuTree(
+        categories=tuple(categories),
+        additions=tuple(get_additions_to_show()),
+    )
+
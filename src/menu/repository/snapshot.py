@@ -0,0 +1,73 @@
+from collections import namedtuple
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+
+from menu.models import MenuItem, MenuCategory, Addition, Action
+from menu.repository.action import get_actual_actions
+from menu.repository.menu_tree import get_menu_tree
+from menu.schedule import MenuSchedule
+
+MENU_VERSION_CACHE_KEY = 'menu:version'
+MENU_SNAPSHOT_CACHE_KEY = 'menu:snapshot:%(version)s'
+
+MenuSnapshot = namedtuple('MenuSnapshot', ('version', 'updated_at', 'menu_tree', 'schedule', 'menu_items_additions', 'actions'))
+
+
+def get_menu_version():
+    version = cache.get(MENU_VERSION_CACHE_KEY)
+
+    if version is None:
+        cache.add(MENU_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        version = cache.get(MENU_VERSION_CACHE_KEY)
+
+    return version
+
+
+def invalidate_menu_snapshot():
+    cache.set(MENU_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+
+def get_menu_updated_at():
+    updated_at_values = [
+        model.objects.aggregate(updated_at=Max('updated_at'))['updated_at']
+        for model in (MenuItem, MenuCategory, Addition, Action)
+    ]
+
+    return max(filter(None, updated_at_values), default=None)
+
+
+def get_menu_items_additions(menu_tree):
+    return {
+        menu_item.id: tuple(menu_item.additions_to_show)
+        for category in menu_tree.categories
+        for menu_item in category.menu_items_to_show
+    }
+
+
+def build_menu_snapshot(version):
+    menu_tree = get_menu_tree()
+
+    return MenuSnapshot(
+        version=version,
+        updated_at=get_menu_updated_at(),
+        menu_tree=menu_tree,
+        schedule=MenuSchedule(menu_tree.categories),
+        menu_items_additions=get_menu_items_additions(menu_tree),
+        actions=tuple(get_actual_actions()),
+    )
+
+
+def get_menu_snapshot():
+    version = get_menu_version()
+    cache_key = MENU_SNAPSHOT_CACHE_KEY % {'version': version}
+
+    snapshot = cache.get(cache_key)
+
+    if snapshot is None:
+        snapshot = build_menu_snapshot(version)
+        cache.set(cache_key, snapshot, timeout=settings.MENU_CACHE_TIMEOUT)
+
+    return snapshot
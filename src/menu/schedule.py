@@ -0,0 +1,52 @@
+import bisect
+import datetime as dt
+import math
+
+
+class MenuSchedule:
+
+    def __init__(self, categories):
+        self.restricted_categories = tuple(category for category in categories if category.has_time_restriction())
+        self.transitions = sorted({
+            time
+            for category in self.restricted_categories
+            for time in (category.from_time, category.to_time)
+            if time
+        })
+
+    def get_orderable_category_ids(self, now):
+        now_time = now.time()
+        return tuple(category.id for category in self.restricted_categories if category.can_order_at(now_time))
+
+    def get_next_transition(self, now):
+        if not self.transitions:
+            return None
+
+        index = bisect.bisect_right(self.transitions, now.time())
+
+        if index < len(self.transitions):
+            return self._combine(now, self.transitions[index], days=0)
+
+        return self._combine(now, self.transitions[0], days=1)
+
+    def get_previous_transition(self, now):
+        if not self.transitions:
+            return None
+
+        index = bisect.bisect_right(self.transitions, now.time())
+
+        if index > 0:
+            return self._combine(now, self.transitions[index - 1], days=0)
+
+        return self._combine(now, self.transitions[-1], days=-1)
+
+    def get_seconds_to_next_transition(self, now):
+        next_transition = self.get_next_transition(now)
+
+        if next_transition is not None:
+            return max(math.ceil((next_transition - now).total_seconds()), 1)
+
+    @staticmethod
+    def _combine(now, time, days):
+        wall_clock = dt.datetime.combine(now.date() + dt.timedelta(days=days), time)
+        return now + (wall_clock - now.replace(tzinfo=None))
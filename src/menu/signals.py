@@ -0,0 +1,28 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from imagekit.signals import source_saved
+
+from menu.models import MenuItem, MenuCategory, Addition, Action
+from menu.repository.image import mark_images_as_unprocessed
+from menu.repository.snapshot import invalidate_menu_snapshot
+
+
+def menu_changed(sender, **kwargs):
+    invalidate_menu_snapshot()
+
+
+def image_source_changed(sender, source, **kwargs):
+    instance = source.instance
+
+    if instance.images_processed:
+        mark_images_as_unprocessed(instance)
+        invalidate_menu_snapshot()
+
+
+def connect_signals():
+    for model in (MenuItem, MenuCategory, Addition, Action):
+        post_save.connect(menu_changed, sender=model, dispatch_uid=f'menu_changed_on_{model.__name__}_save')
+        post_delete.connect(menu_changed, sender=model, dispatch_uid=f'menu_changed_on_{model.__name__}_delete')
+
+    m2m_changed.connect(menu_changed, sender=MenuItem.possible_additions.through, dispatch_uid='menu_changed_on_possible_additions_change')
+
+    source_saved.connect(image_source_changed, dispatch_uid='image_source_changed')
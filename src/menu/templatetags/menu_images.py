@@ -0,0 +1,19 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html, format_html_join
+
+from menu.images import get_image_sources
+
+register = template.Library()
+
+
+@register.simple_tag
+def picture(image, sizes, **attrs):
+    sources, src = get_image_sources(image)
+    sources = format_html_join(
+        '',
+        '<source type="{}" srcset="{}" sizes="{}">',
+        ((mime_type, srcset, sizes) for mime_type, srcset in sources)
+    )
+
+    return format_html('<picture>{}<img src="{}"{}/></picture>', sources, src, flatatt(attrs))
@@ -0,0 +1,83 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.django_db(reset_sequences=True)
+@pytest.mark.parametrize('url_name', ['menu:main', 'menu:additions_list'])
+def test_menu_page_not_modified(url_name, client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    create_menu_item()
+    client.get(reverse(url_name))   # creates session and csrf cookie
+
+    response = client.get(reverse(url_name))
+    assert response.status_code == 200
+    assert response.has_header('ETag')
+    assert response.has_header('Last-Modified')
+
+    response = client.get(reverse(url_name), HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_main_view_modified_after_menu_change(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    menu_item = create_menu_item()
+    client.get(reverse('menu:main'))
+
+    etag = client.get(reverse('menu:main'))['ETag']
+    menu_item.delete()
+
+    response = client.get(reverse('menu:main'), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_main_view_modified_after_cart_change(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    menu_item = create_menu_item()
+    client.get(reverse('menu:main'))
+
+    etag = client.get(reverse('menu:main'))['ETag']
+
+    request_data = {'menu_item_id': menu_item.id, 'count': 1, 'addition_ids': []}
+    response = client.post(reverse('order_api:add_to_cart'), request_data, content_type='application/json')
+    assert response.status_code == 200
+
+    response = client.get(reverse('menu:main'), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_item_additions_list_not_modified(client, create_menu_item, create_menu_item_addition, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    menu_item = create_menu_item(additions_count=2)
+    url = reverse('menu_api:menu_item_additions_list', kwargs={'menu_item_id': menu_item.id})
+
+    response = client.get(url)
+    assert response.status_code == 200
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 304
+
+    menu_item.possible_additions.add(create_menu_item_addition())
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 200
+    assert len(response.data) == 3
@@ -1,13 +1,16 @@
 from decimal import Decimal
 
 import pytest
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.sessions.middleware import SessionMiddleware
+from django.contrib.sessions.models import Session
 from django.urls import reverse
 
 from menu.models import Addition
 from menu.views import MainView
 from order.repository.cart import add_menu_item_to_cart
+from order.repository.cart_storage import get_cart_storage
 from order.repository.order import mark_order_transaction_as_paid
 
 
@@ -18,6 +21,15 @@ def test_main_view_status_code(client):
     assert response.status_code == 200
 
 
+@pytest.mark.django_db(reset_sequences=True)
+def test_main_view_does_not_create_session(client):
+    response = client.get(reverse('menu:main'))
+
+    assert response.status_code == 200
+    assert settings.SESSION_COOKIE_NAME not in response.cookies
+    assert Session.objects.count() == 0
+
+
 @pytest.mark.django_db(reset_sequences=True)
 def test_main_view_status_code_for_authenticated_users(client, admin_user):
     client.force_login(admin_user)
@@ -102,11 +114,14 @@ def test_main_view_menu_categories(rf, create_menu_category, create_menu_item, m
 
 
 @pytest.mark.django_db(reset_sequences=True)
-def test_main_view_menu_categories_ordering(rf, create_menu_item, mocker):
+def test_main_view_menu_categories_ordering(rf, create_menu_category, create_menu_item, mocker):
     mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
     mocked_storage.return_value = 'test'
 
-    create_menu_item()
+    category1 = create_menu_category(order_index=2)
+    category2 = create_menu_category(order_index=1)
+    create_menu_item(category=category1)
+    create_menu_item(category=category2)
 
     request = rf.get(reverse('menu:main'))
     request.user = AnonymousUser()
@@ -120,7 +135,7 @@ def test_main_view_menu_categories_ordering(rf, create_menu_item, mocker):
 
     context = view.get_context_data(object_list=view.get_queryset())
 
-    assert context.get(view.context_object_name).query.order_by == ('order_index',)
+    assert [category.id for category in context.get(view.context_object_name)] == [category2.id, category1.id]
 
 
 @pytest.mark.django_db(reset_sequences=True)
@@ -212,7 +227,7 @@ def test_main_view_actions_for_authenticated_users(rf, create_user):
 
 
 @pytest.mark.django_db(reset_sequences=True)
-def test_main_view_menu_items_in_cart(rf, create_menu_item, create_cart, mocker):
+def test_main_view_menu_items_in_cart(rf, create_menu_item, django_assert_num_queries, mocker):
     mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
     mocked_storage.return_value = 'test'
 
@@ -226,20 +241,21 @@ def test_main_view_menu_items_in_cart(rf, create_menu_item, create_cart, mocker)
     menu_item1 = create_menu_item(price=10)
     menu_item2 = create_menu_item(price=20)
 
-    cart = create_cart(request.session.session_key)
-
-    cart_item1 = add_menu_item_to_cart(cart, menu_item1, Addition.objects.none(), 1)
-    cart_item1.count = 2
-    cart_item1.save()
+    cart_storage = get_cart_storage(request.session)
+    cart = cart_storage.get_or_create_cart()
 
-    add_menu_item_to_cart(cart, menu_item2, Addition.objects.none(), 1)
+    cart_item1 = cart_storage.add_menu_item_to_cart(cart, menu_item1, Addition.objects.none(), 2)
+    cart_item1.refresh_from_db()
 
-    cart.save()
+    cart_storage.add_menu_item_to_cart(cart, menu_item2, Addition.objects.none(), 1)
 
     view = MainView()
     view.setup(request)
 
-    context = view.get_context_data(object_list=view.get_queryset())
+    view.get_menu_snapshot()    # warms up menu snapshot
+
+    with django_assert_num_queries(0):
+        context = view.get_context_data(object_list=view.get_queryset())
 
     assert context.get('menu_items_in_cart') == {menu_item1.id, menu_item2.id}
     assert context.get('total_amount') == Decimal((cart_item1.menu_item.price * cart_item1.count) + menu_item2.price)
@@ -0,0 +1,88 @@
+import datetime as dt
+import json
+
+import pytest
+from django.urls import reverse
+
+from common.utils import get_local_now
+from menu.models import MenuItem
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_main_view_menu_fragments_reused_until_menu_changed(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    menu_item = create_menu_item(title='Old title')
+
+    response = client.get(reverse('menu:main'))
+    assert 'Old title' in response.content.decode()
+
+    MenuItem.objects.filter(id=menu_item.id).update(title='New title')     # bypasses menu invalidation
+
+    response = client.get(reverse('menu:main'))
+    assert 'Old title' in response.content.decode()
+
+    menu_item.refresh_from_db()
+    menu_item.save()
+
+    response = client.get(reverse('menu:main'))
+    assert 'New title' in response.content.decode()
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_main_view_cart_overlay_rendered_per_session(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    menu_item1 = create_menu_item()
+    create_menu_item()
+
+    client.get(reverse('menu:main'))    # warms up menu fragments
+
+    request_data = {
+        'menu_item_id': menu_item1.id,
+        'count': 1,
+        'addition_ids': [],
+    }
+    client.post(reverse('order_api:add_to_cart'), request_data, content_type='application/json')
+
+    response = client.get(reverse('menu:main'))
+    content = response.content.decode()
+
+    # markers are added by main.js from the icon template, not rendered inside the cached cards
+    assert content.count('class="item-in-cart-icon"') == 1
+    assert '<template id="item-in-cart-icon"><img class="item-in-cart-icon" src="/static/img/bag1.png"></template>' in content
+
+    overlay = content.split('<script id="menu-items-in-cart" type="application/json">')[1].split('</script>')[0]
+    assert json.loads(overlay) == [menu_item1.id]
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_main_view_menu_fragments_vary_on_time_window(client, create_menu_category, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    now = get_local_now().replace(hour=12, minute=0)
+    category = create_menu_category(from_time=dt.time(hour=10), to_time=dt.time(hour=14))
+    create_menu_item(category=category)
+
+    mocked_model_now = mocker.patch('menu.models.get_local_now')
+    mocked_view_now = mocker.patch('menu.views.get_local_now')
+
+    mocked_model_now.return_value = mocked_view_now.return_value = now
+    response = client.get(reverse('menu:main'))
+    assert 'add-to-card-button' in response.content.decode()
+
+    mocked_model_now.return_value = mocked_view_now.return_value = now + dt.timedelta(hours=3)
+    response = client.get(reverse('menu:main'))
+    assert 'add-to-card-button' not in response.content.decode()
@@ -0,0 +1,74 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_items_additions_list(client, create_menu_item, create_menu_item_addition, django_assert_max_num_queries, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    hidden_addition = create_menu_item_addition(show=False)
+    menu_item1 = create_menu_item(additions_count=2, additions=[hidden_addition])
+    menu_item2 = create_menu_item(additions_count=3)
+    menu_item3 = create_menu_item()
+
+    response = client.get(reverse('menu_api:menu_items_additions_list'))
+
+    assert response.status_code == 200
+    assert response.json() == {
+        str(menu_item.id): [
+            {'id': addition.id, 'title': addition.title, 'price': str(addition.price)}
+            for addition in menu_item.possible_additions.filter(show=True)
+        ]
+        for menu_item in (menu_item1, menu_item2, menu_item3)
+    }
+
+    with django_assert_max_num_queries(2):     # session only, additions are served from the menu snapshot
+        client.get(reverse('menu_api:menu_items_additions_list'))
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_items_additions_list_filtered_by_menu_item_ids(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    menu_item1 = create_menu_item(additions_count=2)
+    create_menu_item(additions_count=3)
+    hidden_menu_item = create_menu_item(additions_count=1, show=False)
+
+    response = client.get(reverse('menu_api:menu_items_additions_list'), {'menu_item_ids': [menu_item1.id, hidden_menu_item.id, 666]})
+
+    assert response.status_code == 200
+    assert list(response.json().keys()) == [str(menu_item1.id)]
+    assert len(response.json()[str(menu_item1.id)]) == 2
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_items_additions_list_with_invalid_menu_item_ids(client):
+    response = client.get(reverse('menu_api:menu_items_additions_list'), {'menu_item_ids': 'invalid'})
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_items_additions_list_not_modified(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    menu_item = create_menu_item(additions_count=2)
+
+    response = client.get(reverse('menu_api:menu_items_additions_list'))
+    response = client.get(reverse('menu_api:menu_items_additions_list'), HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 304
+
+    menu_item.possible_additions.clear()
+
+    response = client.get(reverse('menu_api:menu_items_additions_list'), HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 200
+    assert response.json() == {str(menu_item.id): []}
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_items_additions_list_for_authenticated_users(client, admin_user):
+    client.force_login(admin_user)
+    response = client.get(reverse('menu_api:menu_items_additions_list'))
+    assert response.status_code == 403
@@ -0,0 +1,66 @@
+import datetime as dt
+
+import pytest
+import pytz
+
+from menu.schedule import MenuSchedule
+from menu.utils import get_menu_cache_timeout
+
+
+@pytest.fixture
+def local_datetime():
+
+    def make_local_datetime(hour, minute=0, day=1):
+        return pytz.timezone('Europe/Kiev').localize(dt.datetime(year=2021, month=11, day=day, hour=hour, minute=minute))
+
+    return make_local_datetime
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_schedule_orderable_categories(create_menu_category, local_datetime):
+    breakfast = create_menu_category(from_time=dt.time(hour=8), to_time=dt.time(hour=12))
+    lunch = create_menu_category(from_time=dt.time(hour=12), to_time=dt.time(hour=16))
+    dinner = create_menu_category(from_time=dt.time(hour=18))
+    create_menu_category()
+
+    schedule = MenuSchedule([breakfast, lunch, dinner])
+
+    assert schedule.get_orderable_category_ids(local_datetime(hour=7)) == ()
+    assert schedule.get_orderable_category_ids(local_datetime(hour=9)) == (breakfast.id,)
+    assert schedule.get_orderable_category_ids(local_datetime(hour=12)) == ()
+    assert schedule.get_orderable_category_ids(local_datetime(hour=13)) == (lunch.id,)
+    assert schedule.get_orderable_category_ids(local_datetime(hour=19)) == (dinner.id,)
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_schedule_transitions(create_menu_category, local_datetime):
+    breakfast = create_menu_category(from_time=dt.time(hour=8), to_time=dt.time(hour=12))
+    dinner = create_menu_category(from_time=dt.time(hour=18))
+
+    schedule = MenuSchedule([breakfast, dinner])
+
+    assert schedule.get_next_transition(local_datetime(hour=7)) == local_datetime(hour=8)
+    assert schedule.get_next_transition(local_datetime(hour=12)) == local_datetime(hour=18)
+    assert schedule.get_next_transition(local_datetime(hour=20)) == local_datetime(hour=8, day=2)
+
+    assert schedule.get_previous_transition(local_datetime(hour=7, day=2)) == local_datetime(hour=18)
+    assert schedule.get_previous_transition(local_datetime(hour=13)) == local_datetime(hour=12)
+
+    assert schedule.get_seconds_to_next_transition(local_datetime(hour=11, minute=30)) == 30 * 60
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_schedule_without_time_restrictions(create_menu_category, local_datetime):
+    schedule = MenuSchedule([create_menu_category(), create_menu_category()])
+
+    assert schedule.get_orderable_category_ids(local_datetime(hour=12)) == ()
+    assert schedule.get_next_transition(local_datetime(hour=12)) is None
+    assert schedule.get_seconds_to_next_transition(local_datetime(hour=12)) is None
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_cache_timeout_expires_at_next_transition(create_menu_category, local_datetime, settings):
+    schedule = MenuSchedule([create_menu_category(to_time=dt.time(hour=12))])
+
+    assert get_menu_cache_timeout(schedule, local_datetime(hour=11, minute=55)) == 5 * 60
+    assert get_menu_cache_timeout(MenuSchedule([]), local_datetime(hour=11)) == settings.MENU_CACHE_TIMEOUT
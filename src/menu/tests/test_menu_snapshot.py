@@ -0,0 +1,91 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from menu.models import Action
+from menu.repository.snapshot import get_menu_snapshot, get_menu_version
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_snapshot_content(create_menu_category, create_menu_item, create_menu_item_addition, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    category = create_menu_category()
+    create_menu_category(show=False)
+    menu_item = create_menu_item(category=category)
+    create_menu_item(category=category, show=False)
+    addition = create_menu_item_addition()
+    create_menu_item_addition(show=False)
+
+    snapshot = get_menu_snapshot()
+
+    assert [category.id for category in snapshot.menu_tree.categories] == [category.id]
+    assert [menu_item.id for menu_item in snapshot.menu_tree.categories[0].menu_items_to_show] == [menu_item.id]
+    assert [addition.id for addition in snapshot.menu_tree.additions] == [addition.id]
+    assert snapshot.actions == ()
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_snapshot_warm_cache_makes_no_queries(create_menu_category, create_menu_item, django_assert_num_queries, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    for _ in range(3):
+        create_menu_item(category=create_menu_category())
+
+    get_menu_snapshot()
+
+    with django_assert_num_queries(0):
+        snapshot = get_menu_snapshot()
+
+    assert len(snapshot.menu_tree.categories) == 3
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_snapshot_invalidated_on_menu_changes(create_menu_category, create_menu_item, create_menu_item_addition, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    category = create_menu_category()
+    menu_item = create_menu_item(category=category)
+    addition = create_menu_item_addition()
+    action = Action.objects.create(name='Test', image='test')
+
+    for change in (
+            category.save,
+            menu_item.save,
+            addition.save,
+            action.save,
+            lambda: menu_item.possible_additions.add(addition),
+            action.delete,
+            menu_item.delete,
+    ):
+        snapshot = get_menu_snapshot()
+        change()
+        assert get_menu_version() != snapshot.version
+
+    snapshot = get_menu_snapshot()
+    assert snapshot.menu_tree.categories[0].menu_items_to_show == []
+    assert snapshot.actions == ()
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_main_view_with_warm_menu_snapshot_makes_no_menu_queries(client, create_menu_category, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    for _ in range(3):
+        create_menu_item(category=create_menu_category())
+
+    client.get(reverse('menu:main'))
+
+    with CaptureQueriesContext(connection) as captured_queries:
+        response = client.get(reverse('menu:main'))
+
+    assert response.status_code == 200
+    assert not [query for query in captured_queries.captured_queries if '"menu_' in query['sql']]
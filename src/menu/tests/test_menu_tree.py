@@ -0,0 +1,74 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from menu.repository.menu_tree import get_menu_tree
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_tree_content(create_menu_category, create_menu_item, create_menu_item_addition, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    category1 = create_menu_category(order_index=2)
+    category2 = create_menu_category(order_index=1)
+    create_menu_category(show=False)
+
+    addition = create_menu_item_addition()
+    hidden_addition = create_menu_item_addition(show=False)
+
+    menu_item = create_menu_item(category=category1, additions=[addition, hidden_addition])
+    create_menu_item(category=category1, show=False)
+
+    menu_tree = get_menu_tree()
+
+    assert [category.id for category in menu_tree.categories] == [category2.id, category1.id]
+    assert menu_tree.categories[0].menu_items_to_show == []
+    assert [menu_item.id for menu_item in menu_tree.categories[1].menu_items_to_show] == [menu_item.id]
+    assert menu_tree.categories[1].menu_items_to_show[0].additions_to_show == [addition]
+    assert [addition.id for addition in menu_tree.additions] == [addition.id]
+
+
+@pytest.mark.parametrize('categories_count', [1, 5, 20])
+@pytest.mark.django_db(reset_sequences=True)
+def test_menu_tree_queries_count_not_depends_on_categories_count(categories_count, create_menu_category, create_menu_item, django_assert_num_queries, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    for _ in range(categories_count):
+        category = create_menu_category()
+        create_menu_item(category=category, additions_count=2)
+        create_menu_item(category=category, additions_count=2)
+
+    with django_assert_num_queries(4):
+        get_menu_tree()
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_main_view_queries_count_not_depends_on_categories_count(client, create_menu_category, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    client.get(reverse('menu:main'))   # creates session
+    queries_counts = []
+
+    for _ in range(2):
+        for _ in range(5):
+            category = create_menu_category()
+            create_menu_item(category=category, additions_count=1)
+            create_menu_item(category=category, additions_count=1)
+
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as captured_queries:
+            response = client.get(reverse('menu:main'))
+
+        assert response.status_code == 200
+        queries_counts.append(len(captured_queries))
+
+    assert queries_counts[0] == queries_counts[1]
@@ -0,0 +1,40 @@
+import pytest
+from django.template import Context, Template
+
+from menu.images import is_image_format_supported
+from menu.models import MenuItem
+
+
+def render_picture(image):
+    template = Template("{% load menu_images %}{% picture image sizes='252px' alt='Test' %}")
+    return template.render(Context({'image': image}))
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_picture_tag_shows_original_image_until_processed(create_menu_item):
+    menu_item = create_menu_item(image='menu_images/test.png')
+    content = render_picture(menu_item.image)
+
+    assert content == f'<picture><img src="{menu_item.image.url}" alt="Test"/></picture>'
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_picture_tag_renders_processed_variants(create_menu_item):
+    menu_item = create_menu_item(image='menu_images/test.png')
+    MenuItem.objects.filter(id=menu_item.id).update(images_processed=True)
+    menu_item.refresh_from_db()
+    content = render_picture(menu_item.image)
+
+    assert f'<source type="image/png" srcset="{menu_item.image_png_126.url} 126w, {menu_item.image_png_252.url} 252w" sizes="252px">' in content
+    assert content.endswith(f'<img src="{menu_item.image_png_252.url}" alt="Test"/></picture>')
+
+
+@pytest.mark.django_db(reset_sequences=True)
+@pytest.mark.skipif(not is_image_format_supported('WEBP'), reason='Pillow is built without WebP support')
+def test_picture_tag_renders_webp_srcset(create_menu_item):
+    menu_item = create_menu_item(image='menu_images/test.png')
+    MenuItem.objects.filter(id=menu_item.id).update(images_processed=True)
+    menu_item.refresh_from_db()
+    content = render_picture(menu_item.image)
+
+    assert f'<source type="image/webp" srcset="{menu_item.image_webp_126.url} 126w, {menu_item.image_webp_252.url} 252w" sizes="252px">' in content
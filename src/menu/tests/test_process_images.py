@@ -0,0 +1,76 @@
+import pytest
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+
+from menu.models import MenuItem
+from menu.repository.image import get_unprocessed_images, mark_images_as_processed
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_process_images_command(create_menu_item, mocker):
+    mocked_generate = mocker.patch('menu.image_processing.generate_image_variants')
+
+    menu_item = create_menu_item(image='menu_images/test.png')
+    processed_menu_item = create_menu_item(image='menu_images/processed.png')
+    MenuItem.objects.filter(id=processed_menu_item.id).update(images_processed=True)
+
+    call_command('process_images', processes=1)
+
+    menu_item.refresh_from_db()
+    assert menu_item.images_processed
+    assert [call.args[0].id for call in mocked_generate.call_args_list if isinstance(call.args[0], MenuItem)] == [menu_item.id]
+    assert get_unprocessed_images() == []
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_process_images_command_keeps_failed_images_unprocessed(create_menu_item, mocker):
+    mocker.patch('menu.image_processing.generate_image_variants', side_effect=OSError('cannot identify image file'))
+
+    menu_item = create_menu_item(image='menu_images/test.png')
+
+    call_command('process_images', processes=1)
+
+    menu_item.refresh_from_db()
+    assert not menu_item.images_processed
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_regenerate_images_command(create_menu_item, mocker):
+    mocked_generate = mocker.patch('menu.image_processing.generate_image_variants')
+
+    menu_item = create_menu_item(image='menu_images/test.png')
+    MenuItem.objects.filter(id=menu_item.id).update(images_processed=True)
+
+    call_command('regenerate_images', processes=1)
+
+    assert [type(call.args[0]) for call in mocked_generate.call_args_list].count(MenuItem) == 1
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_new_upload_marks_images_as_unprocessed(create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'menu_images/new.png'
+
+    menu_item = create_menu_item(image='menu_images/test.png')
+    MenuItem.objects.filter(id=menu_item.id).update(images_processed=True)
+    menu_item.refresh_from_db()
+
+    menu_item.title = 'New title'
+    menu_item.save()
+    menu_item.refresh_from_db()
+    assert menu_item.images_processed
+
+    menu_item.image = ContentFile(b'', name='new.png')
+    menu_item.save()
+    menu_item.refresh_from_db()
+    assert not menu_item.images_processed
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_images_changed_during_processing_stay_unprocessed(create_menu_item):
+    menu_item = create_menu_item(image='menu_images/test.png')
+    [(_, _, updated_at)] = [image for image in get_unprocessed_images() if image[0] is MenuItem]
+
+    menu_item.save()
+
+    assert not mark_images_as_processed(MenuItem, menu_item.id, updated_at)
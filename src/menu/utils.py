@@ -0,0 +1,62 @@
+import hashlib
+
+from django.conf import settings
+
+from common.utils import get_local_now
+from menu.repository.snapshot import get_menu_snapshot
+from order.repository.cart import get_cart_updated_at
+
+
+def get_request_menu_snapshot(request):
+    if not hasattr(request, 'menu_snapshot'):
+        request.menu_snapshot = get_menu_snapshot()
+
+    return request.menu_snapshot
+
+
+def get_menu_cache_timeout(menu_schedule, now):
+    seconds_to_next_transition = menu_schedule.get_seconds_to_next_transition(now)
+
+    if seconds_to_next_transition is None:
+        return settings.MENU_CACHE_TIMEOUT
+
+    return min(seconds_to_next_transition, settings.MENU_CACHE_TIMEOUT)
+
+
+def make_etag(*parts):
+    return hashlib.md5(':'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+
+def get_menu_page_etag(request, *args, **kwargs):
+    menu_snapshot = get_request_menu_snapshot(request)
+
+    return make_etag(
+        menu_snapshot.version,
+        menu_snapshot.schedule.get_orderable_category_ids(get_local_now()),
+        request.user.is_authenticated,
+        request.get_full_path(),
+        request.session.session_key,
+        get_cart_updated_at(request.session),
+        request.COOKIES.get(settings.CSRF_COOKIE_NAME),
+    )
+
+
+def get_menu_page_last_modified(request, *args, **kwargs):
+    menu_snapshot = get_request_menu_snapshot(request)
+
+    return max(filter(None, (
+        menu_snapshot.updated_at,
+        menu_snapshot.schedule.get_previous_transition(get_local_now()),
+        get_cart_updated_at(request.session),
+    )), default=None)
+
+
+def get_menu_api_etag(request, *args, **kwargs):
+    return make_etag(
+        get_request_menu_snapshot(request).version,
+        request.get_full_path(),
+    )
+
+
+def get_menu_api_last_modified(request, *args, **kwargs):
+    return get_request_menu_snapshot(request).updated_at
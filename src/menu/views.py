@@ -1,72 +1,104 @@
 from django.utils.decorators import method_decorator
 from django.views.generic import ListView
 
+from common.utils import get_local_now
+from menu.decorators import menu_page_condition
 from menu.filters import MenuCategoryFilter
 from menu.models import MenuCategory
-from menu.repository.action import get_actual_actions
-from menu.repository.menu_item import get_additions_to_show, get_menu_categories_to_show
+from menu.utils import get_request_menu_snapshot, get_menu_cache_timeout
 from order.decorators import redirect_to_payment_if_needed
 from order.repository.cart import get_menu_items_in_cart, get_cart_total_amount
 
 
+class MenuSnapshotMixin:
+
+    def get_menu_snapshot(self):
+        return get_request_menu_snapshot(self.request)
+
+    def get_menu_cache_context(self):
+        menu_snapshot = self.get_menu_snapshot()
+        now = get_local_now()
+
+        return {
+            'menu_version': menu_snapshot.version,
+            'menu_time_window': menu_snapshot.schedule.get_orderable_category_ids(now),
+            'menu_cache_timeout': get_menu_cache_timeout(menu_snapshot.schedule, now),
+        }
+
+
 @method_decorator(redirect_to_payment_if_needed, name='get')
-class MainView(ListView):
+@method_decorator(menu_page_condition, name='get')
+class MainView(MenuSnapshotMixin, ListView):
     model = MenuCategory
     template_name = 'main.html'
     context_object_name = 'menu_categories'
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super().get_context_data(object_list=object_list, **kwargs)
+        menu_snapshot = self.get_menu_snapshot()
 
         context.update({
-            'all_categories': get_menu_categories_to_show(),
-            'additions': get_additions_to_show()
+            'all_categories': menu_snapshot.menu_tree.categories,
+            'additions': menu_snapshot.menu_tree.additions,
+            'menu_category_id': self.get_category_id(),
+            **self.get_menu_cache_context(),
         })
 
         if not self.request.user.is_authenticated:
-            session_key = self.request.session.session_key
+            menu_items_in_cart = get_menu_items_in_cart(self.request.session)
 
             context.update({
-                'actions': get_actual_actions(),
-                'menu_items_in_cart': get_menu_items_in_cart(session_key),
-                'total_amount': get_cart_total_amount(session_key),
+                'actions': menu_snapshot.actions,
+                'menu_items_in_cart': menu_items_in_cart,
+                'menu_items_in_cart_ids': sorted(menu_items_in_cart),
+                'total_amount': get_cart_total_amount(self.request.session),
             })
 
         return context
 
     def get_queryset(self):
-        return MenuCategoryFilter(
-            self.request.GET,
-            super().get_queryset()
-                .filter(show=True)
-                .prefetch_related('menu_items')
-                .order_by('order_index')
-        ).qs
+        categories = self.get_menu_snapshot().menu_tree.categories
+        category_id = self.get_category_id()
+
+        if category_id is not None:
+            categories = tuple(category for category in categories if category.id == category_id)
+
+        return categories
+
+    def get_category_id(self):
+        category_filter = MenuCategoryFilter(self.request.GET)
+
+        if category_filter.is_valid():
+            return category_filter.form.cleaned_data.get('category_id')
 
 
 @method_decorator(redirect_to_payment_if_needed, name='get')
-class AdditionsListView(ListView):
+@method_decorator(menu_page_condition, name='get')
+class AdditionsListView(MenuSnapshotMixin, ListView):
     model = MenuCategory
     template_name = 'additions.html'
     context_object_name = 'all_categories'
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super().get_context_data(object_list=object_list, **kwargs)
+        menu_snapshot = self.get_menu_snapshot()
 
         context.update({
-            'additions': get_additions_to_show()
+            'additions': menu_snapshot.menu_tree.additions,
+            **self.get_menu_cache_context(),
         })
 
         if not self.request.user.is_authenticated:
-            session_key = self.request.session.session_key
+            menu_items_in_cart = get_menu_items_in_cart(self.request.session)
 
             context.update({
-                'actions': get_actual_actions(),
-                'menu_items_in_cart': get_menu_items_in_cart(session_key),
-                'total_amount': get_cart_total_amount(session_key),
+                'actions': menu_snapshot.actions,
+                'menu_items_in_cart': menu_items_in_cart,
+                'menu_items_in_cart_ids': sorted(menu_items_in_cart),
+                'total_amount': get_cart_total_amount(self.request.session),
             })
 
         return context
 
     def get_queryset(self):
-        return super().get_queryset().filter(show=True).order_by('order_index')
+        return self.get_menu_snapshot().menu_tree.categories
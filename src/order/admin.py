@@ -3,12 +3,14 @@ from django.urls import reverse
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
-from order.models import Cart, Customer, Order, CartItem, DeliveryAddress, OrderTransaction, OrderItem
+from order.models import Cart, Customer, Order, CartItem, DeliveryAddress, OrderTransaction, OrderItem, OrderNotification
+from order.repository.cart import recalculate_carts_total_amounts
+from order.repository.notification import retry_failed_order_notifications
 
 
 class CartItemInline(admin.TabularInline):
     model = CartItem
-    readonly_fields = ('menu_item', 'additions_list', 'count', 'total_amount')
+    readonly_fields = ('menu_item', 'additions_list', 'count', 'unit_price', 'total_amount')
     max_num = 0
     exclude = ('additions',)
 
@@ -37,6 +39,12 @@ class CartModelAdmin(admin.ModelAdmin):
         CartItemInline,
     ]
 
+    def save_formset(self, request, form, formset, change):
+        super().save_formset(request, form, formset, change)
+
+        if formset.deleted_objects:
+            recalculate_carts_total_amounts(Cart.objects.filter(id=form.instance.id))
+
 
 @admin.register(Customer)
 class CustomerModelAdmin(admin.ModelAdmin):
@@ -62,13 +70,13 @@ class OrderItemInline(admin.TabularInline):
     model = OrderItem
     max_num = 0
     exclude = ('title',)
-    fields = ('menu_item', 'price', 'volume', 'count', 'additions_list')
+    fields = ('menu_item', 'price', 'volume', 'count', 'additions_list', 'total_amount')
 
     def get_readonly_fields(self, request, obj=None):
         if not request.user.is_superuser:
-            return ('menu_item', 'title', 'price', 'volume', 'count', 'additions_list')
+            return ('menu_item', 'title', 'price', 'volume', 'count', 'additions_list', 'total_amount')
 
-        return ['additions_list']
+        return ['additions_list', 'total_amount']
 
     @admin.display(description=_('Additions'))
     def additions_list(self, obj):
@@ -101,6 +109,21 @@ class OrderModelAdmin(admin.ModelAdmin):
     def get_readonly_fields(self, request, obj=None):
         if not request.user.is_superuser:
             return ('session_key', 'customer', 'is_rejected', 'prepayment_required', 'payment_method',
-                    'customer_comment', 'peoples_count')
+                    'customer_comment', 'peoples_count', 'total_amount')
 
-        return []
+        return ['total_amount']
+
+
+@admin.register(OrderNotification)
+class OrderNotificationModelAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'status', 'attempts', 'next_attempt_at', 'created_at')
+    list_filter = ('status',)
+    readonly_fields = ('order', 'status', 'attempts', 'next_attempt_at', 'last_error')
+    actions = ('retry_notifications',)
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description=_('Retry failed notifications'))
+    def retry_notifications(self, request, queryset):
+        retry_failed_order_notifications(queryset)
@@ -5,7 +5,7 @@ from rest_framework.exceptions import ErrorDetail
 from common.utils import convert_utc_to_local
 from menu.repository.menu_item import get_menu_item_by_id
 from order.api.validators import positive_small_integer_validator, phone_number_validator, self_pickup_time_validator
-from order.constants import DeliveryMethods, PaymentMethods
+from order.constants import DeliveryMethods, PaymentMethods, CartOperations
 
 
 class AddToCartRequestSerializer(serializers.Serializer):
@@ -104,6 +104,32 @@ class RemoveAdditionFromCartItemRequestSerializer(CartItemIdSerializer):
     addition_id = serializers.IntegerField()
 
 
+class CartOperationSerializer(CartItemIdSerializer):
+    operation = serializers.ChoiceField(choices=[
+        CartOperations.INCREASE_COUNT,
+        CartOperations.DECREASE_COUNT,
+        CartOperations.REMOVE_CART_ITEM,
+        CartOperations.REMOVE_ADDITION,
+    ])
+    addition_id = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        if attrs.get('operation') == CartOperations.REMOVE_ADDITION and attrs.get('addition_id') is None:
+            raise serializers.ValidationError({
+                'addition_id': ErrorDetail(_('This field is required.'), code='required')
+            })
+
+        return attrs
+
+
+class BatchCartOperationsRequestSerializer(serializers.Serializer):
+    operations = serializers.ListField(
+        allow_empty=False,
+        max_length=100,
+        child=CartOperationSerializer()
+    )
+
+
 class ConfirmLiqPayPaymentRequestSerilizer(serializers.Serializer):
     data = serializers.CharField()
     signature = serializers.CharField()
@@ -2,7 +2,7 @@ from django.urls import path
 
 from order.api.views import AddToCart, IncreaseCartItemCount, DecreaseCartItemCount, ClearCartAPIView, \
     RemoveCartItemFromCartAPIView, RemoveAdditionFromCartItemAPIView, CreateOrderAPIView, RejectOrderAPIView, \
-    ConfirmLiqPayPaymentAPIView
+    ConfirmLiqPayPaymentAPIView, BatchCartOperationsAPIView
 
 urlpatterns = [
     path('add-to-cart/', AddToCart.as_view(), name='add_to_cart'),
@@ -12,6 +12,7 @@ urlpatterns = [
     path('clear/', ClearCartAPIView.as_view(), name='clear_cart'),
     path('remove-cart-item/', RemoveCartItemFromCartAPIView.as_view(), name='remove_cart_item'),
     path('remove-cart-item-addition/', RemoveAdditionFromCartItemAPIView.as_view(), name='remove_cart_item_addition'),
+    path('cart/batch/', BatchCartOperationsAPIView.as_view(), name='cart_batch'),
     path('reject/', RejectOrderAPIView.as_view(), name='reject_order'),
     path('payment/confirm/', ConfirmLiqPayPaymentAPIView.as_view(), name='confirm_payment'),
 ]
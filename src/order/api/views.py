@@ -1,26 +1,29 @@
 import json
 import logging
 
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import F
 from django.http import Http404
 from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from common.decorators import forbidden_for_authenticated
+from common.decorators import forbidden_for_authenticated, ensure_session
 from common.errors import APIException
 from common.utils import decode_base64_string, get_utc_now
 from fs_cabinet.settings import DEFAULT_LOGGER_NAME
 from menu.repository.menu_item import get_menu_item_by_id, get_menu_item_additions_by_ids
 from order.api.serializers import AddToCartRequestSerializer, IncreaseCartItemCountRequestSerializer, \
     CreateOrderRequestSerializer, RemoveCartItemRequestSerializer, DecreaseCartItemCountRequestSerializer, \
-    RemoveAdditionFromCartItemRequestSerializer, ConfirmLiqPayPaymentRequestSerilizer
+    RemoveAdditionFromCartItemRequestSerializer, ConfirmLiqPayPaymentRequestSerilizer, \
+    BatchCartOperationsRequestSerializer
+from order.constants import CartOperations
+from order.decorators import idempotent
 from order.handlers.liqpay import verify_liqpay_signature
-from order.handlers.order import send_new_order_notification
-from order.repository.cart import get_or_create_cart, add_menu_item_to_cart, get_cart_item_by_id, get_cart, \
-    get_cart_item_addition_by_id, cart_items_count
+from order.repository.cart import clear_cart_summary
+from order.repository.cart_storage import get_cart_storage
+from order.repository.notification import create_new_order_notification
 from order.repository.order import create_order_process, reject_order, get_order_transaction_by_session_key, \
     get_order_by_id, get_order_transaction_by_order_id, mark_order_transaction_as_paid, \
     add_order_transaction_additional_data
@@ -29,6 +32,8 @@ logger = logging.getLogger(DEFAULT_LOGGER_NAME)
 
 
 @method_decorator(forbidden_for_authenticated, name='post')
+@method_decorator(ensure_session, name='post')
+@method_decorator(idempotent, name='post')
 class AddToCart(APIView):
 
     def post(self, request):
@@ -50,12 +55,12 @@ class AddToCart(APIView):
         if not menu_item.category.can_order_now():
             raise APIException(code='menu_item_order_not_allowed_at_this_time')
 
-        session_key = request.session.session_key
+        cart_storage = get_cart_storage(request.session)
 
         with transaction.atomic():
-            cart, created = get_or_create_cart(session_key)
+            cart = cart_storage.get_or_create_cart()
             additions = get_menu_item_additions_by_ids(menu_item, addition_ids)
-            add_menu_item_to_cart(cart, menu_item, additions, count)
+            cart_storage.add_menu_item_to_cart(cart, menu_item, additions, count)
 
         return Response({
             'total_amount': cart.total_amount,
@@ -63,10 +68,12 @@ class AddToCart(APIView):
 
 
 @method_decorator(forbidden_for_authenticated, name='post')
+@method_decorator(idempotent, name='post')
 class IncreaseCartItemCount(APIView):
 
     def post(self, request):
-        cart = get_cart(request.session.session_key)
+        cart_storage = get_cart_storage(request.session)
+        cart = cart_storage.get_cart()
 
         if cart is None:
             raise Http404()
@@ -75,27 +82,30 @@ class IncreaseCartItemCount(APIView):
         serializer.is_valid(raise_exception=True)
 
         cart_item_id = serializer.validated_data.get('cart_item_id')
-        cart_item = get_cart_item_by_id(cart.id, cart_item_id)
+        cart_item = cart_storage.get_cart_item(cart, cart_item_id)
 
         if cart_item is None:
             raise Http404()
 
-        cart_item.count = F('count') + 1
-        cart_item.save()
-        cart_item.refresh_from_db()
+        try:
+            cart_storage.change_cart_item_count(cart, cart_item, 1)
+        except ObjectDoesNotExist:
+            raise Http404()
 
         return Response({
             'count': cart_item.count,
             'cart_item_total_amount': cart_item.total_amount,
-            'total_amount': cart_item.cart.total_amount,
+            'total_amount': cart.total_amount,
         })
 
 
 @method_decorator(forbidden_for_authenticated, name='post')
+@method_decorator(idempotent, name='post')
 class DecreaseCartItemCount(APIView):
 
     def post(self, request):
-        cart = get_cart(request.session.session_key)
+        cart_storage = get_cart_storage(request.session)
+        cart = cart_storage.get_cart()
 
         if cart is None:
             raise Http404()
@@ -104,35 +114,38 @@ class DecreaseCartItemCount(APIView):
         serializer.is_valid(raise_exception=True)
 
         cart_item_id = serializer.validated_data.get('cart_item_id')
-        cart_item = get_cart_item_by_id(cart.id, cart_item_id)
+        cart_item = cart_storage.get_cart_item(cart, cart_item_id)
 
         if cart_item is None:
             raise Http404()
 
         if cart_item.count != 1:
-            cart_item.count = F('count') - 1
-            cart_item.save()
-            cart_item.refresh_from_db()
+            try:
+                cart_storage.change_cart_item_count(cart, cart_item, -1)
+            except ObjectDoesNotExist:
+                raise Http404()
 
         return Response({
             'count': cart_item.count,
             'cart_item_total_amount': cart_item.total_amount,
-            'total_amount': cart_item.cart.total_amount,
+            'total_amount': cart.total_amount,
         })
 
 
 @method_decorator(forbidden_for_authenticated, name='post')
+@method_decorator(idempotent, name='post')
 class CreateOrderAPIView(APIView):
 
     def post(self, request):
         session_key = request.session.session_key
 
-        cart = get_cart(session_key)
+        cart_storage = get_cart_storage(request.session)
+        cart = cart_storage.get_cart()
 
         if cart is None:
             raise APIException(code='cart_not_found')
 
-        if cart_items_count(cart) == 0:
+        if cart_storage.cart_items_count(cart) == 0:
             raise APIException(code='cart_empty')
 
         serializer = CreateOrderRequestSerializer(data=request.data)
@@ -145,9 +158,7 @@ class CreateOrderAPIView(APIView):
         }
 
         order = create_order_process(**validated_data)
-
-        if not order.is_payment_required():
-            send_new_order_notification(order)
+        clear_cart_summary(request.session)
 
         return Response({
             'payment_required': order.is_payment_required()
@@ -155,25 +166,28 @@ class CreateOrderAPIView(APIView):
 
 
 @method_decorator(forbidden_for_authenticated, name='post')
+@method_decorator(idempotent, name='post')
 class ClearCartAPIView(APIView):
 
     def post(self, request):
-        cart = get_cart(request.session.session_key)
+        cart_storage = get_cart_storage(request.session)
+        cart = cart_storage.get_cart()
 
         if cart is None:
             raise Http404()
 
-        cart.clear()
-        cart.save()
+        cart_storage.clear_cart(cart)
 
         return Response({'status': 'OK'})
 
 
 @method_decorator(forbidden_for_authenticated, name='post')
+@method_decorator(idempotent, name='post')
 class RemoveCartItemFromCartAPIView(APIView):
 
     def post(self, request):
-        cart = get_cart(request.session.session_key)
+        cart_storage = get_cart_storage(request.session)
+        cart = cart_storage.get_cart()
 
         if cart is None:
             raise Http404()
@@ -182,23 +196,25 @@ class RemoveCartItemFromCartAPIView(APIView):
         serializer.is_valid(raise_exception=True)
 
         cart_item_id = serializer.validated_data.get('cart_item_id')
-        cart_item = get_cart_item_by_id(cart.id, cart_item_id)
+        cart_item = cart_storage.get_cart_item(cart, cart_item_id)
 
         if cart_item is None:
             raise Http404()
 
-        cart_item.delete()
+        cart_storage.remove_cart_item_from_cart(cart, cart_item)
 
         return Response({
-            'total_amount': cart_item.cart.total_amount
+            'total_amount': cart.total_amount
         })
 
 
 @method_decorator(forbidden_for_authenticated, name='post')
+@method_decorator(idempotent, name='post')
 class RemoveAdditionFromCartItemAPIView(APIView):
 
     def post(self, request):
-        cart = get_cart(request.session.session_key)
+        cart_storage = get_cart_storage(request.session)
+        cart = cart_storage.get_cart()
 
         if cart is None:
             raise Http404()
@@ -207,18 +223,18 @@ class RemoveAdditionFromCartItemAPIView(APIView):
         serializer.is_valid(raise_exception=True)
 
         cart_item_id = serializer.validated_data.get('cart_item_id')
-        cart_item = get_cart_item_by_id(cart.id, cart_item_id)
+        cart_item = cart_storage.get_cart_item(cart, cart_item_id)
 
         if cart_item is None:
             raise Http404()
 
         addition_id = serializer.validated_data.get('addition_id')
-        addition = get_cart_item_addition_by_id(cart_item, addition_id)
+        addition = cart_storage.get_cart_item_addition(cart_item, addition_id)
 
         if addition is None:
             raise Http404()
 
-        cart_item.additions.remove(addition)
+        cart_storage.remove_addition_from_cart_item(cart, cart_item, addition)
 
         return Response({
             'cart_item_total_amount': cart_item.total_amount,
@@ -226,6 +242,92 @@ class RemoveAdditionFromCartItemAPIView(APIView):
         })
 
 
+@method_decorator(forbidden_for_authenticated, name='post')
+@method_decorator(idempotent, name='post')
+class BatchCartOperationsAPIView(APIView):
+
+    def get_cart_operations(self, cart_storage, cart, operations):
+        cart_items = {}
+        removed_cart_item_ids = set()
+        removed_additions = set()
+        cart_operations = []
+
+        for operation in operations:
+            operation_type = operation.get('operation')
+            cart_item_id = operation.get('cart_item_id')
+
+            if cart_item_id not in cart_items:
+                cart_items[cart_item_id] = cart_storage.get_cart_item(cart, cart_item_id)
+
+            cart_item = cart_items[cart_item_id]
+
+            if cart_item is None or cart_item_id in removed_cart_item_ids:
+                raise Http404()
+
+            addition = None
+
+            if operation_type == CartOperations.REMOVE_ADDITION:
+                addition_id = operation.get('addition_id')
+
+                if (cart_item_id, addition_id) not in removed_additions:
+                    addition = cart_storage.get_cart_item_addition(cart_item, addition_id)
+
+                if addition is None:
+                    raise Http404()
+
+                removed_additions.add((cart_item_id, addition_id))
+
+            elif operation_type == CartOperations.REMOVE_CART_ITEM:
+                removed_cart_item_ids.add(cart_item_id)
+
+            cart_operations.append((operation_type, cart_item, addition))
+
+        return cart_operations
+
+    def post(self, request):
+        cart_storage = get_cart_storage(request.session)
+        cart = cart_storage.get_cart()
+
+        if cart is None:
+            raise Http404()
+
+        serializer = BatchCartOperationsRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        cart_operations = self.get_cart_operations(cart_storage, cart, serializer.validated_data.get('operations'))
+
+        try:
+            with transaction.atomic():
+                for operation_type, cart_item, addition in cart_operations:
+                    if operation_type == CartOperations.INCREASE_COUNT:
+                        cart_storage.change_cart_item_count(cart, cart_item, 1)
+
+                    elif operation_type == CartOperations.DECREASE_COUNT:
+                        if cart_item.count != 1:
+                            cart_storage.change_cart_item_count(cart, cart_item, -1)
+
+                    elif operation_type == CartOperations.REMOVE_CART_ITEM:
+                        cart_storage.remove_cart_item_from_cart(cart, cart_item)
+
+                    elif operation_type == CartOperations.REMOVE_ADDITION:
+                        cart_storage.remove_addition_from_cart_item(cart, cart_item, addition)
+
+        except ObjectDoesNotExist:
+            raise Http404()
+
+        return Response({
+            'cart_items': [
+                {
+                    'id': cart_item.id,
+                    'count': cart_item.count,
+                    'total_amount': cart_item.total_amount,
+                }
+                for cart_item in cart.items.all()
+            ],
+            'total_amount': cart.total_amount,
+        })
+
+
 @method_decorator(forbidden_for_authenticated, name='post')
 class RejectOrderAPIView(APIView):
 
@@ -317,7 +419,6 @@ class ConfirmLiqPayPaymentAPIView(APIView):
                 'updated_at': get_utc_now().isoformat(),
             })
             mark_order_transaction_as_paid(order_transaction)
-
-        send_new_order_notification(order)
+            create_new_order_notification(order)
 
         return Response(status=status.HTTP_200_OK)
@@ -6,3 +6,7 @@ class OrderConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'order'
     verbose_name = _('Order')
+
+    def ready(self):
+        from order.signals import connect_signals
+        connect_signals()
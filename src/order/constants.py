@@ -19,3 +19,16 @@ class OrderTransactionTypes:
 class OrderTransactionStatuses:
     PAID = 'PAID'
     NOT_PAID = 'NOT_PAID'
+
+
+class CartOperations:
+    INCREASE_COUNT = 'INCREASE_COUNT'
+    DECREASE_COUNT = 'DECREASE_COUNT'
+    REMOVE_CART_ITEM = 'REMOVE_CART_ITEM'
+    REMOVE_ADDITION = 'REMOVE_ADDITION'
+
+
+class OrderNotificationStatuses:
+    PENDING = 'PENDING'
+    SENT = 'SENT'
+    FAILED = 'FAILED'
@@ -1,10 +1,20 @@
+import hashlib
+import json
 from functools import wraps
 
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
 from django.shortcuts import redirect
 from django.urls import reverse
+from rest_framework.response import Response
 
+from common.errors import APIException, ConflictAPIException
+from order.repository.cart_storage import get_cart_storage
+from order.repository.idempotency import claim_idempotency_key, store_idempotency_key_response
 from order.repository.order import get_order_transaction_by_session_key
 
+IDEMPOTENCY_KEY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+
 
 def redirect_to_payment_if_needed(func):
 
@@ -18,3 +28,59 @@ def redirect_to_payment_if_needed(func):
         return func(request, *args, **kwargs)
 
     return payment_check
+
+
+def refresh_stale_cart_summary(func):
+
+    @wraps(func)
+    def cart_summary_check(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            get_cart_storage(request.session).refresh_cart_summary()
+
+        return func(request, *args, **kwargs)
+
+    return cart_summary_check
+
+
+def get_request_data_hash(request):
+    return hashlib.sha256(json.dumps(request.data, sort_keys=True, cls=DjangoJSONEncoder).encode()).hexdigest()
+
+
+def idempotent(view):
+
+    @wraps(view)
+    def idempotency_check(request, *args, **kwargs):
+        idempotency_key = request.META.get(IDEMPOTENCY_KEY_HEADER)
+        session_key = request.session.session_key
+
+        # responses are replayed within the session only, so there is nothing to protect without it
+        if not idempotency_key or not session_key:
+            return view(request, *args, **kwargs)
+
+        data_hash = get_request_data_hash(request)
+
+        # the unique key row is inserted in the same transaction as the request changes, so a concurrent duplicate
+        # waits for it and then replays the stored response, and a failed request releases the key
+        with transaction.atomic():
+            stored_idempotency_key, claimed = claim_idempotency_key(session_key, request.path, idempotency_key, data_hash)
+
+            if claimed:
+                response = view(request, *args, **kwargs)
+
+                if response.status_code < 500:
+                    store_idempotency_key_response(stored_idempotency_key, response.status_code, response.data)
+                else:
+                    stored_idempotency_key.delete()
+
+                return response
+
+        if stored_idempotency_key is None or stored_idempotency_key.status_code is None:
+            raise ConflictAPIException(code='idempotency_key_in_use')
+
+        if stored_idempotency_key.data_hash != data_hash:
+            raise APIException(code='idempotency_key_mismatch')
+
+        return Response(stored_idempotency_key.response_data, status=stored_idempotency_key.status_code,
+                        headers={'Idempotent-Replayed': 'true'})
+
+    return idempotency_check
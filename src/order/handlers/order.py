@@ -1,15 +1,9 @@
-import logging
-from smtplib import SMTPException
-
 from django.template import loader
 
-from common.utils import send_email
-from fs_cabinet.settings import DEFAULT_LOGGER_NAME
+from common.utils import build_email
 from order.constants import DeliveryMethods
 from settings.repository import get_site_settings
 
-logger = logging.getLogger(DEFAULT_LOGGER_NAME)
-
 
 def render_email(subject_template_name, email_template_name, context, html_email_template_name=None):
     subject = loader.render_to_string(subject_template_name, context)
@@ -62,19 +56,17 @@ def render_email_for_new_order_notification(order):
     )
 
 
-def send_new_order_notification(order):
+def get_new_order_notification_emails():
+    site_settings = get_site_settings()
+    return [user.email for user in site_settings.notify_users.all() if user.is_active]
+
+
+def build_new_order_notification_email(order, emails):
     rendered_subject, rendered_message, rendered_html_message = render_email_for_new_order_notification(order)
 
-    site_settings = get_site_settings()
-    emails = [user.email for user in site_settings.notify_users.filter(is_active=True)]
-
-    try:
-        send_email(
-            rendered_subject,
-            emails,
-            rendered_message,
-            rendered_html_message,
-        )
-
-    except SMTPException as e:
-        logger.error(f'Unable to send new order notification, error: {e}')
+    return build_email(
+        rendered_subject,
+        emails,
+        rendered_message,
+        rendered_html_message,
+    )
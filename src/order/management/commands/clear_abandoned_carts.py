@@ -0,0 +1,40 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from common.utils import delete_expired_sessions, get_database_free_bytes
+from order.repository.cart import delete_abandoned_carts
+from order.repository.idempotency import delete_expired_idempotency_keys
+
+
+class Command(BaseCommand):
+    help = 'Deletes expired sessions and abandoned carts in small batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-age', type=int, default=settings.ABANDONED_CART_MAX_AGE, help='Seconds since the last update after which a cart is abandoned')
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows deleted per transaction')
+        parser.add_argument('--pause', type=float, default=0.1, help='Seconds to sleep between batches')
+        parser.add_argument('--loop', action='store_true', help='Keep cleaning up periodically')
+        parser.add_argument('--interval', type=float, default=60 * 60, help='Seconds between runs in loop mode')
+
+    def handle(self, *args, **options):
+        while True:
+            free_bytes = get_database_free_bytes(connection)
+
+            sessions_count = delete_expired_sessions(options['batch_size'], options['pause'])
+            carts_rows_count = delete_abandoned_carts(options['max_age'], options['batch_size'], options['pause'])
+            idempotency_keys_count = delete_expired_idempotency_keys(settings.IDEMPOTENCY_KEY_TIMEOUT, options['batch_size'], options['pause'])
+
+            message = f'Deleted {sessions_count} expired sessions, {carts_rows_count} rows of abandoned carts and {idempotency_keys_count} expired idempotency keys'
+
+            if free_bytes is not None:
+                message += f', reclaimed {get_database_free_bytes(connection) - free_bytes} bytes'
+
+            self.stdout.write(message)
+
+            if not options['loop']:
+                break
+
+            time.sleep(options['interval'])
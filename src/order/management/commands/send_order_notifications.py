@@ -0,0 +1,87 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from common.mail import EmailDelivery
+from fs_cabinet.settings import DEFAULT_LOGGER_NAME
+from order.handlers.order import build_new_order_notification_email, get_new_order_notification_emails
+from order.repository.notification import (
+    claim_due_order_notifications, mark_order_notification_as_sent, mark_order_notification_attempt_as_failed
+)
+
+logger = logging.getLogger(DEFAULT_LOGGER_NAME)
+
+
+class Command(BaseCommand):
+    help = 'Sends pending new order notifications from the outbox over a persistent email connection'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100, help='Notifications claimed and sent per batch')
+        parser.add_argument('--max-attempts', type=int, default=settings.ORDER_NOTIFICATION_MAX_ATTEMPTS, help='Attempts after which a notification is marked as failed')
+        parser.add_argument('--retry-delay', type=float, default=settings.ORDER_NOTIFICATION_RETRY_DELAY, help='Seconds before the first retry, doubled after each failed attempt')
+        parser.add_argument('--lease', type=int, default=settings.ORDER_NOTIFICATION_CLAIM_LEASE, help='Seconds after which notifications claimed by a stopped worker are sent again')
+        parser.add_argument('--loop', action='store_true', help='Keep sending notifications periodically')
+        parser.add_argument('--interval', type=float, default=5, help='Seconds between runs in loop mode')
+
+    def handle(self, *args, **options):
+        with EmailDelivery() as delivery:
+            while True:
+                sent_count = 0
+                failed_count = 0
+
+                while True:
+                    batch_sent_count, batch_failed_count = self.send_due_notifications(delivery, options)
+                    sent_count += batch_sent_count
+                    failed_count += batch_failed_count
+
+                    if batch_sent_count + batch_failed_count < options['batch_size']:
+                        break
+
+                if sent_count or failed_count or not options['loop']:
+                    self.stdout.write(f'Sent {sent_count} order notifications, {failed_count} failed')
+
+                if not options['loop']:
+                    break
+
+                time.sleep(options['interval'])
+
+    def send_due_notifications(self, delivery, options):
+        sent_count = 0
+        failed_count = 0
+
+        # claimed notifications are sent outside of any transaction, and every result is saved on its own,
+        # so slow SMTP responses never hold database locks
+        notifications = claim_due_order_notifications(options['batch_size'], options['lease'])
+
+        if not notifications:
+            return sent_count, failed_count
+
+        emails = get_new_order_notification_emails()
+        built_notifications = []
+        messages = []
+
+        for notification in notifications:
+            try:
+                messages.append(build_new_order_notification_email(notification.order, emails))
+                built_notifications.append(notification)
+
+            except Exception as e:
+                self.mark_as_failed(notification, e, options)
+                failed_count += 1
+
+        for notification, error in zip(built_notifications, delivery.send_messages(messages)):
+            if error is None:
+                mark_order_notification_as_sent(notification)
+                sent_count += 1
+
+            else:
+                self.mark_as_failed(notification, error, options)
+                failed_count += 1
+
+        return sent_count, failed_count
+
+    def mark_as_failed(self, notification, error, options):
+        logger.error(f'Unable to send new order notification for order ID {notification.order_id}, error: {error}')
+        mark_order_notification_attempt_as_failed(notification, str(error), options['max_attempts'], options['retry_delay'])
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from order.repository.order import get_order_items_with_drifted_total_amount, get_orders_with_drifted_total_amount
+
+
+class Command(BaseCommand):
+    help = 'Recomputes stored order totals and reports any drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fix', action='store_true', help='Overwrite drifted totals with recomputed values')
+
+    def handle(self, *args, **options):
+        drifted_count = 0
+
+        with transaction.atomic():
+            for order_item in get_order_items_with_drifted_total_amount():
+                self.stdout.write(f'Order item {order_item.id} (order {order_item.order_id}): stored {order_item.total_amount}, '
+                                  f'calculated {order_item.calculated_total_amount}')
+                drifted_count += 1
+
+                if options['fix']:
+                    order_item.total_amount = order_item.calculated_total_amount
+                    order_item.save(update_fields=('total_amount', 'updated_at'))
+
+            for order in get_orders_with_drifted_total_amount():
+                self.stdout.write(f'Order {order.id}: stored {order.total_amount}, calculated {order.calculated_total_amount}')
+                drifted_count += 1
+
+                if options['fix']:
+                    order.total_amount = order.calculated_total_amount
+                    order.save(update_fields=('total_amount', 'updated_at'))
+
+        if drifted_count and not options['fix']:
+            raise CommandError(f'Found {drifted_count} drifted totals')
+
+        self.stdout.write(f'Checked order totals, {"fixed" if options["fix"] else "found"} {drifted_count} drifted')
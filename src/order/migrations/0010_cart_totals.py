@@ -0,0 +1,39 @@
+# Generated by Django 3.2.6 on 2026-10-18 10:40
+
+from django.db import migrations, models
+
+
+def fill_cart_totals(apps, schema_editor):
+    Cart = apps.get_model('order', 'Cart')
+
+    for cart in Cart.objects.prefetch_related('items__menu_item', 'items__additions'):
+        total_amount = 0
+
+        for cart_item in cart.items.all():
+            cart_item.unit_price = cart_item.menu_item.price + sum(addition.price for addition in cart_item.additions.all())
+            cart_item.save(update_fields=['unit_price'])
+            total_amount += cart_item.unit_price * cart_item.count
+
+        cart.total_amount = total_amount
+        cart.save(update_fields=['total_amount'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0009_alter_ordertransaction_additional_data'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cart',
+            name='total_amount',
+            field=models.DecimalField(decimal_places=0, default=0, max_digits=10, verbose_name='Total amount'),
+        ),
+        migrations.AddField(
+            model_name='cartitem',
+            name='unit_price',
+            field=models.DecimalField(decimal_places=0, default=0, max_digits=8, verbose_name='Unit price'),
+        ),
+        migrations.RunPython(fill_cart_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.6 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+from order.utils import get_additions_fingerprint
+
+
+def fill_additions_fingerprints(apps, schema_editor):
+    CartItem = apps.get_model('order', 'CartItem')
+
+    for cart_item in CartItem.objects.prefetch_related('additions'):
+        cart_item.additions_fingerprint = get_additions_fingerprint(addition.id for addition in cart_item.additions.all())
+        cart_item.save(update_fields=['additions_fingerprint'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0010_cart_totals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cartitem',
+            name='additions_fingerprint',
+            field=models.CharField(default='da39a3ee5e6b4b0d3255bfef95601890afd80709', editable=False, max_length=40, verbose_name='Additions fingerprint'),
+        ),
+        migrations.RunPython(fill_additions_fingerprints, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='cartitem',
+            index=models.Index(fields=['cart', 'menu_item', 'additions_fingerprint'], name='order_carti_cart_id_ce55bd_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 3.2.6 on 2026-10-18 10:47
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def merge_duplicate_carts(apps, schema_editor):
+    Cart = apps.get_model('order', 'Cart')
+
+    duplicated_session_keys = list(
+        Cart.objects.values('session_key').annotate(carts_count=Count('id')).filter(carts_count__gt=1).values_list('session_key', flat=True)
+    )
+
+    for session_key in duplicated_session_keys:
+        *duplicate_carts, cart = Cart.objects.filter(session_key=session_key).order_by('created_at', 'id')
+        cart_items = {(cart_item.menu_item_id, cart_item.additions_fingerprint): cart_item for cart_item in cart.items.all()}
+
+        for duplicate_cart in duplicate_carts:
+            for cart_item in duplicate_cart.items.all():
+                key = (cart_item.menu_item_id, cart_item.additions_fingerprint)
+
+                if key in cart_items:
+                    cart_items[key].count += cart_item.count
+                    cart_items[key].save(update_fields=['count'])
+                else:
+                    cart_item.cart = cart
+                    cart_item.save(update_fields=['cart'])
+                    cart_items[key] = cart_item
+
+        Cart.objects.filter(id__in=[duplicate_cart.id for duplicate_cart in duplicate_carts]).delete()
+
+        cart.total_amount = sum(cart_item.unit_price * cart_item.count for cart_item in cart_items.values())
+        cart.save(update_fields=['total_amount'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0011_cart_item_additions_fingerprint'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_carts, migrations.RunPython.noop),
+    ]
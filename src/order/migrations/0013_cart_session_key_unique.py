@@ -0,0 +1,22 @@
+# Generated by Django 3.2.6 on 2026-10-18 10:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0012_merge_duplicate_carts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cart',
+            name='session_key',
+            field=models.CharField(max_length=40, unique=True, verbose_name='Session key'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['session_key', 'is_rejected', 'created_at'], name='order_order_session_6a1afe_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 3.2.6 on 2026-10-18 12:05
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import DecimalField, ExpressionWrapper, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_total_amounts(apps, schema_editor):
+    Order = apps.get_model('order', 'Order')
+    OrderItem = apps.get_model('order', 'OrderItem')
+    AdditionItem = apps.get_model('order', 'AdditionItem')
+
+    additions_amount = AdditionItem.objects.filter(order_item=OuterRef('pk')).values('order_item').annotate(sum=Sum('price')).values('sum')
+    OrderItem.objects.update(total_amount=ExpressionWrapper(
+        (F('price') + Coalesce(Subquery(additions_amount), Value(Decimal(0)))) * F('count'),
+        output_field=DecimalField(max_digits=10, decimal_places=0)
+    ))
+
+    items_amount = OrderItem.objects.filter(order=OuterRef('pk')).values('order').annotate(sum=Sum('total_amount')).values('sum')
+    Order.objects.update(total_amount=Coalesce(Subquery(items_amount), Value(Decimal(0))))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0013_cart_session_key_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='total_amount',
+            field=models.DecimalField(decimal_places=0, default=0, max_digits=10, verbose_name='Total amount'),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='total_amount',
+            field=models.DecimalField(decimal_places=0, default=0, max_digits=10, verbose_name='Total amount'),
+        ),
+        migrations.RunPython(fill_total_amounts, migrations.RunPython.noop),
+    ]
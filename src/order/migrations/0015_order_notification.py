@@ -0,0 +1,36 @@
+# Generated by Django 3.2.6 on 2026-10-18 11:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0014_order_total_amount'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('SENT', 'Sent'), ('FAILED', 'Failed')], default='PENDING', max_length=50, verbose_name='Status')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Attempts')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Next attempt at')),
+                ('last_error', models.TextField(blank=True, null=True, verbose_name='Last error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='order.order', verbose_name='Order')),
+            ],
+            options={
+                'verbose_name': 'Order notification',
+                'verbose_name_plural': 'Order notifications',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='ordernotification',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='order_order_status_109694_idx'),
+        ),
+    ]
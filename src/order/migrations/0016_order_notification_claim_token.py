@@ -0,0 +1,18 @@
+# Generated by Django 3.2.6 on 2026-10-18 11:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0015_order_notification'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ordernotification',
+            name='claim_token',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=32, null=True, verbose_name='Claim token'),
+        ),
+    ]
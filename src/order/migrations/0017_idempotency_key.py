@@ -0,0 +1,35 @@
+# Generated by Django 3.2.6 on 2026-10-18 11:45
+
+from django.db import migrations, models
+import rest_framework.utils.encoders
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0016_order_notification_claim_token'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('session_key', models.CharField(max_length=40, verbose_name='Session key')),
+                ('path', models.CharField(max_length=255, verbose_name='Path')),
+                ('key', models.CharField(max_length=255, verbose_name='Key')),
+                ('data_hash', models.CharField(max_length=64, verbose_name='Request data hash')),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Response status code')),
+                ('response_data', models.JSONField(blank=True, encoder=rest_framework.utils.encoders.JSONEncoder, null=True, verbose_name='Response data')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Created at')),
+            ],
+            options={
+                'verbose_name': 'Idempotency key',
+                'verbose_name_plural': 'Idempotency keys',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='idempotencykey',
+            constraint=models.UniqueConstraint(fields=('session_key', 'path', 'key'), name='unique_idempotency_key'),
+        ),
+    ]
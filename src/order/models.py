@@ -2,16 +2,20 @@ from decimal import Decimal
 
 from django.core.validators import MinValueValidator, DecimalValidator
 from django.db import models
-from django.db.models import Sum, F
+from django.db.models import F
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _, pgettext_lazy, gettext
+from rest_framework.utils.encoders import JSONEncoder
 
-from order.constants import DeliveryMethods, OrderTransactionTypes, OrderTransactionStatuses
+from order.constants import DeliveryMethods, OrderTransactionTypes, OrderTransactionStatuses, OrderNotificationStatuses
+from order.utils import get_additions_fingerprint
 from order.validators import phone_number_validator
 from order.constants import PaymentMethods
 
 
 class Cart(models.Model):
-    session_key = models.CharField(verbose_name=_('Session key'), max_length=40)
+    session_key = models.CharField(verbose_name=_('Session key'), max_length=40, unique=True)
+    total_amount = models.DecimalField(verbose_name=_('Total amount'), max_digits=10, decimal_places=0, default=0)
 
     created_at = models.DateTimeField(verbose_name=_('Created at'), auto_now_add=True)
     updated_at = models.DateTimeField(verbose_name=_('Updated at'), auto_now=True)
@@ -23,12 +27,10 @@ class Cart(models.Model):
     def __str__(self):
         return gettext('Cart %(id)i') % {'id': self.id}
 
-    @property
-    def total_amount(self):
-        return sum(item.total_amount for item in self.items.all())
-
     def clear(self):
         self.items.all().delete()
+        self.total_amount = 0
+        self.save(update_fields=('total_amount', 'updated_at'))
 
 
 class CartItem(models.Model):
@@ -36,7 +38,9 @@ class CartItem(models.Model):
     menu_item = models.ForeignKey('menu.MenuItem', verbose_name=_('Menu item'), related_name='cart_items', on_delete=models.CASCADE)
 
     count = models.PositiveSmallIntegerField(verbose_name=_('Count'), default=0)
+    unit_price = models.DecimalField(verbose_name=_('Unit price'), max_digits=8, decimal_places=0, default=0)
     additions = models.ManyToManyField('menu.Addition', verbose_name=_('Additions'), related_name='cart_items', help_text=_("Hold down \"Control\", or \"Command\" on a Mac, to select more than one."))
+    additions_fingerprint = models.CharField(verbose_name=_('Additions fingerprint'), max_length=40, default=get_additions_fingerprint(()), editable=False)
 
     created_at = models.DateTimeField(verbose_name=_('Created at'), auto_now_add=True)
     updated_at = models.DateTimeField(verbose_name=_('Updated at'), auto_now=True)
@@ -44,6 +48,9 @@ class CartItem(models.Model):
     class Meta:
         verbose_name = _('Cart item')
         verbose_name_plural = _('Cart items')
+        indexes = [
+            models.Index(fields=('cart', 'menu_item', 'additions_fingerprint')),
+        ]
 
     def __str__(self):
         if self.menu_item.volume:
@@ -56,7 +63,7 @@ class CartItem(models.Model):
 
     @property
     def total_amount(self):
-        return Decimal((self.menu_item.price + (self.additions.aggregate(sum=Sum('price'))['sum'] or 0)) * self.count)
+        return self.unit_price * self.count
 
 
 class Customer(models.Model):
@@ -98,20 +105,21 @@ class Order(models.Model):
 
     is_rejected = models.BooleanField(verbose_name=_('Rejected'), default=False)
 
+    total_amount = models.DecimalField(verbose_name=_('Total amount'), max_digits=10, decimal_places=0, default=0)
+
     created_at = models.DateTimeField(verbose_name=_('Created at'), auto_now_add=True)
     updated_at = models.DateTimeField(verbose_name=_('Updated at'), auto_now=True)
 
     class Meta:
         verbose_name = _('Order')
         verbose_name_plural = _('Orders')
+        indexes = [
+            models.Index(fields=('session_key', 'is_rejected', 'created_at')),
+        ]
 
     def __str__(self):
         return gettext('Order %(id)i') % {'id': self.id}
 
-    @property
-    def total_amount(self):
-        return sum(item.total_amount for item in self.items.all())
-
     def is_payment_required(self):
         return self.prepayment_required or (self.payment_method in [PaymentMethods.LIQPAY])
 
@@ -189,6 +197,8 @@ class OrderItem(models.Model):
 
     volume = models.CharField(verbose_name=_('Volume'), max_length=50, null=True, blank=True)
 
+    total_amount = models.DecimalField(verbose_name=_('Total amount'), max_digits=10, decimal_places=0, default=0)
+
     created_at = models.DateTimeField(verbose_name=_('Created at'), auto_now_add=True)
     updated_at = models.DateTimeField(verbose_name=_('Updated at'), auto_now=True)
 
@@ -205,10 +215,6 @@ class OrderItem(models.Model):
 
         return gettext('Order item "%(item_title)s"') % {'item_title': self.title}
 
-    @property
-    def total_amount(self):
-        return Decimal((self.price + (self.addition_items.aggregate(sum=Sum('price'))['sum'] or 0)) * self.count)
-
 
 class AdditionItem(models.Model):
     order_item = models.ForeignKey(OrderItem, verbose_name=_('Order item'), related_name='addition_items', on_delete=models.CASCADE)
@@ -226,3 +232,57 @@ class AdditionItem(models.Model):
 
     def __str__(self):
         return gettext('Addition item "%(title)s"') % {'title': self.title}
+
+
+class OrderNotification(models.Model):
+    order = models.ForeignKey(Order, verbose_name=_('Order'), related_name='notifications', on_delete=models.CASCADE)
+
+    class Statuses(models.TextChoices):
+        PENDING = (OrderNotificationStatuses.PENDING, _('Pending'))
+        SENT = (OrderNotificationStatuses.SENT, _('Sent'))
+        FAILED = (OrderNotificationStatuses.FAILED, _('Failed'))
+
+    status = models.CharField(verbose_name=_('Status'), max_length=50, choices=Statuses.choices, default=Statuses.PENDING)
+
+    attempts = models.PositiveSmallIntegerField(verbose_name=_('Attempts'), default=0)
+    next_attempt_at = models.DateTimeField(verbose_name=_('Next attempt at'), default=timezone.now)
+    last_error = models.TextField(verbose_name=_('Last error'), null=True, blank=True)
+    claim_token = models.CharField(verbose_name=_('Claim token'), max_length=32, null=True, blank=True, editable=False, db_index=True)
+
+    created_at = models.DateTimeField(verbose_name=_('Created at'), auto_now_add=True)
+    updated_at = models.DateTimeField(verbose_name=_('Updated at'), auto_now=True)
+
+    class Meta:
+        verbose_name = _('Order notification')
+        verbose_name_plural = _('Order notifications')
+        indexes = [
+            models.Index(fields=('status', 'next_attempt_at')),
+        ]
+
+    def __str__(self):
+        return gettext('Notification ID %(id)i (Order ID %(order_id)i)') % {
+            'id': self.id,
+            'order_id': self.order_id,
+        }
+
+
+class IdempotencyKey(models.Model):
+    session_key = models.CharField(verbose_name=_('Session key'), max_length=40)
+    path = models.CharField(verbose_name=_('Path'), max_length=255)
+    key = models.CharField(verbose_name=_('Key'), max_length=255)
+
+    data_hash = models.CharField(verbose_name=_('Request data hash'), max_length=64)
+    status_code = models.PositiveSmallIntegerField(verbose_name=_('Response status code'), null=True, blank=True)
+    response_data = models.JSONField(verbose_name=_('Response data'), encoder=JSONEncoder, null=True, blank=True)
+
+    created_at = models.DateTimeField(verbose_name=_('Created at'), auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = _('Idempotency key')
+        verbose_name_plural = _('Idempotency keys')
+        constraints = [
+            models.UniqueConstraint(fields=('session_key', 'path', 'key'), name='unique_idempotency_key'),
+        ]
+
+    def __str__(self):
+        return self.key
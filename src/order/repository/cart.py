@@ -1,7 +1,21 @@
-from django.db.models import F
+import datetime as dt
+from decimal import Decimal
 
-from common.utils import get_exact_match
+from uuid import uuid4
+
+import pytz
+from django.core.cache import cache
+from django.db import transaction, connections, router
+from django.db.models import F, Q, Sum, Subquery, OuterRef, DecimalField, ExpressionWrapper, Value
+from django.db.models.functions import Coalesce
+
+from common.utils import get_utc_now, get_local_now, can_return_rows_from_update, update_returning, delete_in_batches
+from menu.models import MenuItem
 from order.models import Cart, CartItem
+from order.utils import get_additions_fingerprint
+
+CART_SUMMARY_SESSION_KEY = 'cart_summary'
+CART_SUMMARY_VERSION_CACHE_KEY = 'cart_summary:version'
 
 
 def get_or_create_cart(session_key):
@@ -9,45 +23,137 @@ def get_or_create_cart(session_key):
 
 
 def get_cart(session_key):
-    return Cart.objects.filter(session_key=session_key).order_by('created_at').last()
+    if session_key is None:
+        return None
+
+    return Cart.objects.filter(session_key=session_key).first()
 
 
 def cart_items_count(cart):
     return cart.items.count()
 
 
+def get_cart_item_unit_price(menu_item, additions):
+    return menu_item.price + sum(addition.price for addition in additions)
+
+
+def change_cart_total_amount(cart, amount):
+    Cart.objects.filter(id=cart.id).update(total_amount=F('total_amount') + amount, updated_at=get_utc_now())
+    cart.refresh_from_db(fields=('total_amount', 'updated_at'))
+
+
 def add_menu_item_to_cart(cart, menu_item, additions, count):
-    cart_item = get_exact_match(CartItem, 'additions', additions.values_list('id', flat=True)).filter(
-        cart=cart,
-        menu_item=menu_item,
-    ).first()
+    additions = list(additions)
+    additions_fingerprint = get_additions_fingerprint(addition.id for addition in additions)
 
-    if cart_item is None:
-        cart_item = CartItem.objects.create(
+    with transaction.atomic():
+        cart_item = CartItem.objects.filter(
             cart=cart,
-            menu_item=menu_item
-        )
-        cart_item.additions.add(*additions)
+            menu_item=menu_item,
+            additions_fingerprint=additions_fingerprint,
+        ).first()
+
+        if cart_item is None:
+            cart_item = CartItem.objects.create(
+                cart=cart,
+                menu_item=menu_item,
+                unit_price=get_cart_item_unit_price(menu_item, additions),
+                additions_fingerprint=additions_fingerprint,
+            )
+            cart_item.additions.add(*additions)
+
+        cart_item.count = F('count') + count
+        cart_item.save()
+        change_cart_total_amount(cart, cart_item.unit_price * count)
 
-    cart_item.count = F('count') + count
-    cart_item.save()
     return cart_item
 
 
-def get_menu_items_in_cart(session_key):
-    cart = get_cart(session_key)
+def change_cart_item_count(cart, cart_item, count):
+    if not can_return_rows_from_update(connections[router.db_for_write(CartItem)]):
+        with transaction.atomic():
+            CartItem.objects.filter(id=cart_item.id).update(count=F('count') + count, updated_at=get_utc_now())
+            cart_item.refresh_from_db(fields=('count', 'updated_at'))
+            change_cart_total_amount(cart, cart_item.unit_price * count)
 
-    if cart is None:
-        return set()
+        return
+
+    now = get_utc_now()
+
+    with transaction.atomic():
+        cart_item_values = update_returning(CartItem, cart_item.id, {'count': count}, {'updated_at': now}, ('count', 'unit_price'))
+
+        # the row may have been deleted concurrently, refresh_from_db raises the same error on the fallback path
+        if cart_item_values is None:
+            raise CartItem.DoesNotExist('CartItem matching query does not exist.')
+
+        cart_values = update_returning(Cart, cart.id, {'total_amount': cart_item_values['unit_price'] * count}, {'updated_at': now}, ('total_amount',))
+
+        if cart_values is None:
+            raise Cart.DoesNotExist('Cart matching query does not exist.')
+
+    cart_item.count, cart_item.unit_price, cart_item.updated_at = cart_item_values['count'], cart_item_values['unit_price'], now
+    cart.total_amount, cart.updated_at = cart_values['total_amount'], now
+
+
+def remove_cart_item_from_cart(cart, cart_item):
+    with transaction.atomic():
+        cart_item.delete()
+        change_cart_total_amount(cart, -cart_item.total_amount)
+
+
+def remove_addition_from_cart_item(cart, cart_item, addition):
+    with transaction.atomic():
+        cart_item.additions.remove(addition)
+        CartItem.objects.filter(id=cart_item.id).update(
+            unit_price=F('unit_price') - addition.price,
+            additions_fingerprint=get_additions_fingerprint(cart_item.additions.values_list('id', flat=True)),
+            updated_at=get_utc_now(),
+        )
+        cart_item.refresh_from_db(fields=('count', 'unit_price', 'additions_fingerprint', 'updated_at'))
+        change_cart_total_amount(cart, -addition.price * cart_item.count)
+
+
+def recalculate_cart_items_prices(cart_items):
+    menu_item_price = MenuItem.objects.filter(id=OuterRef('menu_item_id')).values('price')
+    additions_price = CartItem.additions.through.objects.filter(cartitem_id=OuterRef('id')).values('cartitem_id').annotate(
+        sum=Sum('addition__price'),
+    ).values('sum')
+
+    with transaction.atomic():
+        cart_ids = set(cart_items.values_list('cart_id', flat=True))
+
+        if not cart_ids:
+            return
+
+        CartItem.objects.filter(id__in=cart_items.values('id')).update(
+            unit_price=Subquery(menu_item_price) + Coalesce(Subquery(additions_price), Value(0), output_field=DecimalField())
+        )
+        recalculate_carts_total_amounts(Cart.objects.filter(id__in=cart_ids))
+
+
+def recalculate_cart_items_fingerprints(cart_items):
+    for cart_item in cart_items.prefetch_related('additions'):
+        additions_fingerprint = get_additions_fingerprint(addition.id for addition in cart_item.additions.all())
+        CartItem.objects.filter(id=cart_item.id).update(additions_fingerprint=additions_fingerprint)
+
+
+def recalculate_carts_total_amounts(carts):
+    cart_items_total_amount = CartItem.objects.filter(cart_id=OuterRef('id')).values('cart_id').annotate(
+        sum=Sum(ExpressionWrapper(F('unit_price') * F('count'), output_field=DecimalField())),
+    ).values('sum')
 
-    return set(cart.items.values_list('menu_item_id', flat=True))
+    carts.update(
+        total_amount=Coalesce(Subquery(cart_items_total_amount), Value(0), output_field=DecimalField()),
+        updated_at=get_utc_now(),
+    )
 
+    # carts changed outside of their sessions, so the summaries stored in them are stale now
+    transaction.on_commit(invalidate_cart_summaries)
 
-def get_cart_total_amount(session_key):
-    cart = get_cart(session_key)
 
-    if cart is not None:
-        return cart.total_amount
+def get_cart_menu_item_counts(cart):
+    return dict(cart.items.order_by().values('menu_item_id').annotate(menu_item_count=Sum('count')).values_list('menu_item_id', 'menu_item_count'))
 
 
 def get_cart_item_by_id(cart_id, cart_item_id):
@@ -59,15 +165,97 @@ def get_cart_item_addition_by_id(cart_item, addition_id):
 
 
 def exclude_cart_items_from_cart_by_time_restrictions(cart):
-    cart_items_to_exclude = []
+    now_time = get_local_now().time()
+    excluded_cart_items = list(cart.items.select_related('menu_item').filter(
+        Q(menu_item__category__from_time__gte=now_time) | Q(menu_item__category__to_time__lte=now_time)
+    ))
 
-    for cart_item in cart.items.all():
-        category = cart_item.menu_item.category
+    if excluded_cart_items:
+        with transaction.atomic():
+            CartItem.objects.filter(id__in=[cart_item.id for cart_item in excluded_cart_items]).delete()
+            change_cart_total_amount(cart, -sum(cart_item.total_amount for cart_item in excluded_cart_items))
 
-        if not category.can_order_now():
-            cart_items_to_exclude.append(cart_item)
+    return excluded_cart_items
 
-    CartItem.objects.filter(id__in=[cart_item.id for cart_item in cart_items_to_exclude]).delete()
 
-    excluded_cart_items = cart_items_to_exclude
-    return excluded_cart_items
+def delete_abandoned_carts(max_age, batch_size, pause=0):
+    abandoned_carts = Cart.objects.filter(updated_at__lt=get_utc_now() - dt.timedelta(seconds=max_age))
+    deleted_count = delete_in_batches(abandoned_carts, batch_size, pause)
+
+    if deleted_count:
+        invalidate_cart_summaries()
+
+    return deleted_count
+
+
+def get_cart_summary_version():
+    version = cache.get(CART_SUMMARY_VERSION_CACHE_KEY)
+
+    if version is None:
+        cache.add(CART_SUMMARY_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        version = cache.get(CART_SUMMARY_VERSION_CACHE_KEY)
+
+    return version
+
+
+def invalidate_cart_summaries():
+    cache.set(CART_SUMMARY_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+
+def is_cart_summary_stale(session):
+    cart_summary = session.get(CART_SUMMARY_SESSION_KEY)
+    return cart_summary is not None and cart_summary.get('version') != get_cart_summary_version()
+
+
+def set_cart_summary(session, menu_item_counts, total_amount):
+    menu_items = {str(menu_item_id): count for menu_item_id, count in menu_item_counts.items() if count > 0}
+    cart_summary = session.get(CART_SUMMARY_SESSION_KEY)
+    version = get_cart_summary_version()
+
+    if cart_summary is not None and cart_summary['menu_items'] == menu_items and \
+            cart_summary['total_amount'] == str(total_amount) and cart_summary.get('version') == version:
+        return
+
+    session[CART_SUMMARY_SESSION_KEY] = {
+        'menu_items': menu_items,
+        'total_amount': str(total_amount),
+        'updated_at': get_utc_now().timestamp(),
+        'version': version,
+    }
+
+
+def change_cart_summary(session, total_amount, menu_item_id=None, count=0):
+    cart_summary = session.get(CART_SUMMARY_SESSION_KEY)
+    menu_items = dict(cart_summary['menu_items']) if cart_summary is not None else {}
+
+    if menu_item_id is not None:
+        menu_items[str(menu_item_id)] = menu_items.get(str(menu_item_id), 0) + count
+
+    set_cart_summary(session, menu_items, total_amount)
+
+
+def clear_cart_summary(session):
+    set_cart_summary(session, {}, 0)
+
+
+def get_menu_items_in_cart(session):
+    cart_summary = session.get(CART_SUMMARY_SESSION_KEY)
+
+    if cart_summary is None:
+        return set()
+
+    return {int(menu_item_id) for menu_item_id in cart_summary['menu_items']}
+
+
+def get_cart_total_amount(session):
+    cart_summary = session.get(CART_SUMMARY_SESSION_KEY)
+
+    if cart_summary is not None:
+        return Decimal(cart_summary['total_amount'])
+
+
+def get_cart_updated_at(session):
+    cart_summary = session.get(CART_SUMMARY_SESSION_KEY)
+
+    if cart_summary is not None:
+        return dt.datetime.fromtimestamp(cart_summary['updated_at'], tz=pytz.UTC)
@@ -0,0 +1,348 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from menu.models import MenuItem, Addition
+from order.repository import cart as cart_repository
+
+CART_SESSION_KEY = 'cart'
+
+
+def get_cart_storage(session):
+    return import_string(settings.CART_STORAGE)(session)
+
+
+class BaseCartStorage:
+
+    def __init__(self, session):
+        self.session = session
+
+    def get_cart(self):
+        raise NotImplementedError
+
+    def get_or_create_cart(self):
+        raise NotImplementedError
+
+    def get_cart_item(self, cart, cart_item_id):
+        raise NotImplementedError
+
+    def get_cart_item_addition(self, cart_item, addition_id):
+        raise NotImplementedError
+
+    def cart_items_count(self, cart):
+        raise NotImplementedError
+
+    def add_menu_item_to_cart(self, cart, menu_item, additions, count):
+        raise NotImplementedError
+
+    def change_cart_item_count(self, cart, cart_item, count):
+        raise NotImplementedError
+
+    def remove_cart_item_from_cart(self, cart, cart_item):
+        raise NotImplementedError
+
+    def remove_addition_from_cart_item(self, cart, cart_item, addition):
+        raise NotImplementedError
+
+    def clear_cart(self, cart):
+        raise NotImplementedError
+
+    def exclude_cart_items_from_cart_by_time_restrictions(self, cart):
+        raise NotImplementedError
+
+    def get_menu_item_counts(self, cart):
+        raise NotImplementedError
+
+    def update_cart_summary(self, cart):
+        cart_repository.set_cart_summary(self.session, self.get_menu_item_counts(cart), cart.total_amount)
+
+    def refresh_cart_summary(self):
+        if not cart_repository.is_cart_summary_stale(self.session):
+            return
+
+        cart = self.get_cart()
+
+        if cart is None:
+            cart_repository.clear_cart_summary(self.session)
+        else:
+            self.update_cart_summary(cart)
+
+
+class DatabaseCartStorage(BaseCartStorage):
+
+    def get_cart(self):
+        return cart_repository.get_cart(self.session.session_key)
+
+    def get_or_create_cart(self):
+        cart, created = cart_repository.get_or_create_cart(self.session.session_key)
+        return cart
+
+    def get_cart_item(self, cart, cart_item_id):
+        return cart_repository.get_cart_item_by_id(cart.id, cart_item_id)
+
+    def get_cart_item_addition(self, cart_item, addition_id):
+        return cart_repository.get_cart_item_addition_by_id(cart_item, addition_id)
+
+    def cart_items_count(self, cart):
+        return cart_repository.cart_items_count(cart)
+
+    def add_menu_item_to_cart(self, cart, menu_item, additions, count):
+        cart_item = cart_repository.add_menu_item_to_cart(cart, menu_item, additions, count)
+        cart_repository.change_cart_summary(self.session, cart.total_amount, menu_item.id, count)
+        return cart_item
+
+    def change_cart_item_count(self, cart, cart_item, count):
+        cart_repository.change_cart_item_count(cart, cart_item, count)
+        cart_repository.change_cart_summary(self.session, cart.total_amount, cart_item.menu_item_id, count)
+
+    def remove_cart_item_from_cart(self, cart, cart_item):
+        cart_repository.remove_cart_item_from_cart(cart, cart_item)
+        cart_repository.change_cart_summary(self.session, cart.total_amount, cart_item.menu_item_id, -cart_item.count)
+
+    def remove_addition_from_cart_item(self, cart, cart_item, addition):
+        cart_repository.remove_addition_from_cart_item(cart, cart_item, addition)
+        cart_repository.change_cart_summary(self.session, cart.total_amount)
+
+    def clear_cart(self, cart):
+        cart.clear()
+        cart_repository.clear_cart_summary(self.session)
+
+    def exclude_cart_items_from_cart_by_time_restrictions(self, cart):
+        return cart_repository.exclude_cart_items_from_cart_by_time_restrictions(cart)
+
+    def get_menu_item_counts(self, cart):
+        return cart_repository.get_cart_menu_item_counts(cart)
+
+
+class SessionCartItemAdditions:
+
+    def __init__(self, cart_item):
+        self.cart_item = cart_item
+
+    def all(self):
+        if self.cart_item.loaded_additions is None:
+            self.cart_item.loaded_additions = list(Addition.objects.filter(id__in=self.cart_item.addition_ids))
+
+        return self.cart_item.loaded_additions
+
+
+class SessionCartItem:
+
+    def __init__(self, data, menu_item=None, additions=None):
+        self.data = data
+        self.loaded_menu_item = menu_item
+        self.loaded_additions = additions
+        self.additions = SessionCartItemAdditions(self)
+
+    @property
+    def id(self):
+        return self.data['id']
+
+    @property
+    def menu_item_id(self):
+        return self.data['menu_item_id']
+
+    @property
+    def addition_ids(self):
+        return self.data['addition_ids']
+
+    @property
+    def count(self):
+        return self.data['count']
+
+    @property
+    def unit_price(self):
+        return Decimal(self.data['unit_price'])
+
+    @property
+    def total_amount(self):
+        return self.unit_price * self.count
+
+    @property
+    def menu_item(self):
+        if self.loaded_menu_item is None:
+            self.loaded_menu_item = MenuItem.objects.select_related('category').filter(id=self.menu_item_id).first()
+
+        return self.loaded_menu_item
+
+
+class SessionCartItems:
+
+    def __init__(self, cart):
+        self.cart = cart
+        self.loaded_items = None
+
+    def all(self):
+        if self.loaded_items is None:
+            self.loaded_items = self.cart.load_items()
+
+        return self.loaded_items
+
+    def count(self):
+        return len(self.cart.data['items'])
+
+    def select_related(self, *fields):
+        return self
+
+    def prefetch_related(self, *lookups):
+        return self
+
+    def __iter__(self):
+        return iter(self.all())
+
+
+class SessionCart:
+
+    def __init__(self, session, data):
+        self.session = session
+        self.data = data
+        self.items = SessionCartItems(self)
+
+    @property
+    def total_amount(self):
+        return Decimal(self.data['total_amount'])
+
+    @total_amount.setter
+    def total_amount(self, value):
+        self.data['total_amount'] = str(value)
+
+    def get_item_data(self, cart_item_id):
+        return next((item_data for item_data in self.data['items'] if item_data['id'] == cart_item_id), None)
+
+    def load_items(self):
+        menu_items = MenuItem.objects.select_related('category').in_bulk({item_data['menu_item_id'] for item_data in self.data['items']})
+        additions = Addition.objects.in_bulk({addition_id for item_data in self.data['items'] for addition_id in item_data['addition_ids']})
+        cart_items = []
+
+        for item_data in self.data['items']:
+            menu_item = menu_items.get(item_data['menu_item_id'])
+
+            if menu_item is None:
+                continue
+
+            item_additions = [additions[addition_id] for addition_id in item_data['addition_ids'] if addition_id in additions]
+            item_data.update({
+                'addition_ids': [addition.id for addition in item_additions],
+                'unit_price': str(cart_repository.get_cart_item_unit_price(menu_item, item_additions)),
+            })
+            cart_items.append(SessionCartItem(item_data, menu_item=menu_item, additions=item_additions))
+
+        self.data['items'] = [cart_item.data for cart_item in cart_items]
+        self.update_total_amount()
+        self.save()
+
+        return cart_items
+
+    def update_total_amount(self):
+        self.total_amount = sum((Decimal(item_data['unit_price']) * item_data['count'] for item_data in self.data['items']), Decimal(0))
+
+    def save(self):
+        self.session[CART_SESSION_KEY] = self.data
+        self.session.modified = True
+
+    def clear(self):
+        self.data['items'] = []
+        self.total_amount = 0
+        self.items.loaded_items = None
+
+    def delete(self):
+        self.session.pop(CART_SESSION_KEY, None)
+
+
+class SessionCartStorage(BaseCartStorage):
+
+    def get_cart(self):
+        data = self.session.get(CART_SESSION_KEY)
+
+        if data is not None:
+            return SessionCart(self.session, data)
+
+    def get_or_create_cart(self):
+        return self.get_cart() or SessionCart(self.session, {'next_id': 1, 'items': [], 'total_amount': '0'})
+
+    def get_cart_item(self, cart, cart_item_id):
+        item_data = cart.get_item_data(cart_item_id)
+
+        if item_data is not None:
+            return SessionCartItem(item_data)
+
+    def get_cart_item_addition(self, cart_item, addition_id):
+        if addition_id in cart_item.addition_ids:
+            return Addition.objects.filter(id=addition_id).first()
+
+    def cart_items_count(self, cart):
+        return cart.items.count()
+
+    def add_menu_item_to_cart(self, cart, menu_item, additions, count):
+        additions = list(additions)
+        addition_ids = sorted(addition.id for addition in additions)
+        item_data = next((
+            item_data for item_data in cart.data['items']
+            if item_data['menu_item_id'] == menu_item.id and item_data['addition_ids'] == addition_ids
+        ), None)
+
+        if item_data is None:
+            item_data = {
+                'id': cart.data['next_id'],
+                'menu_item_id': menu_item.id,
+                'addition_ids': addition_ids,
+                'count': 0,
+                'unit_price': str(cart_repository.get_cart_item_unit_price(menu_item, additions)),
+            }
+            cart.data['next_id'] += 1
+            cart.data['items'].append(item_data)
+
+        item_data['count'] += count
+        cart.update_total_amount()
+        cart.save()
+        cart_repository.change_cart_summary(self.session, cart.total_amount, menu_item.id, count)
+
+        return SessionCartItem(item_data, menu_item=menu_item, additions=additions)
+
+    def change_cart_item_count(self, cart, cart_item, count):
+        cart_item.data['count'] += count
+        cart.update_total_amount()
+        cart.save()
+        cart_repository.change_cart_summary(self.session, cart.total_amount, cart_item.menu_item_id, count)
+
+    def remove_cart_item_from_cart(self, cart, cart_item):
+        cart.data['items'] = [item_data for item_data in cart.data['items'] if item_data['id'] != cart_item.id]
+        cart.update_total_amount()
+        cart.save()
+        cart_repository.change_cart_summary(self.session, cart.total_amount, cart_item.menu_item_id, -cart_item.count)
+
+    def remove_addition_from_cart_item(self, cart, cart_item, addition):
+        cart_item.data.update({
+            'addition_ids': [addition_id for addition_id in cart_item.addition_ids if addition_id != addition.id],
+            'unit_price': str(cart_item.unit_price - addition.price),
+        })
+        cart_item.loaded_additions = None
+        cart.update_total_amount()
+        cart.save()
+        cart_repository.change_cart_summary(self.session, cart.total_amount)
+
+    def clear_cart(self, cart):
+        cart.clear()
+        cart.save()
+        cart_repository.clear_cart_summary(self.session)
+
+    def exclude_cart_items_from_cart_by_time_restrictions(self, cart):
+        excluded_cart_items = [cart_item for cart_item in cart.items.all() if not cart_item.menu_item.category.can_order_now()]
+
+        if excluded_cart_items:
+            excluded_ids = {cart_item.id for cart_item in excluded_cart_items}
+            cart.data['items'] = [item_data for item_data in cart.data['items'] if item_data['id'] not in excluded_ids]
+            cart.items.loaded_items = [cart_item for cart_item in cart.items.all() if cart_item.id not in excluded_ids]
+            cart.update_total_amount()
+            cart.save()
+
+        return excluded_cart_items
+
+    def get_menu_item_counts(self, cart):
+        menu_item_counts = {}
+
+        for item_data in cart.data['items']:
+            menu_item_counts[item_data['menu_item_id']] = menu_item_counts.get(item_data['menu_item_id'], 0) + item_data['count']
+
+        return menu_item_counts
@@ -0,0 +1,27 @@
+import datetime as dt
+
+from django.db import transaction, IntegrityError
+
+from common.utils import get_utc_now, delete_in_batches
+from order.models import IdempotencyKey
+
+
+def claim_idempotency_key(session_key, path, key, data_hash):
+    # must run inside the request transaction, the claim is committed or rolled back together with the request changes
+    try:
+        with transaction.atomic():
+            return IdempotencyKey.objects.create(session_key=session_key, path=path, key=key, data_hash=data_hash), True
+
+    except IntegrityError:
+        return IdempotencyKey.objects.filter(session_key=session_key, path=path, key=key).first(), False
+
+
+def store_idempotency_key_response(idempotency_key, status_code, response_data):
+    idempotency_key.status_code = status_code
+    idempotency_key.response_data = response_data
+    idempotency_key.save(update_fields=('status_code', 'response_data'))
+
+
+def delete_expired_idempotency_keys(max_age, batch_size, pause=0):
+    expired_idempotency_keys = IdempotencyKey.objects.filter(created_at__lt=get_utc_now() - dt.timedelta(seconds=max_age))
+    return delete_in_batches(expired_idempotency_keys, batch_size, pause)
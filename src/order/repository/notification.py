@@ -0,0 +1,55 @@
+import datetime as dt
+from uuid import uuid4
+
+from common.utils import get_utc_now
+from order.constants import OrderNotificationStatuses
+from order.models import OrderNotification
+
+
+def create_new_order_notification(order):
+    return OrderNotification.objects.create(order=order)
+
+
+def claim_due_order_notifications(limit, lease):
+    now = get_utc_now()
+    claim_token = uuid4().hex
+    due_notifications = OrderNotification.objects.filter(status=OrderNotificationStatuses.PENDING, next_attempt_at__lte=now)
+    notification_ids = list(due_notifications.order_by('next_attempt_at').values_list('id', flat=True)[:limit])
+
+    # the due filter is checked again by the UPDATE, so a notification claimed by another worker in between is skipped,
+    # and a worker that dies while sending gives its notifications back once the lease expires
+    due_notifications.filter(id__in=notification_ids).update(
+        claim_token=claim_token,
+        next_attempt_at=now + dt.timedelta(seconds=lease)
+    )
+
+    return list(OrderNotification.objects.select_related('order', 'order__customer').filter(claim_token=claim_token).order_by('id'))
+
+
+def mark_order_notification_as_sent(notification):
+    notification.status = OrderNotificationStatuses.SENT
+    notification.attempts += 1
+    notification.last_error = None
+    notification.claim_token = None
+    notification.save()
+
+
+def mark_order_notification_attempt_as_failed(notification, error, max_attempts, retry_delay):
+    notification.attempts += 1
+    notification.last_error = error
+    notification.claim_token = None
+
+    if notification.attempts >= max_attempts:
+        notification.status = OrderNotificationStatuses.FAILED
+    else:
+        notification.next_attempt_at = get_utc_now() + dt.timedelta(seconds=retry_delay * 2 ** (notification.attempts - 1))
+
+    notification.save()
+
+
+def retry_failed_order_notifications(queryset):
+    return queryset.filter(status=OrderNotificationStatuses.FAILED).update(
+        status=OrderNotificationStatuses.PENDING,
+        attempts=0,
+        next_attempt_at=get_utc_now()
+    )
@@ -1,20 +1,33 @@
+from decimal import Decimal
+
 from django.db import transaction
+from django.db.models import DecimalField, ExpressionWrapper, F, Sum, Value
+from django.db.models.functions import Coalesce
 
 from order.constants import PaymentMethods, OrderTransactionTypes, DeliveryMethods, OrderTransactionStatuses
 from order.models import Order, OrderItem, DeliveryAddress, OrderTransaction, AdditionItem
 from order.repository.customer import get_or_create_customer
+from order.repository.notification import create_new_order_notification
 from settings.repository import get_site_settings
 
 
+def get_order_cart_items(cart):
+    return list(cart.items.select_related('menu_item').prefetch_related('additions'))
+
+
+def get_order_item_total_amount(cart_item):
+    return (cart_item.menu_item.price + sum(addition.price for addition in cart_item.additions.all())) * cart_item.count
+
+
 def create_order_from_cart(session_key, cart, customer, delivery_method, payment_method, peoples_count=None,
-                           customer_comment=None, self_pickup_time=None, site_settings=None):
+                           customer_comment=None, self_pickup_time=None, site_settings=None, total_amount=0):
     site_settings = site_settings or get_site_settings()
     prepayment_required = False
 
     if (
             payment_method in [PaymentMethods.CASH, PaymentMethods.CARD]
             and
-            cart.total_amount >= site_settings.order_prepayment_start_from
+            total_amount >= site_settings.order_prepayment_start_from
     ):
         prepayment_required = True
 
@@ -26,31 +39,54 @@ def create_order_from_cart(session_key, cart, customer, delivery_method, payment
         peoples_count=peoples_count,
         customer_comment=customer_comment,
         payment_method=payment_method,
-        prepayment_required=prepayment_required
+        prepayment_required=prepayment_required,
+        total_amount=total_amount
     )
 
 
-def create_order_items_from_cart(cart, order):
-
-    for cart_item in cart.items.all():
-        order_item = OrderItem(
+def create_order_items_from_cart(cart_items, order):
+    order_items = OrderItem.objects.bulk_create([
+        OrderItem(
             order=order,
             menu_item=cart_item.menu_item,
             title=cart_item.menu_item.title,
             price=cart_item.menu_item.price,
             volume=cart_item.menu_item.volume,
-            count=cart_item.count
+            count=cart_item.count,
+            total_amount=get_order_item_total_amount(cart_item)
         )
-        order_item.save()
+        for cart_item in cart_items
+    ])
+
+    if any(order_item.pk is None for order_item in order_items):
+        # bulk_create does not set primary keys on backends without INSERT ... RETURNING support
+        order_items = list(OrderItem.objects.filter(order=order).order_by('id'))
+
+    AdditionItem.objects.bulk_create([
+        AdditionItem(
+            order_item=order_item,
+            addition=addition,
+            title=addition.title,
+            price=addition.price
+        )
+        for cart_item, order_item in zip(cart_items, order_items)
+        for addition in cart_item.additions.all()
+    ])
 
-        for addition in cart_item.additions.all():
-            addition_item = AdditionItem(
-                order_item=order_item,
-                addition=addition,
-                title=addition.title,
-                price=addition.price
-            )
-            addition_item.save()
+
+def get_order_items_with_drifted_total_amount():
+    calculated_total_amount = ExpressionWrapper(
+        (F('price') + Coalesce(Sum('addition_items__price'), Value(Decimal(0)))) * F('count'),
+        output_field=DecimalField(max_digits=10, decimal_places=0)
+    )
+
+    return OrderItem.objects.annotate(calculated_total_amount=calculated_total_amount).exclude(total_amount=F('calculated_total_amount'))
+
+
+def get_orders_with_drifted_total_amount():
+    calculated_total_amount = Coalesce(Sum('items__total_amount'), Value(Decimal(0)))
+
+    return Order.objects.annotate(calculated_total_amount=calculated_total_amount).exclude(total_amount=F('calculated_total_amount'))
 
 
 def create_delivery_address_for_order(order, settlement, street, building_number, apartment_number=None,
@@ -91,12 +127,14 @@ def create_order_process(session_key, cart, customer_name, phone_number, deliver
 
     with transaction.atomic():
         customer, created = get_or_create_customer(customer_name, phone_number)
+        cart_items = get_order_cart_items(cart)
 
         order = create_order_from_cart(session_key, cart, customer, delivery_method, payment_method,
                                        peoples_count=peoples_count, customer_comment=customer_comment,
-                                       self_pickup_time=self_pickup_time, site_settings=site_settings)
+                                       self_pickup_time=self_pickup_time, site_settings=site_settings,
+                                       total_amount=sum((get_order_item_total_amount(cart_item) for cart_item in cart_items), Decimal(0)))
 
-        create_order_items_from_cart(cart, order)
+        create_order_items_from_cart(cart_items, order)
 
         if delivery_method == DeliveryMethods.COURIER:
             create_delivery_address_for_order(order, settlement, street, building_number, apartment_number=apartment_number,
@@ -105,6 +143,8 @@ def create_order_process(session_key, cart, customer_name, phone_number, deliver
 
         if order.is_payment_required():
             create_order_transaction(order, site_settings=site_settings)
+        else:
+            create_new_order_notification(order)
 
         cart.delete()
 
@@ -112,6 +152,9 @@ def create_order_process(session_key, cart, customer_name, phone_number, deliver
 
 
 def get_order_by_session_key(session_key):
+    if session_key is None:
+        return None
+
     return Order.objects.filter(session_key=session_key, is_rejected=False).order_by('created_at').last()
 
 
@@ -125,7 +168,10 @@ def reject_order(order):
 
 
 def get_order_transaction_by_session_key(session_key):
-    return OrderTransaction.objects.filter(order__session_key=session_key, order__is_rejected=False).order_by('order__created_at').last()
+    if session_key is None:
+        return None
+
+    return OrderTransaction.objects.select_related('order').filter(order__session_key=session_key, order__is_rejected=False).order_by('order__created_at').last()
 
 
 def get_order_transaction_by_order_id(order_id):
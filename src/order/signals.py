@@ -0,0 +1,43 @@
+from django.db.models.signals import post_save, pre_delete, post_delete
+
+from menu.models import MenuItem, Addition
+from order.models import Cart, CartItem
+from order.repository.cart import recalculate_cart_items_prices, recalculate_carts_total_amounts, \
+    recalculate_cart_items_fingerprints
+
+
+def menu_item_saved(sender, instance, **kwargs):
+    recalculate_cart_items_prices(CartItem.objects.filter(menu_item=instance))
+
+
+def addition_saved(sender, instance, **kwargs):
+    recalculate_cart_items_prices(CartItem.objects.filter(additions=instance))
+
+
+def menu_item_deleting(sender, instance, **kwargs):
+    instance.affected_cart_ids = list(CartItem.objects.filter(menu_item=instance).values_list('cart_id', flat=True))
+
+
+def menu_item_deleted(sender, instance, **kwargs):
+    recalculate_carts_total_amounts(Cart.objects.filter(id__in=instance.affected_cart_ids))
+
+
+def addition_deleting(sender, instance, **kwargs):
+    instance.affected_cart_item_ids = list(CartItem.objects.filter(additions=instance).values_list('id', flat=True))
+
+
+def addition_deleted(sender, instance, **kwargs):
+    cart_items = CartItem.objects.filter(id__in=instance.affected_cart_item_ids)
+    recalculate_cart_items_prices(cart_items)
+    recalculate_cart_items_fingerprints(cart_items)
+
+
+def connect_signals():
+    post_save.connect(menu_item_saved, sender=MenuItem, dispatch_uid='recalculate_cart_prices_on_menu_item_save')
+    post_save.connect(addition_saved, sender=Addition, dispatch_uid='recalculate_cart_prices_on_addition_save')
+
+    pre_delete.connect(menu_item_deleting, sender=MenuItem, dispatch_uid='collect_carts_on_menu_item_delete')
+    post_delete.connect(menu_item_deleted, sender=MenuItem, dispatch_uid='recalculate_cart_prices_on_menu_item_delete')
+
+    pre_delete.connect(addition_deleting, sender=Addition, dispatch_uid='collect_cart_items_on_addition_delete')
+    post_delete.connect(addition_deleted, sender=Addition, dispatch_uid='recalculate_cart_prices_on_addition_delete')
@@ -1,10 +1,14 @@
 import datetime as dt
 
 import pytest
+from django.conf import settings
+from django.contrib.sessions.models import Session
 from django.urls import reverse
 
 from common.utils import get_local_now
+from menu.models import Addition
 from order.models import Cart, CartItem
+from order.repository.cart import add_menu_item_to_cart, remove_addition_from_cart_item
 
 
 @pytest.mark.django_db(reset_sequences=True)
@@ -485,3 +489,51 @@ def test_add_to_cart_with_invalid_addition_ids(client, create_menu_item, mocker)
 
     assert len(menu_item_id_errors) == 1
     assert menu_item_id_errors[0].get('code') == 'not_a_list'
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_add_to_cart_matches_cart_item_by_additions_fingerprint(create_cart, create_menu_item, create_menu_item_addition, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    cart = create_cart('test')
+
+    addition1 = create_menu_item_addition()
+    addition2 = create_menu_item_addition()
+    menu_item = create_menu_item(additions=[addition1, addition2])
+
+    cart_item1 = add_menu_item_to_cart(cart, menu_item, Addition.objects.filter(id__in=[addition2.id, addition1.id]), 1)
+    cart_item2 = add_menu_item_to_cart(cart, menu_item, Addition.objects.filter(id=addition1.id), 1)
+    cart_item3 = add_menu_item_to_cart(cart, menu_item, Addition.objects.filter(id__in=[addition1.id, addition2.id]), 1)
+
+    assert cart_item1.id == cart_item3.id
+    assert cart_item1.id != cart_item2.id
+
+    remove_addition_from_cart_item(cart, cart_item1, addition2)
+    cart_item2.refresh_from_db()
+
+    assert cart_item1.additions_fingerprint == cart_item2.additions_fingerprint
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_add_to_cart_creates_session(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    menu_item = create_menu_item(price=10)
+
+    request_data = {
+        'menu_item_id': menu_item.id,
+        'count': 1,
+        'addition_ids': [],
+    }
+
+    assert Session.objects.count() == 0
+
+    response = client.post(reverse('order_api:add_to_cart'), request_data, content_type='application/json')
+
+    assert response.status_code == 200
+
+    session_key = response.cookies[settings.SESSION_COOKIE_NAME].value
+    assert Session.objects.filter(session_key=session_key).exists()
+    assert Cart.objects.get().session_key == session_key
@@ -0,0 +1,151 @@
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+
+from menu.models import Addition
+from order.constants import CartOperations
+from order.models import CartItem
+from order.repository.cart import add_menu_item_to_cart
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_cart_batch_forbidden_for_authenticated_users(client, admin_user):
+    client.force_login(admin_user)
+    response = client.post(reverse('order_api:cart_batch'))
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_cart_batch_cart_not_found(client):
+    request_data = {
+        'operations': [{'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': 1}],
+    }
+    response = client.post(reverse('order_api:cart_batch'), request_data, content_type='application/json')
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_cart_batch(client, create_cart, create_menu_item, create_menu_item_addition, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+
+    addition1 = create_menu_item_addition(price=1)
+    addition2 = create_menu_item_addition(price=2)
+
+    cart = create_cart(session.session_key)
+
+    menu_item1 = create_menu_item(price=10)
+    menu_item2 = create_menu_item(price=20)
+    menu_item3 = create_menu_item(price=30)
+
+    cart_item1 = add_menu_item_to_cart(cart, menu_item1, Addition.objects.all(), 1)
+    cart_item2 = add_menu_item_to_cart(cart, menu_item2, Addition.objects.none(), 3)
+    cart_item3 = add_menu_item_to_cart(cart, menu_item3, Addition.objects.none(), 1)
+
+    request_data = {
+        'operations': [
+            {'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': cart_item1.id},
+            {'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': cart_item1.id},
+            {'operation': CartOperations.REMOVE_ADDITION, 'cart_item_id': cart_item1.id, 'addition_id': addition2.id},
+            {'operation': CartOperations.DECREASE_COUNT, 'cart_item_id': cart_item2.id},
+            {'operation': CartOperations.REMOVE_CART_ITEM, 'cart_item_id': cart_item3.id},
+        ],
+    }
+    response = client.post(reverse('order_api:cart_batch'), request_data, content_type='application/json')
+
+    assert response.status_code == 200
+    assert response.data == {
+        'cart_items': [
+            {'id': cart_item1.id, 'count': 3, 'total_amount': Decimal(33)},
+            {'id': cart_item2.id, 'count': 2, 'total_amount': Decimal(40)},
+        ],
+        'total_amount': Decimal(73),
+    }
+
+    cart.refresh_from_db()
+    assert cart.total_amount == Decimal(73)
+
+    cart_item1.refresh_from_db()
+    assert list(cart_item1.additions.all()) == [addition1]
+
+    assert not CartItem.objects.filter(id=cart_item3.id).exists()
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_cart_batch_decrease_count_not_below_one(client, create_cart, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+
+    cart = create_cart(session.session_key)
+    cart_item = add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 2)
+
+    request_data = {
+        'operations': [{'operation': CartOperations.DECREASE_COUNT, 'cart_item_id': cart_item.id}] * 3,
+    }
+    response = client.post(reverse('order_api:cart_batch'), request_data, content_type='application/json')
+
+    assert response.status_code == 200
+    assert response.data.get('cart_items') == [{'id': cart_item.id, 'count': 1, 'total_amount': Decimal(10)}]
+    assert response.data.get('total_amount') == Decimal(10)
+
+
+@pytest.mark.django_db(reset_sequences=True)
+@pytest.mark.parametrize('operations', [
+    [
+        {'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': 1},
+        {'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': 100},
+    ],
+    [
+        {'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': 1},
+        {'operation': CartOperations.REMOVE_CART_ITEM, 'cart_item_id': 1},
+        {'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': 1},
+    ],
+    [
+        {'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': 1},
+        {'operation': CartOperations.REMOVE_ADDITION, 'cart_item_id': 1, 'addition_id': 1},
+        {'operation': CartOperations.REMOVE_ADDITION, 'cart_item_id': 1, 'addition_id': 1},
+    ],
+])
+def test_cart_batch_not_applied_partially(client, create_cart, create_menu_item, create_menu_item_addition, mocker,
+                                          operations):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+
+    create_menu_item_addition(price=1)
+
+    cart = create_cart(session.session_key)
+    cart_item = add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.all(), 1)
+
+    response = client.post(reverse('order_api:cart_batch'), {'operations': operations}, content_type='application/json')
+
+    assert response.status_code == 404
+
+    cart.refresh_from_db()
+    cart_item.refresh_from_db()
+
+    assert cart.total_amount == Decimal(11)
+    assert cart_item.count == 1
+    assert cart_item.additions.count() == 1
+
+
+@pytest.mark.django_db(reset_sequences=True)
+@pytest.mark.parametrize('request_data,error_field', [
+    ({'operations': []}, 'operations'),
+    ({'operations': [{'operation': 'UNKNOWN', 'cart_item_id': 1}]}, 'operations'),
+    ({'operations': [{'operation': CartOperations.REMOVE_ADDITION, 'cart_item_id': 1}]}, 'operations'),
+])
+def test_cart_batch_validation(client, create_cart, request_data, error_field):
+    session = client.session
+    create_cart(session.session_key)
+
+    response = client.post(reverse('order_api:cart_batch'), request_data, content_type='application/json')
+
+    assert response.status_code == 400
+    assert error_field in response.data
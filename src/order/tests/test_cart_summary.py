@@ -0,0 +1,89 @@
+import datetime as dt
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from common.utils import get_utc_now
+from order.constants import CartOperations
+from order.models import Cart
+from order.repository.cart import CART_SUMMARY_SESSION_KEY, get_menu_items_in_cart, get_cart_total_amount
+
+
+@pytest.fixture(params=[
+    'order.repository.cart_storage.DatabaseCartStorage',
+    'order.repository.cart_storage.SessionCartStorage',
+])
+def cart_storage_setting(request, settings):
+    settings.CART_STORAGE = request.param
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_cart_summary_maintained_on_cart_mutations(client, cart_storage_setting, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    menu_item1 = create_menu_item(price=10, additions_count=1)
+    menu_item2 = create_menu_item(price=20)
+    addition = menu_item1.possible_additions.first()
+
+    for menu_item, addition_ids in ((menu_item1, [addition.id]), (menu_item1, []), (menu_item2, [])):
+        request_data = {
+            'menu_item_id': menu_item.id,
+            'count': 1,
+            'addition_ids': addition_ids,
+        }
+        client.post(reverse('order_api:add_to_cart'), request_data, content_type='application/json')
+
+    assert client.session[CART_SUMMARY_SESSION_KEY]['menu_items'] == {str(menu_item1.id): 2, str(menu_item2.id): 1}
+    assert get_cart_total_amount(client.session) == Decimal(41)
+
+    request_data = {
+        'operations': [
+            {'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': 3},
+            {'operation': CartOperations.REMOVE_ADDITION, 'cart_item_id': 1, 'addition_id': addition.id},
+            {'operation': CartOperations.REMOVE_CART_ITEM, 'cart_item_id': 2},
+        ],
+    }
+    client.post(reverse('order_api:cart_batch'), request_data, content_type='application/json')
+
+    assert client.session[CART_SUMMARY_SESSION_KEY]['menu_items'] == {str(menu_item1.id): 1, str(menu_item2.id): 2}
+    assert get_cart_total_amount(client.session) == Decimal(50)
+
+    client.post(reverse('order_api:remove_cart_item'), {'cart_item_id': 1}, content_type='application/json')
+    assert get_menu_items_in_cart(client.session) == {menu_item2.id}
+
+    client.post(reverse('order_api:clear_cart'))
+    assert get_menu_items_in_cart(client.session) == set()
+    assert get_cart_total_amount(client.session) == 0
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_cart_summary_rebuilt_after_cart_changed_outside_request(client, create_menu_item, mocker,
+                                                                 django_capture_on_commit_callbacks):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    menu_item = create_menu_item(price=10)
+    client.post(reverse('order_api:add_to_cart'), {'menu_item_id': menu_item.id, 'count': 2, 'addition_ids': []},
+                content_type='application/json')
+    assert get_cart_total_amount(client.session) == Decimal(20)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        menu_item.price = 15
+        menu_item.save()
+
+    response = client.get(reverse('menu:main'))
+    assert response.context['total_amount'] == Decimal(30)
+    assert get_cart_total_amount(client.session) == Decimal(30)
+
+    Cart.objects.update(updated_at=get_utc_now() - dt.timedelta(days=30))
+    call_command('clear_abandoned_carts', max_age=60 * 60 * 24 * 14, stdout=StringIO())
+
+    response = client.get(reverse('menu:main'))
+    assert response.context['menu_items_in_cart'] == set()
+    assert get_cart_total_amount(client.session) == 0
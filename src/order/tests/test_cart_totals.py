@@ -0,0 +1,185 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from common.utils import can_return_rows_from_update
+from menu.models import Addition
+from order.models import CartItem
+from order.repository.cart import add_menu_item_to_cart, get_cart_item_by_id
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_cart_totals_maintained_on_cart_mutations(client, create_cart, create_menu_item, create_menu_item_addition, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+    cart = create_cart(session.session_key)
+
+    addition = create_menu_item_addition(price=5)
+    menu_item1 = create_menu_item(price=10, additions=[addition])
+    menu_item2 = create_menu_item(price=20)
+
+    cart_item1 = add_menu_item_to_cart(cart, menu_item1, Addition.objects.all(), 2)
+    cart_item2 = add_menu_item_to_cart(cart, menu_item2, Addition.objects.none(), 1)
+
+    cart_item1.refresh_from_db()
+    assert cart_item1.unit_price == 15
+    assert cart.total_amount == 50
+
+    client.post(reverse('order_api:increase_count'), {'cart_item_id': cart_item2.id})
+    cart.refresh_from_db()
+    assert cart.total_amount == 70
+
+    client.post(reverse('order_api:remove_cart_item_addition'), {'cart_item_id': cart_item1.id, 'addition_id': addition.id})
+    cart.refresh_from_db()
+    assert cart.total_amount == 60
+
+    client.post(reverse('order_api:remove_cart_item'), {'cart_item_id': cart_item2.id})
+    cart.refresh_from_db()
+    assert cart.total_amount == 20
+
+    client.post(reverse('order_api:clear_cart'))
+    cart.refresh_from_db()
+    assert cart.total_amount == 0
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_cart_totals_recalculated_on_price_change(create_cart, create_menu_item, create_menu_item_addition, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    cart = create_cart('test')
+
+    addition = create_menu_item_addition(price=5)
+    menu_item = create_menu_item(price=10, additions=[addition])
+
+    add_menu_item_to_cart(cart, menu_item, Addition.objects.all(), 2)
+
+    menu_item.price = 20
+    menu_item.save()
+    cart.refresh_from_db()
+    assert cart.total_amount == 50
+
+    addition.price = 10
+    addition.save()
+    cart.refresh_from_db()
+    assert cart.total_amount == 60
+
+    addition.delete()
+    cart.refresh_from_db()
+    assert cart.total_amount == 40
+
+    menu_item.delete()
+    cart.refresh_from_db()
+    assert cart.total_amount == 0
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_increase_count_queries_do_not_depend_on_cart_size(client, create_cart, create_menu_item, django_assert_max_num_queries, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+    cart = create_cart(session.session_key)
+
+    cart_items = [add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 1) for _ in range(10)]
+
+    with django_assert_max_num_queries(12):
+        response = client.post(reverse('order_api:increase_count'), {'cart_item_id': cart_items[0].id})
+
+    assert response.data.get('total_amount') == 110
+
+
+@pytest.mark.django_db(reset_sequences=True)
+@pytest.mark.skipif(not can_return_rows_from_update(connection), reason='database does not support UPDATE ... RETURNING')
+@pytest.mark.parametrize('url_name,count,total_amount', [
+    ('order_api:increase_count', 3, 40),
+    ('order_api:decrease_count', 1, 20),
+])
+def test_change_cart_item_count_uses_single_update_statements(client, create_cart, create_menu_item, mocker,
+                                                               url_name, count, total_amount):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+    cart = create_cart(session.session_key)
+
+    cart_item = add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 2)
+    add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 1)
+
+    with CaptureQueriesContext(connection) as captured_queries:
+        response = client.post(reverse(url_name), {'cart_item_id': cart_item.id})
+
+    assert response.data == {'count': count, 'cart_item_total_amount': count * 10, 'total_amount': total_amount}
+
+    cart_queries = [query['sql'] for query in captured_queries if '"order_cart' in query['sql']]
+    cart_updates = [sql for sql in cart_queries if sql.startswith('UPDATE')]
+
+    assert len(cart_queries) == 4   # cart and cart item lookups, one UPDATE ... RETURNING for each table
+    assert len(cart_updates) == 2
+    assert all('RETURNING' in sql for sql in cart_updates)
+
+    cart.refresh_from_db()
+    assert cart.total_amount == total_amount
+
+
+
+@pytest.mark.django_db(reset_sequences=True)
+@pytest.mark.parametrize('url_name', ['order_api:increase_count', 'order_api:decrease_count'])
+def test_change_count_of_concurrently_deleted_cart_item(client, create_cart, create_menu_item, mocker, url_name):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+    cart = create_cart(session.session_key)
+    cart_item = add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 2)
+
+    def get_deleted_cart_item(cart, cart_item_id):
+        found_cart_item = get_cart_item_by_id(cart.id, cart_item_id)
+        CartItem.objects.filter(id=cart_item_id).delete()
+        return found_cart_item
+
+    mocker.patch('order.repository.cart_storage.DatabaseCartStorage.get_cart_item', side_effect=get_deleted_cart_item)
+
+    response = client.post(reverse(url_name), {'cart_item_id': cart_item.id})
+
+    assert response.status_code == 404
+
+    cart.refresh_from_db()
+    assert cart.total_amount == 20
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_cart_total_recalculated_on_admin_cart_item_delete(client, admin_user, create_cart, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    cart = create_cart('test')
+    cart_item1 = add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 2)
+    cart_item2 = add_menu_item_to_cart(cart, create_menu_item(price=20), Addition.objects.none(), 1)
+    cart.refresh_from_db()
+    assert cart.total_amount == 40
+
+    client.force_login(admin_user)
+    response = client.post(reverse('admin:order_cart_change', args=[cart.id]), {
+        'items-TOTAL_FORMS': 2,
+        'items-INITIAL_FORMS': 2,
+        'items-MIN_NUM_FORMS': 0,
+        'items-MAX_NUM_FORMS': 0,
+        'items-0-id': cart_item1.id,
+        'items-0-cart': cart.id,
+        'items-0-DELETE': 'on',
+        'items-1-id': cart_item2.id,
+        'items-1-cart': cart.id,
+        'items-1-unit_price': 999,   # read-only, ignored
+    })
+
+    assert response.status_code == 302
+
+    cart.refresh_from_db()
+    assert cart.items.count() == 1
+    assert cart.total_amount == 20
+
+    cart_item2.refresh_from_db()
+    assert cart_item2.unit_price == 20
@@ -5,7 +5,7 @@ from django.urls import reverse
 
 from common.utils import get_local_now
 from menu.models import Addition
-from order.repository.cart import add_menu_item_to_cart
+from order.repository.cart import add_menu_item_to_cart, exclude_cart_items_from_cart_by_time_restrictions
 
 
 @pytest.mark.django_db(reset_sequences=True)
@@ -113,3 +113,30 @@ def test_cart_view_excluded_cart_items_by_category_time_restrictions(client, cre
     assert response.status_code == 200
 
     assert response.context.get('excluded_cart_items') == []
+
+
+@pytest.mark.django_db(reset_sequences=True)
+@pytest.mark.parametrize('cart_items_count', [1, 10])
+def test_exclude_cart_items_by_time_restrictions_queries_do_not_depend_on_cart_size(cart_items_count, create_cart, create_menu_category, create_menu_item, create_menu_item_addition, django_assert_num_queries, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    now = get_local_now()
+    restricted_category = create_menu_category(from_time=now + dt.timedelta(seconds=3), to_time=now + dt.timedelta(seconds=6))
+    menu_item_addition = create_menu_item_addition()
+
+    cart = create_cart('test')
+
+    for _ in range(cart_items_count):
+        add_menu_item_to_cart(cart, create_menu_item(category=restricted_category, price=10), Addition.objects.filter(id=menu_item_addition.id), 1)
+        add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 1)
+
+    with django_assert_num_queries(8):
+        excluded_cart_items = exclude_cart_items_from_cart_by_time_restrictions(cart)
+        excluded_titles = [cart_item.menu_item.title for cart_item in excluded_cart_items]
+
+    assert len(excluded_titles) == cart_items_count
+    assert cart.total_amount == cart_items_count * 10
+
+    with django_assert_num_queries(1):
+        assert exclude_cart_items_from_cart_by_time_restrictions(cart) == []
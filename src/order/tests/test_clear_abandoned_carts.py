@@ -0,0 +1,43 @@
+import datetime as dt
+from io import StringIO
+
+import pytest
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+
+from common.utils import get_utc_now
+from menu.models import Addition
+from order.models import Cart, CartItem
+from order.repository.cart import add_menu_item_to_cart
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_clear_abandoned_carts_command(create_cart, create_menu_item, create_menu_item_addition, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    create_menu_item_addition()
+    menu_item = create_menu_item(price=10)
+
+    for session_number in range(5):
+        session = SessionStore()
+        session.create()
+
+        cart = create_cart(session.session_key)
+        add_menu_item_to_cart(cart, menu_item, Addition.objects.all(), 1)
+
+        if session_number < 3:
+            Session.objects.filter(session_key=session.session_key).update(expire_date=get_utc_now() - dt.timedelta(days=1))
+            Cart.objects.filter(id=cart.id).update(updated_at=get_utc_now() - dt.timedelta(days=30))
+
+    stdout = StringIO()
+    call_command('clear_abandoned_carts', max_age=60 * 60 * 24 * 14, batch_size=2, pause=0, stdout=stdout)
+
+    assert Session.objects.count() == 2
+    assert Cart.objects.count() == 2
+    assert CartItem.objects.count() == 2
+    assert CartItem.additions.through.objects.count() == 2
+
+    # 3 carts, 3 cart items and 3 cart item additions
+    assert stdout.getvalue().startswith('Deleted 3 expired sessions, 9 rows of abandoned carts and 0 expired idempotency keys, reclaimed ')
@@ -1,15 +1,20 @@
 import datetime as dt
 from decimal import Decimal
+from io import StringIO
 
 import pytest
 from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from common.utils import get_local_now
-from menu.models import Addition
+from menu.models import Addition, MenuItem
 from order.constants import DeliveryMethods, PaymentMethods, OrderTransactionTypes
 from order.models import Cart, Customer, Order, DeliveryAddress, OrderItem, AdditionItem, OrderTransaction
 from order.repository.cart import add_menu_item_to_cart
+from order.repository.order import create_order_items_from_cart, get_order_cart_items
 from order.tests.courier_delivery_order_test_parameters import COURIER_DELIVERY_TEST_PARAMETERS
 from order.tests.self_pickup_order_test_parameters import SELF_PICKUP_ORDER_REQUESTS
 from settings.repository import get_site_settings
@@ -433,6 +438,79 @@ def test_create_order_process(client, create_cart, create_menu_item, create_menu
             assert order_item.addition_items.count() == 2
 
 
+@pytest.mark.django_db(reset_sequences=True)
+@pytest.mark.parametrize('cart_items_count', [1, 5])
+def test_create_order_items_from_cart_queries(create_cart, create_menu_item, create_menu_item_addition, mocker,
+                                              django_assert_num_queries, cart_items_count):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    create_menu_item_addition(price=1)
+    create_menu_item_addition(price=2)
+
+    cart = create_cart('test')
+
+    for _ in range(cart_items_count):
+        add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.all(), 2)
+
+    order = Order.objects.create(session_key='test', delivery_method=DeliveryMethods.SELF_PICKUP,
+                                 payment_method=PaymentMethods.CARD, prepayment_required=False)
+
+    # cart items with menu items, cart item additions, order items insert, order items ids, addition items insert
+    with django_assert_num_queries(5):
+        create_order_items_from_cart(get_order_cart_items(cart), order)
+
+    assert OrderItem.objects.filter(order=order).count() == cart_items_count
+    assert AdditionItem.objects.filter(order_item__order=order).count() == cart_items_count * 2
+    assert all(order_item.total_amount == Decimal(26) for order_item in OrderItem.objects.filter(order=order))
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_create_order_total_amount_saved_on_insert(create_cart, create_menu_item, create_menu_item_addition,
+                                                   create_order, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    create_menu_item_addition(price=1)
+    cart = create_cart('test')
+    add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.all(), 2)
+    add_menu_item_to_cart(cart, create_menu_item(price=20), Addition.objects.none(), 1)
+
+    with CaptureQueriesContext(connection) as captured_queries:
+        order = create_order('test', cart)
+
+    assert not [query['sql'] for query in captured_queries if query['sql'].startswith('UPDATE "order_order"')]
+
+    order.refresh_from_db()
+    assert order.total_amount == Decimal(42)
+
+
+
+@pytest.mark.django_db(reset_sequences=True)
+@pytest.mark.parametrize('prepayment_start_from,new_price,prepayment_required', [(50, 50, True), (40, 5, False)])
+def test_create_order_prepayment_decided_by_order_total(create_cart, create_menu_item, create_order, mocker,
+                                                        prepayment_start_from, new_price, prepayment_required):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    site_settings = get_site_settings()
+    site_settings.order_prepayment_start_from = Decimal(prepayment_start_from)
+    site_settings.save()
+
+    menu_item = create_menu_item(price=20)
+    cart = create_cart('test')
+    add_menu_item_to_cart(cart, menu_item, Addition.objects.none(), 2)
+
+    # the price changes without the signals that recalculate the cart, so the cart total is on the other side
+    MenuItem.objects.filter(id=menu_item.id).update(price=new_price)
+    cart.refresh_from_db()
+    assert cart.total_amount == 40
+
+    order = create_order('test', cart)
+
+    assert order.total_amount == new_price * 2
+    assert order.prepayment_required == prepayment_required
+
 @pytest.mark.django_db(reset_sequences=True)
 def test_create_order_prepayment_with_card_payment(client, create_cart, create_menu_item, create_menu_item_addition,
                                                    mocker):
@@ -486,6 +564,8 @@ def test_create_order_prepayment_with_card_payment(client, create_cart, create_m
 
     assert transaction.type == OrderTransactionTypes.PREPAYMENT
 
+    call_command('send_order_notifications', stdout=StringIO())
+
     # new order notification will be sent after prepayment confirmed
     assert len(mail.outbox) == 0
 
@@ -543,6 +623,8 @@ def test_create_order_prepayment_with_cash_payment(client, create_cart, create_m
 
     assert transaction.type == OrderTransactionTypes.PREPAYMENT
 
+    call_command('send_order_notifications', stdout=StringIO())
+
     # new order notification will be sent after prepayment confirmed
     assert len(mail.outbox) == 0
 
@@ -601,6 +683,8 @@ def test_create_order_payment_with_liqpay_payment(client, create_cart, create_me
 
     assert transaction.type == OrderTransactionTypes.FULL_PAYMENT
 
+    call_command('send_order_notifications', stdout=StringIO())
+
     # new order notification will be sent after prepayment confirmed
     assert len(mail.outbox) == 0
 
@@ -658,6 +742,8 @@ def test_create_order_prepayment_with_card_payment(client, create_cart, create_m
 
     assert OrderTransaction.objects.count() == 0
 
+    call_command('send_order_notifications', stdout=StringIO())
+
     # new order notification
     assert len(mail.outbox) == 1
 
@@ -723,6 +809,8 @@ def test_create_order_prepayment_with_card_payment(client, create_cart, create_m
 
     assert transaction.type == OrderTransactionTypes.PREPAYMENT
 
+    call_command('send_order_notifications', stdout=StringIO())
+
     # new order notification will be sent after prepayment confirmed
     assert len(mail.outbox) == 0
 
@@ -788,6 +876,8 @@ def test_create_order_prepayment_with_cash_payment(client, create_cart, create_m
 
     assert transaction.type == OrderTransactionTypes.PREPAYMENT
 
+    call_command('send_order_notifications', stdout=StringIO())
+
     # new order notification will be sent after prepayment confirmed
     assert len(mail.outbox) == 0
 
@@ -888,6 +978,8 @@ def test_new_order_notification(client, create_menu_item, create_cart, admin_use
 
     assert response.status_code == 200
 
+    call_command('send_order_notifications', stdout=StringIO())
+
     assert len(mail.outbox) == 1
 
 
@@ -933,6 +1025,8 @@ def test_new_order_notification_with_prepayment(client, create_cart, create_menu
 
     assert transaction.type == OrderTransactionTypes.PREPAYMENT
 
+    call_command('send_order_notifications', stdout=StringIO())
+
     assert len(mail.outbox) == 0
 
 
@@ -978,4 +1072,6 @@ def test_new_order_notification_with_full_payment(client, create_cart, create_me
 
     assert transaction.type == OrderTransactionTypes.FULL_PAYMENT
 
+    call_command('send_order_notifications', stdout=StringIO())
+
     assert len(mail.outbox) == 0
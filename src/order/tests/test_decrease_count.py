@@ -24,10 +24,8 @@ def test_decrease_cart_item_count(client, create_cart, create_menu_item, mocker)
     menu_item1 = create_menu_item(price=10)
     menu_item2 = create_menu_item(price=20)
 
-    cart_item1 = add_menu_item_to_cart(cart, menu_item1, Addition.objects.none(), 1)
+    cart_item1 = add_menu_item_to_cart(cart, menu_item1, Addition.objects.none(), 3)
     cart_item2 = add_menu_item_to_cart(cart, menu_item2, Addition.objects.none(), 1)
-    cart_item1.count = 3
-    cart_item1.save()
 
     cart.save()
 
@@ -56,10 +54,7 @@ def test_decrease_cart_item_count_from_another_customers_cart(client, create_car
     menu_item = create_menu_item(price=10)
 
     cart1_item = add_menu_item_to_cart(cart1, menu_item, Addition.objects.none(), 1)
-    cart2_item = add_menu_item_to_cart(cart2, menu_item, Addition.objects.none(), 1)
-
-    cart2_item.count = 2
-    cart2_item.save()
+    cart2_item = add_menu_item_to_cart(cart2, menu_item, Addition.objects.none(), 2)
 
     cart1.save()
     cart2.save()
@@ -85,8 +80,6 @@ def test_decrease_cart_item_not_decreased_when_count_is_one(client, create_cart,
     menu_item = create_menu_item(price=10)
 
     cart_item = add_menu_item_to_cart(cart, menu_item, Addition.objects.none(), 1)
-    cart_item.count = 1
-    cart_item.save()
 
     cart.save()
 
@@ -0,0 +1,159 @@
+import datetime as dt
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from menu.models import Addition
+from order.models import CartItem, Order, IdempotencyKey
+from order.repository.cart import add_menu_item_to_cart
+from order.tests.self_pickup_order_test_parameters import get_valid_data
+from settings.repository import get_site_settings
+
+
+def get_create_order_request_data():
+    site_settings = get_site_settings()
+    self_pickup_time = dt.datetime.utcnow() + site_settings.min_order_completion_time + dt.timedelta(minutes=1)
+
+    request_data = get_valid_data()
+    request_data.update({
+        'self_pickup_time': self_pickup_time.strftime('%Y-%m-%dT%H:%M:%S')
+    })
+
+    return request_data
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_create_order_replayed_for_same_idempotency_key(client, create_cart, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+
+    cart = create_cart(session.session_key)
+    add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 1)
+
+    request_data = get_create_order_request_data()
+
+    response = client.post(reverse('order_api:create_order'), request_data, content_type='application/json',
+                           HTTP_IDEMPOTENCY_KEY='checkout-1')
+
+    assert response.status_code == 200
+    assert not response.has_header('Idempotent-Replayed')
+
+    with CaptureQueriesContext(connection) as context:
+        replayed_response = client.post(reverse('order_api:create_order'), request_data, content_type='application/json',
+                                        HTTP_IDEMPOTENCY_KEY='checkout-1')
+
+    assert replayed_response.status_code == 200
+    assert replayed_response['Idempotent-Replayed'] == 'true'
+    assert replayed_response.data == response.data
+
+    assert Order.objects.count() == 1
+    assert not [query for query in context.captured_queries if 'order_' in query['sql'] and 'order_idempotencykey' not in query['sql']]
+
+    # a new key runs the order pipeline again
+    response = client.post(reverse('order_api:create_order'), request_data, content_type='application/json',
+                           HTTP_IDEMPOTENCY_KEY='checkout-2')
+
+    assert response.status_code == 400
+    assert response.data.get('detail', {}).get('code') == 'cart_not_found'
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_idempotency_key_reused_with_different_request(client, create_cart, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    menu_item = create_menu_item(price=10)
+
+    request_data = {
+        'menu_item_id': menu_item.id,
+        'count': 1,
+        'addition_ids': [],
+    }
+    client.post(reverse('order_api:add_to_cart'), request_data, content_type='application/json', HTTP_IDEMPOTENCY_KEY='add-1')
+
+    request_data['count'] = 2
+    response = client.post(reverse('order_api:add_to_cart'), request_data, content_type='application/json',
+                           HTTP_IDEMPOTENCY_KEY='add-1')
+
+    assert response.status_code == 400
+    assert response.data.get('detail', {}).get('code') == 'idempotency_key_mismatch'
+    assert CartItem.objects.get().count == 1
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_idempotency_key_in_progress(client, create_cart, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+
+    cart = create_cart(session.session_key)
+    cart_item = add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 1)
+
+    path = reverse('order_api:increase_count')
+
+    # claimed by a request whose response is not stored yet
+    IdempotencyKey.objects.create(session_key=session.session_key, path=path, key='increase-1', data_hash='hash')
+
+    response = client.post(path, {'cart_item_id': cart_item.id}, content_type='application/json', HTTP_IDEMPOTENCY_KEY='increase-1')
+
+    assert response.status_code == 409
+    assert response.data.get('detail', {}).get('code') == 'idempotency_key_in_use'
+
+    cart_item.refresh_from_db()
+    assert cart_item.count == 1
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_cart_mutations_with_idempotency_keys(client, create_cart, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+
+    cart = create_cart(session.session_key)
+    cart_item = add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 1)
+
+    path = reverse('order_api:increase_count')
+
+    for _ in range(3):
+        response = client.post(path, {'cart_item_id': cart_item.id}, content_type='application/json', HTTP_IDEMPOTENCY_KEY='increase-1')
+        assert response.data.get('count') == 2
+
+    # requests without a key are not deduplicated
+    for count in (3, 4):
+        response = client.post(path, {'cart_item_id': cart_item.id}, content_type='application/json')
+        assert response.data.get('count') == count
+
+    # keys are scoped to the endpoint
+    response = client.post(reverse('order_api:decrease_count'), {'cart_item_id': cart_item.id}, content_type='application/json',
+                           HTTP_IDEMPOTENCY_KEY='increase-1')
+    assert response.data.get('count') == 3
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_idempotency_key_released_on_failed_request(client, create_cart, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    session = client.session
+
+    cart = create_cart(session.session_key)
+    cart_item = add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 1)
+
+    path = reverse('order_api:increase_count')
+
+    response = client.post(path, {'cart_item_id': cart_item.id + 1}, content_type='application/json', HTTP_IDEMPOTENCY_KEY='increase-1')
+    assert response.status_code == 404
+    assert not IdempotencyKey.objects.exists()
+
+    response = client.post(path, {'cart_item_id': cart_item.id}, content_type='application/json', HTTP_IDEMPOTENCY_KEY='increase-1')
+    assert response.data.get('count') == 2
+
+    idempotency_key = IdempotencyKey.objects.get()
+    assert idempotency_key.status_code == 200
+    assert idempotency_key.response_data == {'count': 2, 'cart_item_total_amount': 20.0, 'total_amount': 20.0}
@@ -1,9 +1,11 @@
 import base64
 import json
+from io import StringIO
 
 import pytest
 from django.conf import settings
 from django.core import mail
+from django.core.management import call_command
 from django.urls import reverse
 
 from liqpay import LiqPay
@@ -123,6 +125,8 @@ def test_liqpay_callback_new_order_notification(client, admin_user, create_order
 
     assert response.status_code == 200
 
+    call_command('send_order_notifications', stdout=StringIO())
+
     # new order notification
     assert len(mail.outbox) == 1
 
@@ -0,0 +1,131 @@
+import datetime as dt
+from io import StringIO
+from smtplib import SMTPException
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+
+from common.utils import get_utc_now
+from menu.models import Addition
+from order.constants import OrderNotificationStatuses, PaymentMethods
+from order.models import OrderNotification
+from order.repository.cart import add_menu_item_to_cart
+from order.repository.notification import retry_failed_order_notifications, claim_due_order_notifications
+from settings.repository import get_site_settings
+
+
+@pytest.fixture
+def create_order_with_notification(create_cart, create_order, create_menu_item, admin_user, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    site_settings = get_site_settings()
+    site_settings.notify_users.add(admin_user)
+
+    def make_create_order_with_notification(session_key):
+        cart = create_cart(session_key)
+        add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.none(), 1)
+        return create_order(session_key, cart, payment_method=PaymentMethods.CASH)
+
+    return make_create_order_with_notification
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_create_order_enqueues_notification(create_order_with_notification):
+    order = create_order_with_notification('test')
+
+    assert len(mail.outbox) == 0
+
+    notification = OrderNotification.objects.get()
+    assert notification.order == order
+    assert notification.status == OrderNotificationStatuses.PENDING
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_send_order_notifications(create_order_with_notification):
+    create_order_with_notification('first')
+    create_order_with_notification('second')
+
+    stdout = StringIO()
+    call_command('send_order_notifications', stdout=stdout)
+
+    assert stdout.getvalue() == 'Sent 2 order notifications, 0 failed\n'
+    assert len(mail.outbox) == 2
+    assert set(OrderNotification.objects.values_list('status', 'attempts')) == {(OrderNotificationStatuses.SENT, 1)}
+
+    call_command('send_order_notifications', stdout=StringIO())
+    assert len(mail.outbox) == 2
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_send_order_notifications_retries_with_backoff(create_order_with_notification, mocker):
+    create_order_with_notification('test')
+
+    mocked_send = mocker.patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=SMTPException('Connection refused'))
+
+    call_command('send_order_notifications', retry_delay=60, max_attempts=3, stdout=StringIO())
+
+    notification = OrderNotification.objects.get()
+    assert notification.status == OrderNotificationStatuses.PENDING
+    assert notification.attempts == 1
+    assert notification.last_error == 'Connection refused'
+    assert notification.next_attempt_at > get_utc_now() + dt.timedelta(seconds=50)
+
+    # not due yet
+    call_command('send_order_notifications', retry_delay=60, max_attempts=3, stdout=StringIO())
+    assert mocked_send.call_count == 1
+
+    OrderNotification.objects.update(next_attempt_at=get_utc_now())
+    call_command('send_order_notifications', retry_delay=60, max_attempts=3, stdout=StringIO())
+
+    notification.refresh_from_db()
+    assert notification.attempts == 2
+    assert notification.next_attempt_at > get_utc_now() + dt.timedelta(seconds=110)
+
+    OrderNotification.objects.update(next_attempt_at=get_utc_now())
+    call_command('send_order_notifications', retry_delay=60, max_attempts=3, stdout=StringIO())
+
+    notification.refresh_from_db()
+    assert notification.status == OrderNotificationStatuses.FAILED
+    assert notification.attempts == 3
+
+    mocker.stopall()
+    call_command('send_order_notifications', stdout=StringIO())
+    assert len(mail.outbox) == 0
+
+    retry_failed_order_notifications(OrderNotification.objects.all())
+    call_command('send_order_notifications', stdout=StringIO())
+
+    notification.refresh_from_db()
+    assert notification.status == OrderNotificationStatuses.SENT
+    assert len(mail.outbox) == 1
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_claim_due_order_notifications(create_order_with_notification):
+    create_order_with_notification('first')
+    create_order_with_notification('second')
+
+    claimed_notifications = claim_due_order_notifications(limit=1, lease=60)
+    assert len(claimed_notifications) == 1
+    assert claimed_notifications[0].next_attempt_at > get_utc_now() + dt.timedelta(seconds=50)
+
+    other_claimed_notifications = claim_due_order_notifications(limit=10, lease=60)
+    assert len(other_claimed_notifications) == 1
+    assert other_claimed_notifications[0].claim_token != claimed_notifications[0].claim_token
+
+    assert claim_due_order_notifications(limit=10, lease=60) == []
+
+    # the worker that claimed the first notification stopped before sending it
+    OrderNotification.objects.filter(id=claimed_notifications[0].id).update(next_attempt_at=get_utc_now())
+
+    stdout = StringIO()
+    call_command('send_order_notifications', stdout=stdout)
+
+    assert stdout.getvalue() == 'Sent 1 order notifications, 0 failed\n'
+    assert len(mail.outbox) == 1
+
+    notification = OrderNotification.objects.get(id=claimed_notifications[0].id)
+    assert notification.status == OrderNotificationStatuses.SENT
+    assert notification.claim_token is None
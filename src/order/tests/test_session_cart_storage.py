@@ -0,0 +1,172 @@
+import datetime as dt
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+
+from order.constants import CartOperations
+from order.models import Cart, CartItem, Order, OrderItem, AdditionItem
+from order.repository.cart_storage import CART_SESSION_KEY
+from order.tests.self_pickup_order_test_parameters import get_valid_data
+from settings.repository import get_site_settings
+
+
+@pytest.fixture(autouse=True)
+def use_session_cart_storage(settings):
+    settings.CART_STORAGE = 'order.repository.cart_storage.SessionCartStorage'
+
+
+def add_to_cart(client, menu_item, addition_ids=(), count=1):
+    request_data = {
+        'menu_item_id': menu_item.id,
+        'count': count,
+        'addition_ids': list(addition_ids),
+    }
+
+    return client.post(reverse('order_api:add_to_cart'), request_data, content_type='application/json')
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_session_cart_storage_add_to_cart(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    menu_item = create_menu_item(price=10, additions_count=2)
+    addition_ids = list(menu_item.possible_additions.values_list('id', flat=True))
+
+    add_to_cart(client, menu_item, addition_ids=addition_ids)
+    add_to_cart(client, menu_item, addition_ids=reversed(addition_ids))
+    response = add_to_cart(client, menu_item)
+
+    assert response.status_code == 200
+    assert response.data.get('total_amount') == Decimal(34)
+
+    cart_data = client.session[CART_SESSION_KEY]
+    assert [(item['menu_item_id'], item['addition_ids'], item['count']) for item in cart_data['items']] == [
+        (menu_item.id, sorted(addition_ids), 2),
+        (menu_item.id, [], 1),
+    ]
+
+    assert Cart.objects.count() == 0
+    assert CartItem.objects.count() == 0
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_session_cart_storage_change_cart(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    menu_item1 = create_menu_item(price=10, additions_count=1)
+    menu_item2 = create_menu_item(price=20)
+    addition = menu_item1.possible_additions.first()
+
+    add_to_cart(client, menu_item1, addition_ids=[addition.id])
+    add_to_cart(client, menu_item2)
+
+    response = client.post(reverse('order_api:increase_count'), {'cart_item_id': 1}, content_type='application/json')
+    assert response.data == {'count': 2, 'cart_item_total_amount': Decimal(22), 'total_amount': Decimal(42)}
+
+    response = client.post(reverse('order_api:decrease_count'), {'cart_item_id': 1}, content_type='application/json')
+    assert response.data == {'count': 1, 'cart_item_total_amount': Decimal(11), 'total_amount': Decimal(31)}
+
+    request_data = {'cart_item_id': 1, 'addition_id': addition.id}
+    response = client.post(reverse('order_api:remove_cart_item_addition'), request_data, content_type='application/json')
+    assert response.data == {'cart_item_total_amount': Decimal(10), 'total_amount': Decimal(30)}
+
+    response = client.post(reverse('order_api:remove_cart_item_addition'), request_data, content_type='application/json')
+    assert response.status_code == 404
+
+    response = client.post(reverse('order_api:remove_cart_item'), {'cart_item_id': 2}, content_type='application/json')
+    assert response.data == {'total_amount': Decimal(10)}
+
+    response = client.post(reverse('order_api:clear_cart'))
+    assert response.status_code == 200
+    assert client.session[CART_SESSION_KEY]['items'] == []
+
+    assert Cart.objects.count() == 0
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_session_cart_storage_cart_view_drops_deleted_menu_items(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    mocked_icon_url = mocker.patch('django.db.models.fields.files.ImageFieldFile.url')
+    mocked_icon_url.return_value = 'test'
+
+    menu_item1 = create_menu_item(title='First item', price=10)
+    menu_item2 = create_menu_item(title='Second item', price=20)
+
+    add_to_cart(client, menu_item1)
+    add_to_cart(client, menu_item2)
+
+    menu_item2.delete()
+
+    response = client.get(reverse('order:cart'))
+
+    assert response.status_code == 200
+    assert 'First item' in response.content.decode()
+    assert 'Second item' not in response.content.decode()
+    assert response.context['cart'].total_amount == Decimal(10)
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_session_cart_storage_create_order(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    menu_item1 = create_menu_item(price=10, additions_count=1)
+    menu_item2 = create_menu_item(price=20)
+
+    add_to_cart(client, menu_item1, addition_ids=[menu_item1.possible_additions.first().id], count=2)
+    add_to_cart(client, menu_item2)
+
+    site_settings = get_site_settings()
+    self_pickup_time = dt.datetime.utcnow() + site_settings.min_order_completion_time + dt.timedelta(seconds=1)
+
+    request_data = get_valid_data()
+    request_data.update({
+        'self_pickup_time': self_pickup_time.strftime('%Y-%m-%dT%H:%M:%S')
+    })
+
+    response = client.post(reverse('order_api:create_order'), request_data, content_type='application/json')
+
+    assert response.status_code == 200
+    assert CART_SESSION_KEY not in client.session
+
+    order = Order.objects.get()
+    assert order.total_amount == Decimal(42)
+    assert OrderItem.objects.count() == 2
+    assert AdditionItem.objects.count() == 1
+
+    assert Cart.objects.count() == 0
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_session_cart_storage_cart_batch(client, create_menu_item, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    menu_item1 = create_menu_item(price=10)
+    menu_item2 = create_menu_item(price=20)
+
+    add_to_cart(client, menu_item1)
+    add_to_cart(client, menu_item2)
+
+    request_data = {
+        'operations': [
+            {'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': 1},
+            {'operation': CartOperations.REMOVE_CART_ITEM, 'cart_item_id': 2},
+            {'operation': CartOperations.INCREASE_COUNT, 'cart_item_id': 2},
+        ],
+    }
+    response = client.post(reverse('order_api:cart_batch'), request_data, content_type='application/json')
+    assert response.status_code == 404
+
+    request_data['operations'].pop()
+    response = client.post(reverse('order_api:cart_batch'), request_data, content_type='application/json')
+
+    assert response.data == {
+        'cart_items': [{'id': 1, 'count': 2, 'total_amount': Decimal(20)}],
+        'total_amount': Decimal(20),
+    }
@@ -0,0 +1,46 @@
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command, CommandError
+
+from menu.models import Addition
+from order.models import Order, OrderItem
+from order.repository.cart import add_menu_item_to_cart
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_verify_order_totals_command(create_cart, create_order, create_menu_item, create_menu_item_addition, mocker):
+    mocked_storage = mocker.patch('django.core.files.storage.FileSystemStorage.save')
+    mocked_storage.return_value = 'test'
+
+    create_menu_item_addition(price=1)
+
+    for session_key in ('first', 'second'):
+        cart = create_cart(session_key)
+        add_menu_item_to_cart(cart, create_menu_item(price=10), Addition.objects.all(), 2)
+        add_menu_item_to_cart(cart, create_menu_item(price=20), Addition.objects.none(), 1)
+        create_order(session_key, cart)
+
+    stdout = StringIO()
+    call_command('verify_order_totals', stdout=stdout)
+    assert stdout.getvalue() == 'Checked order totals, found 0 drifted\n'
+
+    order_item = OrderItem.objects.filter(order__session_key='second').first()
+    OrderItem.objects.filter(id=order_item.id).update(price=15)
+    Order.objects.filter(session_key='first').update(total_amount=1)
+
+    with pytest.raises(CommandError, match='Found 2 drifted totals'):
+        call_command('verify_order_totals', stdout=StringIO())
+
+    call_command('verify_order_totals', fix=True, stdout=StringIO())
+
+    order_item.refresh_from_db()
+    assert order_item.total_amount == Decimal(32)
+
+    assert Order.objects.get(session_key='first').total_amount == Decimal(42)
+    assert Order.objects.get(session_key='second').total_amount == Decimal(52)
+
+    stdout = StringIO()
+    call_command('verify_order_totals', stdout=stdout)
+    assert stdout.getvalue() == 'Checked order totals, found 0 drifted\n'
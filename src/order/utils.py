@@ -1,3 +1,4 @@
+import hashlib
 import re
 
 
@@ -7,3 +8,8 @@ def is_valid_phone_number(phone_number: str):
 
 def is_valid_positive_small_integer(value: int):
     return 32767 >= value >= 0
+
+
+def get_additions_fingerprint(addition_ids):
+    canonical_ids = ','.join(str(addition_id) for addition_id in sorted(set(addition_ids)))
+    return hashlib.sha1(canonical_ids.encode()).hexdigest()
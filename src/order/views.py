@@ -10,7 +10,7 @@ from common.decorators import redirect_if_authenticated
 from fs_cabinet.settings import DEFAULT_LOGGER_NAME
 from order.decorators import redirect_to_payment_if_needed
 from order.handlers.liqpay import get_liqpay_payment_form
-from order.repository.cart import get_cart, exclude_cart_items_from_cart_by_time_restrictions
+from order.repository.cart_storage import get_cart_storage
 from order.repository.order import get_order_transaction_by_session_key
 from settings.repository import get_site_settings
 
@@ -35,7 +35,7 @@ class CartView(DetailView):
         return context
 
     def get_object(self, queryset=None):
-        return get_cart(self.request.session.session_key)
+        return get_cart_storage(self.request.session).get_cart()
 
     def get(self, request, *args, **kwargs):
         self.object = self.get_object()
@@ -43,7 +43,10 @@ class CartView(DetailView):
         if self.object is None:
             return redirect(reverse('menu:main'))
 
-        excluded_cart_items = exclude_cart_items_from_cart_by_time_restrictions(self.object)
+        cart_storage = get_cart_storage(request.session)
+        excluded_cart_items = cart_storage.exclude_cart_items_from_cart_by_time_restrictions(self.object)
+        cart_storage.update_cart_summary(self.object)
+
         context = self.get_context_data(object=self.object, excluded_cart_items=excluded_cart_items)
         return self.render_to_response(context)
 
@@ -6,3 +6,7 @@ class SettingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'settings'
     verbose_name = _('Settings')
+
+    def ready(self):
+        from settings.signals import connect_signals
+        connect_signals()
@@ -1,7 +1,9 @@
+from django.utils.functional import SimpleLazyObject
+
 from settings.repository import get_site_settings
 
 
 def site_settings(request):
     return {
-        'site_settings': get_site_settings()
+        'site_settings': SimpleLazyObject(get_site_settings)
     }
@@ -1,5 +1,53 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+
 from settings.models import Settings
 
+SITE_SETTINGS_VERSION_CACHE_KEY = 'site_settings:version'
+SITE_SETTINGS_CACHE_KEY = 'site_settings:%(version)s'
+
+# site settings of the current process, reused until the shared version changes
+local_site_settings = {}
+
+
+def get_site_settings_version():
+    version = cache.get(SITE_SETTINGS_VERSION_CACHE_KEY)
+
+    if version is None:
+        cache.add(SITE_SETTINGS_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        version = cache.get(SITE_SETTINGS_VERSION_CACHE_KEY)
+
+    return version
+
+
+def invalidate_site_settings():
+    cache.set(SITE_SETTINGS_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+    local_site_settings.clear()
+
+
+def load_site_settings():
+    return Settings.objects.prefetch_related('notify_users').first()     # created via data migration
+
 
 def get_site_settings():
-    return Settings.objects.first()     # created via data migration
+    version = get_site_settings_version()
+
+    if version in local_site_settings:
+        return local_site_settings[version]
+
+    cache_key = SITE_SETTINGS_CACHE_KEY % {'version': version}
+    site_settings = cache.get(cache_key)
+
+    if site_settings is None:
+        site_settings = load_site_settings()
+
+        if site_settings is None:
+            return None
+
+        cache.set(cache_key, site_settings, timeout=None)
+
+    local_site_settings.clear()
+    local_site_settings[version] = site_settings
+
+    return site_settings
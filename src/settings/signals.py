@@ -0,0 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete, m2m_changed
+
+from settings.models import Settings
+from settings.repository import invalidate_site_settings, get_site_settings
+
+NOTIFY_USER_FIELDS = frozenset(('is_active', 'email', 'is_staff'))
+
+
+def site_settings_changed(sender, **kwargs):
+    invalidate_site_settings()
+
+
+def notify_user_changed(sender, instance, update_fields=None, **kwargs):
+    # saves like the last_login update on every login do not touch anything cached with the settings
+    if update_fields is not None and not NOTIFY_USER_FIELDS.intersection(update_fields):
+        return
+
+    site_settings = get_site_settings()
+
+    if site_settings is not None and instance.pk in {user.pk for user in site_settings.notify_users.all()}:
+        invalidate_site_settings()
+
+
+def connect_signals():
+    post_save.connect(site_settings_changed, sender=Settings, dispatch_uid='site_settings_changed_on_save')
+    post_delete.connect(site_settings_changed, sender=Settings, dispatch_uid='site_settings_changed_on_delete')
+    m2m_changed.connect(site_settings_changed, sender=Settings.notify_users.through, dispatch_uid='site_settings_changed_on_notify_users_change')
+
+    # notify users are cached with the settings
+    post_save.connect(notify_user_changed, sender=get_user_model(), dispatch_uid='site_settings_changed_on_user_save')
+    post_delete.connect(notify_user_changed, sender=get_user_model(), dispatch_uid='site_settings_changed_on_user_delete')
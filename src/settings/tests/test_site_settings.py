@@ -0,0 +1,90 @@
+import datetime as dt
+
+import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
+
+from common.utils import get_utc_now
+from order.handlers.order import get_new_order_notification_emails
+from settings.context_processors import site_settings as site_settings_context_processor
+from settings.repository import get_site_settings, local_site_settings
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_site_settings_cached(django_assert_num_queries):
+    with django_assert_num_queries(2):  # settings and notify users
+        site_settings = get_site_settings()
+
+    with django_assert_num_queries(0):
+        assert get_site_settings() is site_settings
+        assert list(site_settings.notify_users.all()) == []
+
+    # the settings are shared with other processes through the cache
+    local_site_settings.clear()
+
+    with django_assert_num_queries(0):
+        assert get_site_settings().id == site_settings.id
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_site_settings_invalidated_on_save():
+    site_settings = get_site_settings()
+    site_settings.min_order_completion_time = dt.timedelta(minutes=45)
+    site_settings.save()
+
+    cache.clear()   # version key must be reloaded from an empty cache as well
+    assert get_site_settings().min_order_completion_time == dt.timedelta(minutes=45)
+
+    site_settings.min_order_completion_time = dt.timedelta(minutes=50)
+    site_settings.save()
+
+    assert get_site_settings().min_order_completion_time == dt.timedelta(minutes=50)
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_site_settings_invalidated_on_notify_users_change(create_user, django_assert_num_queries):
+    user = create_user(email='admin@example.com')
+
+    assert get_new_order_notification_emails() == []
+
+    get_site_settings().notify_users.add(user)
+    assert get_new_order_notification_emails() == ['admin@example.com']
+
+    user.is_active = False
+    user.save()
+    assert get_new_order_notification_emails() == []
+
+    with django_assert_num_queries(0):
+        get_new_order_notification_emails()
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_site_settings_context_processor_is_lazy(django_assert_num_queries):
+    request = RequestFactory().get('/')
+
+    with django_assert_num_queries(0):
+        context = site_settings_context_processor(request)
+
+    with django_assert_num_queries(2):
+        assert context['site_settings'].id == get_site_settings().id
+
+
+@pytest.mark.django_db(reset_sequences=True)
+def test_site_settings_not_invalidated_on_unrelated_user_changes(create_user, django_assert_num_queries):
+    notify_user = create_user(username='notify', email='notify@example.com')
+    other_user = create_user(username='other', email='other@example.com')
+    get_site_settings().notify_users.add(notify_user)
+
+    site_settings = get_site_settings()
+
+    notify_user.last_login = get_utc_now()
+    notify_user.save(update_fields=['last_login'])
+
+    other_user.email = 'changed@example.com'
+    other_user.save()
+
+    with django_assert_num_queries(0):
+        assert get_site_settings() is site_settings
+
+    notify_user.delete()
+    assert get_new_order_notification_emails() == []
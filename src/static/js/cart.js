@@ -26,25 +26,92 @@ document.addEventListener('DOMContentLoaded',()=>{
         });
     })
 
+    let pendingOperations = [];
+    let pendingCallbacks = [];
+    let batchTimeout = null;
+    let batchInFlight = false;
+
+    function queueCartOperation(operation, callback, delay = 400) {
+        pendingOperations.push(operation);
+        if(callback) pendingCallbacks.push(callback);
+
+        clearTimeout(batchTimeout);
+        batchTimeout = setTimeout(sendCartOperations, delay);
+    }
+
+    function resyncCart() {
+        showAlert('Сталась невідома помилка, будь ласка спробуйте пізніше', 'red');
+        setTimeout(() => window.location.reload(), 1500);
+    }
+
+    function sendCartOperations() {
+        // only one batch is sent at a time, so responses can not be applied out of order
+        if(batchInFlight || pendingOperations.length === 0) return;
+
+        const operations = pendingOperations;
+        const callbacks = pendingCallbacks;
+        pendingOperations = [];
+        pendingCallbacks = [];
+        batchInFlight = true;
+
+        fetch(`/api/v1/order/cart/batch/`,{
+            method: 'POST',
+            body: JSON.stringify({
+                operations: operations
+            }),
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrftoken,
+                'Idempotency-Key': generateIdempotencyKey()
+            }
+        }).then(response => response.json().then(data => ({ok: response.ok, data}))).then(({ok, data}) => {
+            batchInFlight = false;
+
+            if(!ok || !data || !data.hasOwnProperty('cart_items')){
+                pendingOperations = [];
+                pendingCallbacks = [];
+                resyncCart();
+                return;
+            }
+
+            callbacks.forEach((callback) => callback(data));
+            updateCartItems(data.cart_items);
+            updatePrice(data.total_amount);
+            sendCartOperations();
+        }).catch(()=>{
+            batchInFlight = false;
+            pendingOperations = [];
+            pendingCallbacks = [];
+            resyncCart();
+        });
+    }
+
+    function updateCartItems(cartItems) {
+        const cartItemsById = new Map(cartItems.map((cartItem) => [cartItem.id, cartItem]));
+
+        document.querySelectorAll('.count-box').forEach((countBox) => {
+            const cartItem = cartItemsById.get(+countBox.getAttribute('data-menu-id'));
+
+            if(!cartItem){
+                countBox.parentNode.remove();
+                return;
+            }
+
+            countBox.children[1].innerHTML = cartItem.count;
+            countBox.parentNode.getElementsByClassName('price-box')[0].children[0].innerHTML = cartItem.total_amount;
+        })
+
+        if(document.querySelectorAll('.table-item').length === 0) window.location.href = "/";
+    }
+
     minusButtons.forEach((el)=>{
         el.addEventListener('click',(e)=>{
-            fetch(`/api/v1/order/decrease-count/`,{
-                method: 'POST',
-                body: JSON.stringify({
-                    cart_item_id: +e.target.parentNode.getAttribute('data-menu-id')
-                }),
-                headers: {
-                    'Content-Type': 'application/json',
-                    'X-CSRFToken': csrftoken
-                }
-            }).then(response => response.json()).then(data => {
-                if(data && data.hasOwnProperty('count')){
-                    e.target.parentNode.children[1].innerHTML = data.count;
-                    e.target.parentNode.parentNode.children[2].children[0].children[0].innerHTML = data.cart_item_total_amount;
-                    updatePrice(data.total_amount);
-                }
-            }).catch(()=>{
-                showAlert('Сталась невідома помилка, будь ласка спробуйте пізніше', 'red');
+            const countElement = e.target.parentNode.children[1];
+            if(+countElement.innerHTML > 1) countElement.innerHTML = +countElement.innerHTML - 1;
+
+            queueCartOperation({
+                operation: 'DECREASE_COUNT',
+                cart_item_id: +e.target.parentNode.getAttribute('data-menu-id')
             });
         })
     })
@@ -52,23 +119,12 @@ document.addEventListener('DOMContentLoaded',()=>{
 
     plusButtons.forEach((el)=>{
         el.addEventListener('click',(e)=>{
-            fetch(`/api/v1/order/increase-count/`,{
-                method: 'POST',
-                body: JSON.stringify({
-                    cart_item_id: +e.target.parentNode.getAttribute('data-menu-id')
-                }),
-                headers: {
-                    'Content-Type': 'application/json',
-                    'X-CSRFToken': csrftoken
-                }
-            }).then(response => response.json()).then(data => {
-                if(data){
-                    e.target.parentNode.children[1].innerHTML = data.count;
-                    e.target.parentNode.parentNode.children[2].children[0].children[0].innerHTML = data.cart_item_total_amount;
-                    updatePrice(data.total_amount);
-                }
-            }).catch(()=>{
-                showAlert('Сталась невідома помилка, будь ласка спробуйте пізніше', 'red');
+            const countElement = e.target.parentNode.children[1];
+            countElement.innerHTML = +countElement.innerHTML + 1;
+
+            queueCartOperation({
+                operation: 'INCREASE_COUNT',
+                cart_item_id: +e.target.parentNode.getAttribute('data-menu-id')
             });
         })
     })
@@ -77,52 +133,20 @@ document.addEventListener('DOMContentLoaded',()=>{
 
     itemDeleteButtons.forEach((el)=>{
         el.addEventListener('click',(e) => {
-
-            fetch(`/api/v1/order/remove-cart-item/`,{
-                method: 'POST',
-                body: JSON.stringify({
-                    cart_item_id: +e.target.getAttribute('data-item-id')
-                }),
-                headers: {
-                    'Content-Type': 'application/json',
-                    'X-CSRFToken': csrftoken
-                }
-            }).then(response => response.json()).then(data => {
-                if(data && data.hasOwnProperty('total_amount')){
-                    e.target.parentNode.parentNode.parentNode.remove();
-                    updatePrice(data.total_amount);
-                    if(document.querySelectorAll('.table-item').length === 0) window.location.href = "/";
-                }
-            }).catch(()=>{
-                showAlert('Сталась невідома помилка, будь ласка спробуйте пізніше', 'red');
-            });
-
+            queueCartOperation({
+                operation: 'REMOVE_CART_ITEM',
+                cart_item_id: +e.target.getAttribute('data-item-id')
+            }, null, 0);
         })
     })
 
     additionDeleteButtons.forEach((el)=>{
         el.addEventListener('click',(e)=>{
-
-            fetch(`/api/v1/order/remove-cart-item-addition/`,{
-                method: 'POST',
-                body: JSON.stringify({
-                    cart_item_id: +e.target.getAttribute('data-menu-id'),
-                    addition_id: +e.target.getAttribute('data-addition-id')
-                }),
-                headers: {
-                    'Content-Type': 'application/json',
-                    'X-CSRFToken': csrftoken
-                }
-            }).then(response => response.json()).then(data => {
-                if(data && data.hasOwnProperty('total_amount')){
-                    e.target.parentNode.parentNode.parentNode.parentNode.getElementsByClassName('price-box')[0].children[0].innerHTML = data.cart_item_total_amount;
-                    e.target.parentNode.remove();
-                    updatePrice(data.total_amount);
-                }
-            }).catch(()=>{
-                showAlert('Сталась невідома помилка, будь ласка спробуйте пізніше', 'red');
-            });
-
+            queueCartOperation({
+                operation: 'REMOVE_ADDITION',
+                cart_item_id: +e.target.getAttribute('data-menu-id'),
+                addition_id: +e.target.getAttribute('data-addition-id')
+            }, () => e.target.parentNode.remove(), 0);
         })
     })
 
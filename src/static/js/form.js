@@ -82,6 +82,8 @@ document.addEventListener('DOMContentLoaded',()=>{
 
 
 
+    let pendingOrderRequest = null;
+
     checkoutButton.addEventListener('click',(e) => {
         showLoading();
         //Start
@@ -183,14 +185,25 @@ document.addEventListener('DOMContentLoaded',()=>{
                 customer_comment: description
             }
 
+        const body = JSON.stringify(fetchData);
+
+        // a resubmit of the same order after a network failure reuses the key, so it is not created twice
+        if(!pendingOrderRequest || pendingOrderRequest.body !== body){
+            pendingOrderRequest = {key: generateIdempotencyKey(), body};
+        }
+
         fetch(`/api/v1/order/create/`,{
             method: 'POST',
-            body: JSON.stringify(fetchData),
+            body: body,
             headers: {
                 'Content-Type': 'application/json',
-                'X-CSRFToken': csrftoken
+                'X-CSRFToken': csrftoken,
+                'Idempotency-Key': pendingOrderRequest.key
             }
-        }).then(response => response.json()).then(data => {
+        }).then(response => {
+            if(response.status !== 409) pendingOrderRequest = null;
+            return response.json();
+        }).then(data => {
             closeLoading();
             if(data.phone_number) {
                 showAlert('Введіть коректний номер телефону в форматі +38(097)123-45-67','red');
@@ -20,6 +20,17 @@ document.addEventListener('DOMContentLoaded',()=>{
         })
     }
 
+    const menuItemsInCart = document.getElementById('menu-items-in-cart');
+    const itemInCartIcon = document.getElementById('item-in-cart-icon');
+
+    if (menuItemsInCart) {
+        JSON.parse(menuItemsInCart.textContent).forEach((menuItemId) => {
+            document.querySelectorAll(`.category-card-item[data-menu-item-id="${menuItemId}"] .price-section`).forEach((el) => {
+                el.insertAdjacentHTML('beforeend', itemInCartIcon.innerHTML);
+            })
+        })
+    }
+
     menuItems.forEach((el) => {
         if (el.href == location.href) {
             el.className += ' menu-item-active';
@@ -51,14 +62,15 @@ document.addEventListener('DOMContentLoaded',()=>{
             }),
             headers: {
                 'Content-Type': 'application/json',
-                'X-CSRFToken': csrftoken
+                'X-CSRFToken': csrftoken,
+                'Idempotency-Key': generateIdempotencyKey()
             }
         }).then(response => response.json()).then(data => {
             if (data && data.total_amount) {
                 document.querySelector('.header-cart-button').classList.remove('d-none');
                 document.querySelector('.header-cart-price').innerHTML = data.total_amount + ' грн';
                 showAlert('Товар успішно додано до корзини', 'green');
-                currentItem.querySelector('.price-section').insertAdjacentHTML('beforeend', `<img class="item-in-cart-icon" src="/static/img/bag1.png">`);
+                currentItem.querySelector('.price-section').insertAdjacentHTML('beforeend', itemInCartIcon.innerHTML);
             }
             closeModalWindow();
         });
@@ -97,11 +109,29 @@ document.addEventListener('DOMContentLoaded',()=>{
         });
     })
 
+    let menuItemsAdditions;
+
+    const getMenuItemsAdditions = () => {
+        if (!menuItemsAdditions) {
+            menuItemsAdditions = fetch(`/api/v1/menu/menu-items/additions/`).then(response => {
+                if (!response.ok) throw new Error(`Unexpected response status ${response.status}`);
+                return response.json();
+            }).catch((error) => {
+                // a failed request is not memoized, so the next click retries it
+                menuItemsAdditions = null;
+                throw error;
+            });
+        }
+        return menuItemsAdditions;
+    }
+
     const openModalWindow = (e) => {
         const button = e.target.classList[0] === 'add-to-card-button' ? e.target : e.target.parentNode;
         const id = button.getAttribute('menu_id');
 
-        fetch(`/api/v1/menu/menu-items/${id}/additions/`).then(response => response.json()).then(additions => {
+        getMenuItemsAdditions().then(menuItemsAdditions => {
+            const additions = menuItemsAdditions[id] || [];
+
             if (additions.length > 0) {
                 document.querySelector('.modal-additions').classList.remove('d-none');
                 document.querySelector('.additions-box').innerHTML = '';
@@ -116,8 +146,10 @@ document.addEventListener('DOMContentLoaded',()=>{
                     );
                 })
             }
+        }).catch(() => {
+            showAlert('Сталась невідома помилка, будь ласка спробуйте пізніше', 'red');
         });
-        document.querySelector('.modal-main-img').src = button.parentNode.parentNode.parentNode.children[0].src;
+        document.querySelector('.modal-main-img').src = button.parentNode.parentNode.parentNode.querySelector('picture img').currentSrc;
 
         document.querySelector('.modal-volume').innerHTML = button.parentNode.getElementsByClassName('card-volume')[0].innerHTML;
         document.querySelector('.modal-price').innerHTML = button.parentNode.getElementsByClassName('card-price')[0].innerHTML + " грн";
@@ -1,8 +1,8 @@
 document.addEventListener('DOMContentLoaded',()=>{
 
     function zoomImage(e) {
-        const pathname = e.target.nextElementSibling.value;
-        document.body.insertAdjacentHTML('beforeend',`<div class="zoom"><img src=${pathname}><i class="far fa-times-circle closebtn"></i></img> </div>`)
+        const picture = e.currentTarget.nextElementSibling.innerHTML;
+        document.body.insertAdjacentHTML('beforeend',`<div class="zoom">${picture}<i class="far fa-times-circle closebtn"></i> </div>`)
         document.querySelector('.zoom').addEventListener('click', removeZoom);
     }
 